@@ -0,0 +1,67 @@
+"""
+Memory footprint of the import ID mappings per million rows.
+
+Fills a dict[int, uuid.UUID] (the old ID_MAPPINGS layout) and a UUIDMapping
+with dense row number -> uuid4 entries, as the importer does, measuring the
+Python heap left behind with tracemalloc (the dict keeps every int and UUID
+object alive, the UUIDMapping only its buffer), and times a pass of FK lookups over each. A second
+UUIDMapping with a tiny spill threshold shows the memory-mapped variant,
+whose buffer lives in a temporary file instead of the heap. No database is
+needed.
+
+    python -m benchmarks.id_mapping_memory --rows 1000000
+"""
+import time
+import tracemalloc
+import uuid
+
+import typer
+
+from commands.init_database.id_mapping import UUIDMapping
+
+
+def _fill(mapping, rows: int) -> float:
+    start = time.perf_counter()
+    for key in range(1, rows + 1):
+        mapping[key] = uuid.uuid4()
+    return time.perf_counter() - start
+
+
+def _lookups(mapping, rows: int) -> float:
+    start = time.perf_counter()
+    for key in range(1, rows + 1):
+        mapping[key]
+    return time.perf_counter() - start
+
+
+def _measure(factory, rows: int) -> tuple:
+    tracemalloc.start()
+    mapping = factory()
+    fill = _fill(mapping, rows)
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return mapping, heap, fill
+
+
+def main(
+    rows: int = typer.Option(1_000_000, help="Entries per mapping"),
+):
+    per_million = 1_000_000 / rows
+
+    typer.echo(f"{rows} rows (MB per million rows, seconds)")
+    for name, factory in (
+        ("dict", dict),
+        ("bytearray", lambda: UUIDMapping(spill_bytes=None)),
+        ("mmap spill", lambda: UUIDMapping(spill_bytes=1024 * 1024)),
+    ):
+        mapping, heap, fill = _measure(factory, rows)
+        lookups = _lookups(mapping, rows)
+        line = f"  {name:<11} heap {heap * per_million / 2**20:8.1f}"
+        if isinstance(mapping, UUIDMapping):
+            line += f"   buffer {mapping.nbytes() * per_million / 2**20:6.1f}{' (file)' if mapping.spilled else ''}"
+            mapping.close()
+        typer.echo(f"{line}   fill {fill:5.2f}s   lookups {lookups:5.2f}s")
+
+
+if __name__ == "__main__":
+    typer.run(main)
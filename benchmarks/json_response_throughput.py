@@ -0,0 +1,87 @@
+"""
+Throughput of large list endpoints with and without pre-serialized responses.
+
+Mounts two BaseAPI routers over the same in-memory service, which returns
+`--rows` RatingDTOs per page: one with the default response path (FastAPI
+re-validates and re-serializes the DTOs through response_model) and one
+opted in with json_model (DTOs dumped straight to bytes). Each is hit
+`--requests` times through the ASGI app and the requests/second compared,
+after checking both return identical bodies. No database is needed.
+
+    python -m benchmarks.json_response_throughput --rows 1000 --requests 200
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+import httpx
+import typer
+from fastapi import FastAPI
+
+from src.api.library.base_api import BaseAPI
+from src.dto.rating_dto import RatingDTO
+from src.utils.dto_utils import construct_dtos
+
+
+class InMemoryRatingService:
+    """Serves a fixed page of DTOs, built the way BaseService.list builds them"""
+
+    def __init__(self, rows: int):
+        now = datetime.now()
+        self.items: List[RatingDTO] = construct_dtos(RatingDTO, [
+            SimpleNamespace(_mapping={
+                "id": uuid.uuid4(), "rating": 4, "review_date": now, "comment": "Worth a reread",
+                "is_approved": True, "user_id": uuid.uuid4(), "book_id": uuid.uuid4(),
+                "created_at": now, "updated_at": now,
+            })
+            for _ in range(rows)
+        ])
+
+    async def list(self, db, skip: int, limit: int) -> List[RatingDTO]:
+        return self.items
+
+
+def _app(rows: int) -> FastAPI:
+    service = InMemoryRatingService(rows)
+    app = FastAPI()
+    for prefix, json_model in (("/validated", None), ("/preserialized", RatingDTO)):
+        api = BaseAPI[RatingDTO, RatingDTO, RatingDTO, InMemoryRatingService](
+            prefix=prefix, service_provider=lambda: service, json_model=json_model
+        )
+        api.register_crud_routes()
+        app.include_router(api.router)
+    return app
+
+
+async def _run(rows: int, requests: int) -> dict:
+    transport = httpx.ASGITransport(app=_app(rows))
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = [(await client.get(f"{prefix}/", params={"limit": 1000})).json()
+                  for prefix in ("/validated", "/preserialized")]
+        if bodies[0] != bodies[1]:
+            raise typer.BadParameter("response bodies differ between the two paths")
+        for prefix in ("/validated", "/preserialized"):
+            start = time.perf_counter()
+            for _ in range(requests):
+                await client.get(f"{prefix}/", params={"limit": 1000})
+            results[prefix] = requests / (time.perf_counter() - start)
+    return results
+
+
+def main(
+    rows: int = typer.Option(1000, help="DTOs per response"),
+    requests: int = typer.Option(200, help="Requests per path"),
+):
+    results = asyncio.run(_run(rows, requests))
+    typer.echo(f"GET list, {rows} rows per response")
+    for prefix, rps in results.items():
+        typer.echo(f"  {prefix:<15} {rps:8.1f} req/s")
+    typer.echo(f"  speedup         x{results['/preserialized'] / results['/validated']:.2f}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
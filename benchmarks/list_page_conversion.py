@@ -0,0 +1,114 @@
+"""
+Cost of turning a 1000-row /ratings/ or /books/ list page into DTOs.
+
+"before" is the old per-row pipeline: from_orm / __dict__ copy in the
+repository, then model_validate again in the service. "after" is the Core
+row path: model_construct over rows of just the DTO's columns. The offline
+run uses in-memory stand-ins for ORM objects and rows, so it isolates the
+conversion cost (the ORM path additionally pays for identity-map bookkeeping,
+which it does not count). No database is needed.
+
+With --live the two list endpoints are also timed end to end through the app
+against Postgres (docker compose up db, with data imported).
+
+    python -m benchmarks.list_page_conversion --rows 1000 --rounds 20
+    python -m benchmarks.list_page_conversion --live
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import typer
+
+from src.dto.book_dto import BookDTO
+from src.dto.rating_dto import RatingDTO
+from src.models import RatingModel
+from src.repository.book_repository import BookRepository
+from src.repository.rating_repository import RatingRepository
+from src.service.book_service import BookService
+from src.service.rating_service import RatingService
+from src.utils.dto_utils import construct_dtos, dto_projection
+
+
+def _rating(now: datetime) -> dict:
+    return {
+        "id": uuid.uuid4(), "rating": 4, "review_date": now, "comment": "Worth a reread",
+        "is_approved": True, "user_id": uuid.uuid4(), "book_id": uuid.uuid4(),
+        "created_at": now, "updated_at": now,
+    }
+
+
+def _book(now: datetime) -> dict:
+    return {
+        "id": uuid.uuid4(), "isbn": "9780000000000", "title": "A Title", "published_year": 2001,
+        "language": "en", "edition": "1st", "description": "About something", "cover_image_url": None,
+        "publisher_id": uuid.uuid4(), "created_at": now, "updated_at": now,
+    }
+
+
+def _time(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def _offline(rows: int, rounds: int) -> dict:
+    now = datetime.now()
+    ratings = [_rating(now) for _ in range(rows)]
+    books = [_book(now) for _ in range(rows)]
+    rating_objs = [SimpleNamespace(**data) for data in ratings]
+    rating_rows = [SimpleNamespace(_mapping=data) for data in ratings]
+    book_objs = [SimpleNamespace(**data) for data in books]
+
+    rating_repo, rating_service = RatingRepository(), RatingService()
+    book_repo, book_service = BookRepository(), BookService()
+    _, converters = dto_projection(RatingModel, RatingDTO)
+    fields_set = set(BookDTO.model_fields)
+
+    return {
+        "/ratings/": (
+            _time(lambda: rating_service._to_dto_list([rating_repo._model_to_dto(o) for o in rating_objs]), rounds),
+            _time(lambda: construct_dtos(RatingDTO, rating_rows, converters), rounds),
+        ),
+        "/books/": (
+            _time(lambda: [book_service._book_to_dto(book_repo._model_to_dto(o)) for o in book_objs], rounds),
+            _time(lambda: [BookDTO.model_construct(fields_set, **data, authors=[]) for data in books], rounds),
+        ),
+    }
+
+
+async def _live(rounds: int, limit: int) -> dict:
+    from main import app
+
+    timings = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("/ratings/", "/books/"):
+            await client.get(path, params={"limit": limit})
+            start = time.perf_counter()
+            for _ in range(rounds):
+                response = await client.get(path, params={"limit": limit})
+            timings[path] = ((time.perf_counter() - start) / rounds * 1000, response.status_code)
+    return timings
+
+
+def main(
+    rows: int = typer.Option(1000, help="Rows per page"),
+    rounds: int = typer.Option(20, help="Pages converted per measurement"),
+    live: bool = typer.Option(False, help="Also time the endpoints against Postgres"),
+):
+    typer.echo(f"conversion of a {rows}-row page (ms/page)")
+    for path, (before, after) in _offline(rows, rounds).items():
+        typer.echo(f"  {path:<10} before {before:8.2f}   after {after:8.2f}   x{before / after:5.1f}")
+    if live:
+        typer.echo(f"end to end, limit={rows} (ms/request)")
+        for path, (millis, status) in asyncio.run(_live(rounds, rows)).items():
+            typer.echo(f"  {path:<10} {millis:8.2f}   HTTP {status}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
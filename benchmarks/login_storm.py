@@ -0,0 +1,81 @@
+"""
+p99 latency of a cheap endpoint while a burst of password checks is running.
+
+Builds a small app with a /ping route and two login-like routes that verify
+a bcrypt hash: one inline on the event loop (the old behaviour) and one on
+the bounded bcrypt worker pool. For each mode it fires a storm of login
+requests and concurrently measures /ping latency. No database is needed.
+
+    python -m benchmarks.login_storm --logins 200 --pings 500
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+import typer
+from fastapi import FastAPI
+
+from src.utils.security_utils import (
+    get_password_hash, password_hasher, verify_password, verify_password_async
+)
+
+PASSWORD = "correct horse battery staple"
+HASH = get_password_hash(PASSWORD)
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/ping")
+async def ping():
+    return {"ok": True}
+
+
+@bench_app.post("/login/inline")
+async def login_inline():
+    return {"ok": verify_password(PASSWORD, HASH)}
+
+
+@bench_app.post("/login/pooled")
+async def login_pooled():
+    return {"ok": await verify_password_async(PASSWORD, HASH)}
+
+
+async def _pings(client: httpx.AsyncClient, count: int, latencies: list) -> None:
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.get("/ping")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.001)
+
+
+async def _storm(mode: str, logins: int, pings: int) -> dict:
+    transport = httpx.ASGITransport(app=bench_app)
+    latencies: list = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            _pings(client, pings, latencies),
+            *(client.post(f"/login/{mode}") for _ in range(logins)),
+        )
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2),
+        "logins_per_s": round(logins / elapsed, 1),
+    }
+
+
+def main(logins: int = 200, pings: int = 500):
+    for mode in ("inline", "pooled"):
+        result = asyncio.run(_storm(mode, logins, pings))
+        typer.echo(
+            f"{mode:>6}: /ping p50={result['p50_ms']}ms p99={result['p99_ms']}ms, "
+            f"{result['logins_per_s']} logins/s"
+        )
+    typer.echo(f"hasher metrics: {password_hasher.metrics()}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,86 @@
+"""
+Per-call Python overhead of BaseRepository.get, before and after the statement registry.
+
+"before" rebuilds select(model).where(model.id == id) plus its eager-load
+options on every call, as the repositories used to; "after" fetches the
+prebuilt statement from the registry and passes the id as a bindparam.
+Both sides then generate the SQL cache key, which SQLAlchemy does on every
+execute to find the compiled statement, so the offline numbers are the
+statement overhead paid before any I/O. No database is needed for them.
+
+With --live each variant is also executed against Postgres (docker compose
+up db) through a real session; the looked-up id need not exist.
+
+    python -m benchmarks.repository_get_overhead --calls 20000
+    python -m benchmarks.repository_get_overhead --calls 2000 --live
+"""
+import asyncio
+import time
+import uuid
+
+import typer
+from sqlalchemy.future import select
+
+from src.models import MODEL_REGISTRY
+from src.repository.base_repository import BaseRepository
+from src.utils.db_utils import session_factory
+
+
+def _rebuild(repo: BaseRepository, obj_id: uuid.UUID):
+    query = select(repo.model).filter(repo.model.id == obj_id)
+    return repo._apply_eager_loads(query), None
+
+
+def _registry(repo: BaseRepository, obj_id: uuid.UUID):
+    return repo._get_by_id_statement(), {"id": obj_id}
+
+
+VARIANTS = {"before": _rebuild, "after": _registry}
+
+
+def _offline(repo: BaseRepository, calls: int) -> dict:
+    timings = {}
+    for name, variant in VARIANTS.items():
+        start = time.perf_counter()
+        for _ in range(calls):
+            stmt, _params = variant(repo, uuid.uuid4())
+            stmt._generate_cache_key()
+        timings[name] = (time.perf_counter() - start) / calls * 1e6
+    return timings
+
+
+async def _live(repo: BaseRepository, calls: int) -> dict:
+    timings = {}
+    async with session_factory() as session:
+        for name, variant in VARIANTS.items():
+            # Warm the compiled cache and the connection before timing
+            stmt, params = variant(repo, uuid.uuid4())
+            await session.execute(stmt, params)
+            start = time.perf_counter()
+            for _ in range(calls):
+                stmt, params = variant(repo, uuid.uuid4())
+                (await session.execute(stmt, params)).scalars().first()
+            timings[name] = (time.perf_counter() - start) / calls * 1e6
+    return timings
+
+
+def _report(title: str, timings: dict) -> None:
+    typer.echo(title)
+    for name, micros in timings.items():
+        typer.echo(f"  {name:<7} {micros:8.1f} us/call")
+    typer.echo(f"  saved   {timings['before'] - timings['after']:8.1f} us/call")
+
+
+def main(
+    calls: int = typer.Option(20000, help="Lookups per variant"),
+    model: str = typer.Option("author", help=f"Model to look up: {', '.join(MODEL_REGISTRY)}"),
+    live: bool = typer.Option(False, help="Also execute the lookups against Postgres"),
+):
+    repo = BaseRepository(MODEL_REGISTRY[model])
+    _report(f"statement overhead ({model}, {calls} calls)", _offline(repo, calls))
+    if live:
+        _report(f"round trip ({model}, {calls} calls)", asyncio.run(_live(repo, calls)))
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,68 @@
+"""
+Pool pressure of requests that never query the database.
+
+Sends health-check and validation-failure requests through the app twice:
+once with the real (lazy) session dependencies and once with dependencies
+that eagerly check out a connection, and reports the pool checkouts each
+run caused, as counted by the pool instrumentation.
+
+The lazy run needs no database; the eager run needs Postgres running
+(docker compose up db).
+
+    python -m benchmarks.session_pool_pressure --requests 1000
+"""
+import asyncio
+import time
+
+import httpx
+import typer
+
+from main import app
+from src.utils.db_utils import (
+    create_database_session, create_read_database_session, engine, get_pool_stats, session_factory
+)
+
+REQUESTS = [
+    ("GET", "/", None),                        # health check
+    ("POST", "/ratings/", {}),                 # body validation failure
+    ("GET", "/ratings/not-a-uuid", None),      # malformed id
+]
+
+
+async def _eager_session():
+    async with session_factory() as session:
+        await session.connection()
+        yield session
+
+
+async def _run(requests: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    before = get_pool_stats(engine)["checkouts"]
+    start = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(requests):
+            method, url, body = REQUESTS[i % len(REQUESTS)]
+            await client.request(method, url, json=body)
+    elapsed = time.perf_counter() - start
+    return {
+        "checkouts": get_pool_stats(engine)["checkouts"] - before,
+        "req_per_s": round(requests / elapsed, 1),
+    }
+
+
+def main(requests: int = 1000, eager: bool = typer.Option(True, help="Also run the eager baseline")):
+    lazy = asyncio.run(_run(requests))
+    typer.echo(f"lazy sessions : {lazy['checkouts']} pool checkouts, {lazy['req_per_s']} req/s")
+
+    if eager:
+        app.dependency_overrides[create_database_session] = _eager_session
+        app.dependency_overrides[create_read_database_session] = _eager_session
+        try:
+            result = asyncio.run(_run(requests))
+        finally:
+            app.dependency_overrides.clear()
+        typer.echo(f"eager sessions: {result['checkouts']} pool checkouts, {result['req_per_s']} req/s")
+
+
+if __name__ == "__main__":
+    typer.run(main)
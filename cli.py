@@ -5,7 +5,12 @@ import uuid
 from typer import Typer
 import typer
 
+from commands.init_database.checkpoint import ImportCheckpoint
+from commands.init_database.copy_loader import copy_import_all_data
 from commands.init_database.main import import_all_data, init_database
+from commands.init_database.password_pool import PasswordHashPool
+from commands.rating_summary.main import rebuild_rating_summary
+from settings import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
 
 # Define import order and file mappings
 IMPORT_ORDER: List[Tuple[str, str]] = [
@@ -56,12 +61,23 @@ def cmd_import_all(
     data_dir: str = "test_data",
     batch_size: int = 1000,
     skip_duplicates: bool = True,
-    confirm: bool = typer.Option(True, help="Ask for confirmation before importing")
+    confirm: bool = typer.Option(True, help="Ask for confirmation before importing"),
+    copy: bool = typer.Option(True, help="Load tables with COPY, in parallel where dependencies allow"),
+    workers: int = typer.Option(4, help="Tables loaded at the same time by the COPY loader"),
+    copy_batch_size: int = typer.Option(50000, help="Rows per COPY batch"),
+    hash_workers: int = typer.Option(PASSWORD_HASH_WORKERS, help="Processes hashing imported passwords"),
+    bcrypt_rounds: int = typer.Option(BCRYPT_ROUNDS, help="bcrypt cost factor for imported passwords"),
+    resume: bool = typer.Option(False, help="Continue an interrupted import from its last committed batch"),
+    checkpoint_file: str = typer.Option(None, help="SQLite checkpoint file (default: <data_dir>/.import_checkpoint.sqlite)"),
 ):
     """
     Import all CSV files in the correct order with dependencies.
     """
     data_path = Path(data_dir)
+
+    if resume and not copy:
+        typer.echo("--resume requires the COPY loader", err=True)
+        raise typer.Abort()
     
     if confirm:
         typer.echo("This will import data from the following files:")
@@ -93,13 +109,34 @@ def cmd_import_all(
         raise typer.Abort()
     
     # Run the import
-    results = import_all_data(
-        csv_files=files_to_import,
-        batch_size=batch_size,
-        default_values=DEFAULT_VALUES,
-        skip_duplicates=skip_duplicates,
-        association_tables=ASSOCIATION_TABLES
-    )
+    with PasswordHashPool(processes=hash_workers, rounds=bcrypt_rounds) as password_hasher:
+        if copy:
+            # Checkpoints are always written, so a failed run can be resumed
+            with ImportCheckpoint(checkpoint_file or str(data_path / ".import_checkpoint.sqlite")) as checkpoint:
+                if resume:
+                    typer.echo("Resuming from the last checkpoint")
+                else:
+                    checkpoint.reset()
+                results = copy_import_all_data(
+                    csv_files=files_to_import,
+                    batch_size=copy_batch_size,
+                    default_values=DEFAULT_VALUES,
+                    skip_duplicates=skip_duplicates,
+                    association_tables=ASSOCIATION_TABLES,
+                    workers=workers,
+                    association_batch_size=batch_size,
+                    password_hasher=password_hasher,
+                    checkpoint=checkpoint
+                )
+        else:
+            results = import_all_data(
+                csv_files=files_to_import,
+                batch_size=batch_size,
+                default_values=DEFAULT_VALUES,
+                skip_duplicates=skip_duplicates,
+                association_tables=ASSOCIATION_TABLES,
+                password_hasher=password_hasher
+            )
     
     # Display results
     typer.echo("\nImport results:")
@@ -112,6 +149,24 @@ def cmd_import_all(
     total_imported = sum(c for c in results.values() if isinstance(c, int))
     typer.echo(f"\nTotal records imported: {total_imported}")
 
+    hashing = password_hasher.metrics()
+    if hashing["hashed"]:
+        typer.echo(
+            f"Hashed {hashing['hashed']} passwords in {hashing['seconds']}s "
+            f"({hashing['hashes_per_second']}/s on {hashing['processes']} processes, cost {hashing['rounds']})"
+        )
+
+    # Imported ratings bypass the repository, so recompute their summaries
+    if isinstance(results.get('rating'), int):
+        summaries = rebuild_rating_summary()
+        typer.echo(f"Rebuilt rating summaries for {summaries} books")
+
+@app.command("rebuild_rating_summary")
+def cmd_rebuild_rating_summary():
+    """Recompute book_rating_summary from the approved ratings"""
+    summaries = rebuild_rating_summary()
+    typer.echo(f"Rebuilt rating summaries for {summaries} books")
+
 @app.command("run_test")
 def cmd_run_test():
     print("Running tests")
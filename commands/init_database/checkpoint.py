@@ -0,0 +1,196 @@
+import csv
+import sqlite3
+import threading
+import uuid
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from commands.init_database.id_mapping import UUIDMapping
+
+
+class TableProgress(NamedTuple):
+    """Committed position of one table's import"""
+    byte_offset: int
+    row_number: int
+    records: int
+    done: bool
+
+
+class CsvCursor:
+    """
+    CSV reader that can start at a byte offset and report the offset after the
+    last row it returned. The file is read in binary, one line at a time, so
+    tell() is exact and cheap; csv.reader never reads ahead of the row it yields.
+    """
+
+    def __init__(self, file_path: str, delimiter: str, byte_offset: int = 0):
+        self._file = open(file_path, 'rb')
+        self._reader = csv.reader(self._lines(), delimiter=delimiter)
+        self.header: Optional[List[str]] = next(self._reader, None)
+        if byte_offset:
+            self._file.seek(byte_offset)
+
+    def _lines(self) -> Iterator[str]:
+        for line in iter(self._file.readline, b""):
+            yield line.decode("utf-8")
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return self._reader
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "CsvCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ImportCheckpoint:
+    """
+    Import progress kept in a local SQLite file: per table, the byte offset and
+    row number of the last committed batch, and the CSV id -> UUID mappings
+    generated so far.
+
+    A batch of a regular table is written here as *pending* before its COPY
+    commits and promoted afterwards. On resume, a batch still pending is
+    promoted if its last UUID made it into Postgres and discarded otherwise,
+    so no batch is lost or loaded twice.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self._db:
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS progress (
+                    table_name TEXT PRIMARY KEY,
+                    file_path TEXT NOT NULL,
+                    byte_offset INTEGER NOT NULL DEFAULT 0,
+                    row_number INTEGER NOT NULL DEFAULT 0,
+                    records INTEGER NOT NULL DEFAULT 0,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    pending_offset INTEGER,
+                    pending_row INTEGER,
+                    pending_records INTEGER,
+                    pending_last_id BLOB
+                )"""
+            )
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS id_mapping (
+                    table_name TEXT NOT NULL,
+                    csv_id INTEGER NOT NULL,
+                    row_number INTEGER NOT NULL,
+                    id BLOB NOT NULL,
+                    PRIMARY KEY (table_name, csv_id)
+                ) WITHOUT ROWID"""
+            )
+
+    def reset(self) -> None:
+        """Forget all progress, for a fresh import"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM progress")
+            self._db.execute("DELETE FROM id_mapping")
+
+    def start(self, table_name: str, file_path: str) -> TableProgress:
+        """Register a table (if new) and return its committed progress"""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO progress (table_name, file_path) VALUES (?, ?)", (table_name, file_path)
+            )
+            row = self._db.execute(
+                "SELECT file_path, byte_offset, row_number, records, done FROM progress WHERE table_name = ?",
+                (table_name,),
+            ).fetchone()
+        if row[0] != file_path:
+            raise ValueError(f"Checkpoint for {table_name} was taken from {row[0]}, not {file_path}")
+        return TableProgress(row[1], row[2], row[3], bool(row[4]))
+
+    def mappings(self, table_name: str) -> UUIDMapping:
+        mapping = UUIDMapping()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT csv_id, id FROM id_mapping WHERE table_name = ? ORDER BY csv_id", (table_name,)
+            )
+            for csv_id, raw in rows:
+                mapping[csv_id] = uuid.UUID(bytes=raw)
+        return mapping
+
+    def pending_id(self, table_name: str) -> Optional[uuid.UUID]:
+        """Last UUID of the batch that was being copied when the import stopped"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT pending_last_id FROM progress WHERE table_name = ?", (table_name,)
+            ).fetchone()
+        return uuid.UUID(bytes=row[0]) if row and row[0] else None
+
+    def prepare(
+        self,
+        table_name: str,
+        keys: Sequence[Tuple[int, int, uuid.UUID]],
+        byte_offset: int,
+        row_number: int,
+    ) -> None:
+        """Record a batch's (csv_id, row_number, uuid) mappings before it is copied"""
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO id_mapping (table_name, csv_id, row_number, id) VALUES (?, ?, ?, ?)",
+                [(table_name, csv_id, row, pk.bytes) for csv_id, row, pk in keys],
+            )
+            self._db.execute(
+                """UPDATE progress SET pending_offset = ?, pending_row = ?, pending_records = ?, pending_last_id = ?
+                   WHERE table_name = ?""",
+                (byte_offset, row_number, len(keys), keys[-1][2].bytes, table_name),
+            )
+
+    def commit(self, table_name: str) -> None:
+        """Promote the pending batch once Postgres has committed it"""
+        with self._lock, self._db:
+            self._db.execute(
+                """UPDATE progress SET byte_offset = pending_offset, row_number = pending_row,
+                       records = records + pending_records, pending_offset = NULL, pending_row = NULL,
+                       pending_records = NULL, pending_last_id = NULL
+                   WHERE table_name = ? AND pending_offset IS NOT NULL""",
+                (table_name,),
+            )
+
+    def discard(self, table_name: str) -> None:
+        """Drop the pending batch, which never reached Postgres"""
+        with self._lock, self._db:
+            self._db.execute(
+                """DELETE FROM id_mapping WHERE table_name = ?
+                   AND row_number > (SELECT row_number FROM progress WHERE table_name = ?)""",
+                (table_name, table_name),
+            )
+            self._db.execute(
+                """UPDATE progress SET pending_offset = NULL, pending_row = NULL,
+                       pending_records = NULL, pending_last_id = NULL
+                   WHERE table_name = ?""",
+                (table_name,),
+            )
+
+    def advance(self, table_name: str, byte_offset: int, row_number: int, records: int) -> None:
+        """Move past a committed batch that created no mappings (association tables)"""
+        with self._lock, self._db:
+            self._db.execute(
+                """UPDATE progress SET byte_offset = ?, row_number = ?, records = records + ?
+                   WHERE table_name = ?""",
+                (byte_offset, row_number, records, table_name),
+            )
+
+    def finish(self, table_name: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("UPDATE progress SET done = 1 WHERE table_name = ?", (table_name,))
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ImportCheckpoint":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,389 @@
+import logging
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from psycopg import sql
+from sqlalchemy import Boolean, Enum, Table, create_engine, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from commands.init_database.checkpoint import CsvCursor, ImportCheckpoint, TableProgress
+from commands.init_database.id_mapping import UUIDMapping
+from commands.init_database.main import (
+    ID_MAPPINGS, _default_password_hash, _hash_password, _import_association_table
+)
+from commands.init_database.password_pool import PasswordHashPool, PendingHashes
+from src.utils.db_utils import Base, get_database_url
+
+logger = logging.getLogger(__name__)
+
+Converter = Callable[[str], Any]
+
+
+class _Counter:
+    """Per-table count of values that could not be converted, logged once at the end."""
+
+    def __init__(self):
+        self.invalid_fk = 0
+        self.invalid_enum = 0
+
+
+def _boolean(val: str) -> Optional[bool]:
+    lowered = val.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    return None
+
+
+def _enum_converter(enum_class, counter: _Counter) -> Converter:
+    # SQLAlchemy's Enum type stores member names, so COPY must send names too
+    names = {member.value: member.name for member in enum_class}
+
+    def convert(val: str) -> Optional[str]:
+        try:
+            return names[val]
+        except KeyError:
+            counter.invalid_enum += 1
+            return None
+    return convert
+
+
+def _fk_converter(mapping: Optional[UUIDMapping], counter: _Counter) -> Converter:
+    """Remap a CSV id through `mapping`; with no mapping (table not in this run) every value is an invalid FK"""
+    if mapping is None:
+        def convert(val: str) -> None:
+            counter.invalid_fk += 1
+            return None
+        return convert
+
+    def convert(val: str) -> Optional[uuid.UUID]:
+        try:
+            return mapping[int(val)]
+        except (ValueError, KeyError):
+            counter.invalid_fk += 1
+            return None
+    return convert
+
+
+def _column_converter(column, counter: _Counter, hash_inline: bool) -> Optional[Converter]:
+    """Converter for one CSV cell, or None when the text can be sent to COPY as is"""
+    if column.name == "password_hash":
+        return _hash_password if hash_inline else None
+    if column.foreign_keys:
+        ref_table = next(iter(column.foreign_keys)).column.table.name
+        return _fk_converter(ID_MAPPINGS.get(ref_table), counter)
+    if isinstance(column.type, Boolean):
+        return _boolean
+    if isinstance(column.type, Enum) and column.type.enum_class is not None:
+        return _enum_converter(column.type.enum_class, counter)
+    return None
+
+
+def _column_default(column) -> Optional[Callable[[], Any]]:
+    """Python-side default of a column the CSV does not provide (server defaults apply on their own)"""
+    default = column.default
+    if default is None:
+        return None
+    if default.is_scalar:
+        return lambda: default.arg
+    if default.is_callable:
+        return lambda: default.arg(None)
+    return None
+
+
+def _compile_row_builder(
+    table: Table,
+    header: Sequence[str],
+    table_defaults: Dict[str, Any],
+    counter: _Counter,
+    hash_inline: bool = True,
+) -> Tuple[List[str], Callable[[List[str], uuid.UUID], tuple]]:
+    """
+    Work out once per table which CSV cells go to which columns and how each is
+    converted, and return the COPY column list plus a function that turns a CSV
+    row into the matching tuple. With hash_inline=False passwords are left raw
+    (None when empty) for a PasswordHashPool to hash per batch.
+    """
+    pk_column = table.primary_key.columns.values()[0].name
+    cells: List[Tuple[int, Optional[Converter], Optional[Callable[[], str]]]] = []
+    columns = [pk_column]
+    for index, name in enumerate(header):
+        if name == pk_column or name not in table.c:
+            continue
+        column = table.c[name]
+        # An empty password still gets a (random) hash rather than NULL
+        empty_default = _default_password_hash if name == "password_hash" and hash_inline else None
+        cells.append((index, _column_converter(column, counter, hash_inline), empty_default))
+        columns.append(name)
+
+    defaults: List[Callable[[], Any]] = []
+    for column in table.columns:
+        if column.name in columns:
+            continue
+        if column.name in table_defaults:
+            value = table_defaults[column.name]
+            defaults.append(value if callable(value) else (lambda value=value: value))
+            columns.append(column.name)
+            continue
+        default = _column_default(column)
+        if default is not None:
+            defaults.append(default)
+            columns.append(column.name)
+
+    def build(row: List[str], pk: uuid.UUID) -> tuple:
+        values: List[Any] = [pk]
+        for index, convert, empty_default in cells:
+            val = row[index].strip() if index < len(row) else ""
+            if val == "":
+                values.append(empty_default() if empty_default else None)
+            elif convert is None:
+                values.append(val)
+            else:
+                values.append(convert(val))
+        for default in defaults:
+            values.append(default())
+        return tuple(values)
+
+    return columns, build
+
+
+def _copy_batch(engine: Engine, statement: sql.Composed, rows: List[tuple]) -> None:
+    """Send one batch through COPY FROM STDIN and commit it"""
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            with cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+def _with_hashes(rows: List[tuple], hashes: PendingHashes, index: int) -> List[tuple]:
+    """Put the hashed passwords of a batch in place of the raw ones"""
+    return [row[:index] + (hashed,) + row[index + 1:] for row, hashed in zip(rows, hashes.result())]
+
+
+class _Batch(NamedTuple):
+    rows: List[tuple]
+    # (csv id, row number, uuid) of each row, for the checkpoint
+    keys: List[Tuple[int, int, uuid.UUID]]
+    # Position just past the batch's last row
+    byte_offset: int
+    row_number: int
+
+
+def _recover_pending(engine: Engine, checkpoint: ImportCheckpoint, table: Table) -> None:
+    """Settle a batch left pending by an interrupted run, by looking for its last row in Postgres"""
+    pending_id = checkpoint.pending_id(table.name)
+    if pending_id is None:
+        return
+    pk = table.primary_key.columns.values()[0]
+    with engine.connect() as connection:
+        committed = connection.execute(select(pk).where(pk == pending_id)).first() is not None
+    if committed:
+        checkpoint.commit(table.name)
+    else:
+        checkpoint.discard(table.name)
+
+
+def _copy_regular_table(
+    engine: Engine,
+    table_name: str,
+    file_path: str,
+    delimiter: str,
+    batch_size: int,
+    table_defaults: Dict[str, Any],
+    password_hasher: Optional[PasswordHashPool] = None,
+    checkpoint: Optional[ImportCheckpoint] = None,
+) -> int:
+    """
+    COPY a regular table, generating a UUID per row and recording the
+    CSV id (or row number) -> UUID mapping for the tables that reference it.
+    With a password_hasher, each batch's passwords are hashed in the pool
+    while the previous batch is being copied. With a checkpoint, the import
+    continues after the last committed batch and records each new one.
+    """
+    table = Base.metadata.tables[table_name]
+    progress = TableProgress(0, 0, 0, False)
+    mapping = UUIDMapping()
+    if checkpoint is not None:
+        checkpoint.start(table_name, file_path)
+        _recover_pending(engine, checkpoint, table)
+        progress = checkpoint.start(table_name, file_path)
+        mapping = checkpoint.mappings(table_name)
+    ID_MAPPINGS[table_name] = mapping
+    if progress.done:
+        return progress.records
+
+    counter = _Counter()
+    records_imported = 0
+    start = time.perf_counter()
+
+    with CsvCursor(file_path, delimiter, progress.byte_offset) as csv_reader:
+        header = csv_reader.header
+        if header is None:
+            return 0
+        hash_inline = password_hasher is None or "password_hash" not in header
+        columns, build = _compile_row_builder(table, header, table_defaults, counter, hash_inline)
+        password_index = None if hash_inline else columns.index("password_hash")
+        id_index = header.index("id") if "id" in header else None
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table_name), sql.SQL(", ").join(map(sql.Identifier, columns))
+        )
+        # Batch whose passwords are still being hashed
+        pending: Optional[Tuple[_Batch, PendingHashes]] = None
+
+        def copy(batch: _Batch, rows: List[tuple]) -> None:
+            nonlocal records_imported
+            if checkpoint is not None:
+                checkpoint.prepare(table_name, batch.keys, batch.byte_offset, batch.row_number)
+            _copy_batch(engine, statement, rows)
+            if checkpoint is not None:
+                checkpoint.commit(table_name)
+            records_imported += len(rows)
+
+        def send(batch: _Batch) -> None:
+            nonlocal pending
+            if password_index is None:
+                copy(batch, batch.rows)
+                return
+            hashes = password_hasher.submit([row[password_index] for row in batch.rows])
+            if pending is not None:
+                copy(pending[0], _with_hashes(pending[0].rows, pending[1], password_index))
+            pending = (batch, hashes)
+
+        rows: List[tuple] = []
+        keys: List[Tuple[int, int, uuid.UUID]] = []
+        for i, row in enumerate(csv_reader, start=progress.row_number + 1):
+            csv_id = row[id_index].strip() if id_index is not None and id_index < len(row) else ""
+            key = int(csv_id) if csv_id else i
+            pk = uuid.uuid4()
+            mapping[key] = pk
+            rows.append(build(row, pk))
+            keys.append((key, i, pk))
+            if len(rows) >= batch_size:
+                send(_Batch(rows, keys, csv_reader.tell(), i))
+                rows, keys = [], []
+        if rows:
+            send(_Batch(rows, keys, csv_reader.tell(), i))
+        if pending is not None:
+            copy(pending[0], _with_hashes(pending[0].rows, pending[1], password_index))
+
+    if checkpoint is not None:
+        checkpoint.finish(table_name)
+    if counter.invalid_fk:
+        logger.warning(f"{table_name}: {counter.invalid_fk} foreign keys had no ID mapping and were set to NULL")
+    if counter.invalid_enum:
+        logger.warning(f"{table_name}: {counter.invalid_enum} invalid enum values were set to NULL")
+    if mapping.sparse:
+        logger.warning(f"{table_name}: {mapping.sparse} ids were negative or far outside the dense id range "
+                       f"and were mapped through a dict")
+    elapsed = time.perf_counter() - start
+    logger.info(f"Copied {records_imported} rows into {table_name} in {elapsed:.1f}s "
+                f"({records_imported / elapsed if elapsed else 0:.0f} rows/s)")
+    return progress.records + records_imported
+
+
+def dependency_graph(tables: List[str]) -> Dict[str, Set[str]]:
+    """
+    For each table, the tables earlier in the import order that it references
+    through a foreign key. Those must be loaded (and their ID mappings built)
+    before it starts; everything else can load concurrently.
+    """
+    graph: Dict[str, Set[str]] = {}
+    for position, table_name in enumerate(tables):
+        earlier = set(tables[:position])
+        referenced = {fk.column.table.name for fk in Base.metadata.tables[table_name].foreign_keys}
+        graph[table_name] = referenced & earlier
+    return graph
+
+
+def copy_import_all_data(
+    csv_files: Dict[str, str],
+    batch_size: int = 50000,
+    delimiter: str = ';',
+    default_values: Optional[Dict[str, Dict[str, Any]]] = None,
+    skip_duplicates: bool = True,
+    association_tables: Optional[List[str]] = None,
+    workers: int = 4,
+    association_batch_size: int = 1000,
+    password_hasher: Optional[PasswordHashPool] = None,
+    checkpoint: Optional[ImportCheckpoint] = None,
+) -> Dict[str, Union[int, str]]:
+    """
+    Import multiple CSV files like import_all_data, but stream regular tables
+    through COPY FROM STDIN and load tables whose dependencies are done in
+    parallel, one connection per worker.
+
+    Args:
+        csv_files: Dictionary mapping table names to CSV file paths, in import order
+        batch_size: Number of rows per COPY statement (each batch is committed)
+        delimiter: CSV delimiter character
+        default_values: Default values for specific tables
+        skip_duplicates: Whether to skip duplicate records in association tables
+        association_tables: List of table names that are association tables
+        workers: Number of tables loaded at the same time
+        association_batch_size: Number of records per batch for association tables
+        password_hasher: Process pool that hashes passwords ahead of the COPY
+        checkpoint: Progress store; tables continue from their last committed batch
+
+    Returns:
+        Dictionary with import counts per table {'table_name': rows_imported}
+    """
+    engine = create_engine(get_database_url(), pool_size=workers, max_overflow=0)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    default_values = default_values or {}
+    association_tables = association_tables or []
+
+    def load(table_name: str) -> int:
+        file_path = csv_files[table_name]
+        if table_name in association_tables:
+            with SessionLocal() as session:
+                return _import_association_table(
+                    session, table_name, file_path, delimiter, association_batch_size, skip_duplicates,
+                    checkpoint
+                )
+        return _copy_regular_table(
+            engine, table_name, file_path, delimiter, batch_size,
+            default_values.get(table_name, {}), password_hasher, checkpoint
+        )
+
+    pending = dependency_graph(list(csv_files))
+    running: Dict[Future, str] = {}
+    results: Dict[str, Union[int, str]] = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import") as pool:
+            while pending or running:
+                # pending keeps import order, so a failure cascades in a single pass
+                for table_name, deps in list(pending.items()):
+                    failed = [dep for dep in deps if dep in results and not isinstance(results[dep], int)]
+                    if failed:
+                        results[table_name] = f"Error: skipped, {failed[0]} failed to import"
+                        del pending[table_name]
+                    elif all(dep in results for dep in deps):
+                        running[pool.submit(load, table_name)] = table_name
+                        del pending[table_name]
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table_name = running.pop(future)
+                    try:
+                        results[table_name] = future.result()
+                        logger.info(f"Imported {results[table_name]} records into {table_name}")
+                    except Exception as e:
+                        logger.error(f"Error importing {table_name}: {str(e)}", exc_info=e)
+                        results[table_name] = f"Error: {str(e)}"
+    finally:
+        engine.dispose()
+
+    return {table_name: results[table_name] for table_name in csv_files}
@@ -0,0 +1,128 @@
+import mmap
+import tempfile
+import uuid
+from typing import Dict, Iterator, Optional, Tuple
+
+from settings import IMPORT_MAPPING_SPILL_DIR, IMPORT_MAPPING_SPILL_MB
+
+_SLOT = 16
+# uuid4 never produces the nil UUID, so an all-zero slot means "no mapping"
+_EMPTY = bytes(_SLOT)
+# The buffer only grows to a key while at least 1 in _DENSITY slots below it
+# would be used (plus some slack for the first rows); other keys go to a dict
+_DENSITY = 2
+_SLACK = 1024
+
+
+class UUIDMapping:
+    """
+    CSV id -> UUID mapping stored as raw UUID bytes in one contiguous buffer,
+    indexed by the id itself (CSV ids and row numbers are dense and start at 1).
+    About 16 bytes per entry, against ~150 for a dict of int -> uuid.UUID.
+
+    Once the buffer outgrows `spill_bytes` it moves to a memory-mapped
+    temporary file, so very large tables are paged by the OS instead of
+    held in RAM.
+
+    Keys the buffer cannot hold cheaply (negative, or far beyond the ids seen
+    so far, e.g. a stray 1000000000) are kept in a plain dict instead, so one
+    outlier cannot size the buffer; `sparse` counts them.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        spill_bytes: Optional[int] = IMPORT_MAPPING_SPILL_MB * 1024 * 1024,
+        spill_dir: Optional[str] = IMPORT_MAPPING_SPILL_DIR or None,
+    ):
+        self.spill_bytes = spill_bytes
+        self.spill_dir = spill_dir
+        self._buf = bytearray(capacity * _SLOT)
+        self._file = None
+        self._count = 0
+        self._sparse: Dict[int, uuid.UUID] = {}
+
+    @property
+    def sparse(self) -> int:
+        """Number of keys stored outside the buffer"""
+        return len(self._sparse)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf) // _SLOT
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def _grow(self, key: int) -> None:
+        size = max(len(self._buf) * 2, (key + 1) * _SLOT)
+        if self._file is None and (self.spill_bytes is None or size <= self.spill_bytes):
+            self._buf.extend(bytes(size - len(self._buf)))
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="id_mapping_", dir=self.spill_dir)
+            self._file.write(self._buf)
+        else:
+            self._buf.close()
+        # Extending the file zero-fills it, and the new map covers the whole file
+        self._file.truncate(size)
+        self._buf = mmap.mmap(self._file.fileno(), size)
+
+    def _dense(self, key: int) -> bool:
+        return 0 <= key < max(self.capacity, _DENSITY * (self._count + 1) + _SLACK)
+
+    def __setitem__(self, key: int, value: uuid.UUID) -> None:
+        if not self._dense(key):
+            self._sparse[key] = value
+            return
+        if self._sparse:
+            self._sparse.pop(key, None)
+        if key >= self.capacity:
+            self._grow(key)
+        offset = key * _SLOT
+        if self._buf[offset:offset + _SLOT] == _EMPTY:
+            self._count += 1
+        self._buf[offset:offset + _SLOT] = value.bytes
+
+    def __getitem__(self, key: int) -> uuid.UUID:
+        if 0 <= key < self.capacity:
+            offset = key * _SLOT
+            raw = self._buf[offset:offset + _SLOT]
+            if raw != _EMPTY:
+                return uuid.UUID(bytes=bytes(raw))
+        return self._sparse[key]
+
+    def get(self, key: int, default: Optional[uuid.UUID] = None) -> Optional[uuid.UUID]:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return self._count + len(self._sparse)
+
+    def items(self) -> Iterator[Tuple[int, uuid.UUID]]:
+        for key in range(self.capacity):
+            offset = key * _SLOT
+            raw = self._buf[offset:offset + _SLOT]
+            if raw != _EMPTY:
+                yield key, uuid.UUID(bytes=bytes(raw))
+        yield from self._sparse.items()
+
+    def nbytes(self) -> int:
+        """Size of the backing buffer, in RAM or on disk (sparse keys not included)"""
+        return len(self._buf)
+
+    def close(self) -> None:
+        """Release the spill file, if any"""
+        self._sparse.clear()
+        if self._file is not None:
+            self._buf.close()
+            self._file.close()
+            self._buf = bytearray()
+            self._file = None
+            self._count = 0
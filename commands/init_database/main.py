@@ -1,12 +1,14 @@
 import secrets
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from src.models import *
 from src.models import MODEL_REGISTRY
 from src.utils.db_utils import Base, get_database_url
 
 import csv
 import uuid
-from sqlalchemy import Boolean, Enum, Table, create_engine, inspect
+from itertools import zip_longest
+from sqlalchemy import ARRAY, UUID, Boolean, Enum, Table, any_, bindparam, create_engine, inspect, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker, Session
 import logging
 import pkgutil
@@ -14,7 +16,10 @@ import importlib
 import src.models  # the package
 import src.models.relationship_models
 import bcrypt
-ID_MAPPINGS: Dict[str, Dict[int, uuid.UUID]] = {}
+from commands.init_database.id_mapping import UUIDMapping
+from commands.init_database.checkpoint import CsvCursor, ImportCheckpoint, TableProgress
+from commands.init_database.password_pool import PasswordHashPool, PendingHashes
+ID_MAPPINGS: Dict[str, UUIDMapping] = {}
 
 for module_info in pkgutil.iter_modules(src.models.__path__):
     importlib.import_module(f"src.models.{module_info.name}")
@@ -47,7 +52,8 @@ def import_all_data(
     delimiter: str = ';',
     default_values: Optional[Dict[str, Dict[str, Any]]] = None,
     skip_duplicates: bool = True,
-    association_tables: Optional[List[str]] = None
+    association_tables: Optional[List[str]] = None,
+    password_hasher: Optional[PasswordHashPool] = None
 ) -> Dict[str, Union[int, str]]:
     """
     Import multiple CSV files into corresponding tables, including association tables.
@@ -59,6 +65,7 @@ def import_all_data(
         default_values: Default values for specific tables
         skip_duplicates: Whether to skip duplicate records
         association_tables: List of table names that are association tables
+        password_hasher: Process pool that hashes passwords ahead of the inserts
         
     Returns:
         Dictionary with import counts per table {'table_name': rows_imported}
@@ -84,7 +91,7 @@ def import_all_data(
                     # Handle regular table
                     records_imported = _import_regular_table(
                         session, table_name, file_path, delimiter, batch_size, 
-                        default_values.get(table_name, {}), skip_duplicates
+                        default_values.get(table_name, {}), skip_duplicates, password_hasher
                 )
 
                 results[table_name] = records_imported
@@ -104,11 +111,14 @@ def _import_regular_table(
     delimiter: str,
     batch_size: int,
     table_defaults: Dict[str, Any],
-    skip_duplicates: bool
+    skip_duplicates: bool,
+    password_hasher: Optional[PasswordHashPool] = None
 ) -> int:
     """Import regular tables with UUID remapping for foreign keys.
        If no 'id' column, generate UUIDs and map row_number → UUID.
        Empty string values are converted to NULL.
+       With a password_hasher, each batch's passwords are hashed in the pool
+       while the previous batch is being inserted.
     """
     inspector = inspect(session.bind)
     model_class = MODEL_REGISTRY.get(table_name)
@@ -118,9 +128,25 @@ def _import_regular_table(
     pk_column = inspector.get_pk_constraint(table_name)['constrained_columns'][0]
     records_imported = 0
     records_to_add = []
+    raw_passwords = []
+    # Batch whose passwords are still being hashed
+    pending: Optional[Tuple[list, PendingHashes]] = None
+
+    def save(records: list) -> None:
+        nonlocal pending
+        # raw_passwords stays empty for tables without a password_hash column
+        if password_hasher is None or not raw_passwords:
+            session.bulk_save_objects(records)
+            session.commit()
+            return
+        hashes = password_hasher.submit(raw_passwords[:len(records)])
+        del raw_passwords[:len(records)]
+        if pending is not None:
+            _save_with_hashes(session, *pending)
+        pending = (records, hashes)
 
     # Create mapping dict for this table
-    ID_MAPPINGS[table_name] = {}
+    ID_MAPPINGS[table_name] = UUIDMapping()
 
     # Find foreign key columns
     table_obj = Table(table_name, Base.metadata, autoload_with=session.bind)
@@ -141,11 +167,16 @@ def _import_regular_table(
 
                 # Convert empty strings to NULL
                 if val == "":
+                    if col == "password_hash" and password_hasher is not None:
+                        # Hashed in the pool, as a random password
+                        raw_passwords.append(None)
                     record_data[col] = None
                     continue
 
                 if col == "password_hash":
-                    if val:
+                    if password_hasher is not None:
+                        raw_passwords.append(val)
+                    elif val:
                         record_data[col] = _hash_password(val)
                     else:
                         record_data[col] = _default_password_hash()
@@ -201,17 +232,25 @@ def _import_regular_table(
             records_imported += 1
 
             if len(records_to_add) >= batch_size:
-                session.bulk_save_objects(records_to_add)
-                session.commit()
+                save(records_to_add)
                 records_to_add = []
 
     if records_to_add:
-        session.bulk_save_objects(records_to_add)
-        session.commit()
+        save(records_to_add)
+    if pending is not None:
+        _save_with_hashes(session, *pending)
 
     return records_imported
 
 
+def _save_with_hashes(session: Session, records: list, hashes: PendingHashes) -> None:
+    """Fill in a batch's hashed passwords, then insert and commit it"""
+    for record, hashed in zip(records, hashes.result()):
+        record.password_hash = hashed
+    session.bulk_save_objects(records)
+    session.commit()
+
+
 
 def _import_association_table(
     session: Session,
@@ -219,124 +258,153 @@ def _import_association_table(
     file_path: str,
     delimiter: str,
     batch_size: int,
-    skip_duplicates: bool
+    skip_duplicates: bool,
+    checkpoint: Optional[ImportCheckpoint] = None
 ) -> int:
-    """Import association tables using UUID mapping with FK validation"""
+    """Import association tables using UUID mapping with set-based FK validation.
+
+    Foreign keys are remapped through ID_MAPPINGS in memory, and each batch
+    checks the referenced ids it has not seen yet with one
+    `WHERE id = ANY(...)` query per referenced table. Duplicates are dropped
+    with a hash set of primary keys and `ON CONFLICT DO NOTHING`, so no query
+    runs per CSV row. With a checkpoint, the import continues after the last
+    committed batch; re-running a batch is harmless thanks to ON CONFLICT.
+    """
+    progress = TableProgress(0, 0, 0, False)
+    if checkpoint is not None:
+        progress = checkpoint.start(table_name, file_path)
+        if progress.done:
+            return progress.records
     records_imported = 0
     inserts = []
-    
-    COLUMN_TO_TABLE = {
-        "book_id": "books",
-        "author_id": "author",
-        "user_id": "users",
-        "role_id": "role",
-        "category_id": "category",
-    }
-    
-    # Get the table object from metadata
-    table_obj = Table(table_name, Base.metadata, autoload_with=session.bind)
-    
-    # Get all foreign key columns and their referenced tables
-    fk_info = []
-    for col in table_obj.columns:
-        if col.foreign_keys:
-            for fk in col.foreign_keys:
-                fk_info.append({
-                    'col_name': col.name,
-                    'ref_table': fk.column.table.name,
-                    'ref_col': fk.column.name
-                })
 
-    with open(file_path, 'r', encoding='utf-8') as file:
-        csv_reader = csv.DictReader(file, delimiter=delimiter)
+    # The table and the tables it references are defined in the metadata;
+    # reflect only if the model is missing, and only once
+    table_obj = Base.metadata.tables.get(table_name)
+    if table_obj is None:
+        table_obj = Table(table_name, Base.metadata, autoload_with=session.bind)
 
-        for row in csv_reader:
+    # Foreign key column -> referenced table
+    fk_tables = {
+        col.name: next(iter(col.foreign_keys)).column.table
+        for col in table_obj.columns if col.foreign_keys
+    }
+    for ref_table in fk_tables.values():
+        if ref_table.name not in ID_MAPPINGS:
+            raise ValueError(f"No ID mapping found for table: {ref_table.name}")
+    boolean_columns = {col.name for col in table_obj.columns if isinstance(col.type, Boolean)}
+    pk_columns = list(table_obj.primary_key.columns.keys())
+
+    # Referenced ids already confirmed to exist, per referenced table
+    verified: Dict[str, set] = {ref_table.name: set() for ref_table in fk_tables.values()}
+    seen_keys = set()
+    invalid_mappings = 0
+    missing_references = 0
+    insert_stmt = pg_insert(table_obj)
+    if skip_duplicates:
+        insert_stmt = insert_stmt.on_conflict_do_nothing()
+
+    def verify_references(rows: List[dict]) -> List[dict]:
+        """Drop rows whose referenced ids are not in the database, one query per referenced table"""
+        nonlocal missing_references
+        for col, ref_table in fk_tables.items():
+            known = verified[ref_table.name]
+            unchecked = {row[col] for row in rows} - known
+            if unchecked:
+                existing = session.execute(
+                    select(ref_table.c.id).where(ref_table.c.id == any_(bindparam("ids", type_=ARRAY(UUID)))),
+                    {"ids": list(unchecked)},
+                )
+                known.update(existing.scalars())
+        valid = [row for row in rows if all(row[col] in verified[ref.name] for col, ref in fk_tables.items())]
+        missing_references += len(rows) - len(valid)
+        return valid
+
+    def flush(rows: List[dict]) -> Optional[int]:
+        """Insert and commit a batch; returns the rows inserted, or None if the batch failed"""
+        rows = verify_references(rows)
+        if not rows:
+            return 0
+        try:
+            result = session.execute(insert_stmt, rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error inserting batch into {table_name}: {e}")
+            return None
+        # executemany with ON CONFLICT DO NOTHING reports the rows actually inserted
+        return result.rowcount if result.rowcount >= 0 else len(rows)
+
+    # Once a batch fails the checkpoint stays before it, so --resume retries it
+    failed_batches = 0
+
+    with CsvCursor(file_path, delimiter, progress.byte_offset) as csv_reader:
+        header = csv_reader.header or []
+
+        def commit_batch(rows: List[dict], row_number: int) -> None:
+            nonlocal records_imported, failed_batches
+            inserted = flush(rows)
+            if inserted is None:
+                failed_batches += 1
+                return
+            records_imported += inserted
+            if checkpoint is not None and not failed_batches:
+                checkpoint.advance(table_name, csv_reader.tell(), row_number, inserted)
+
+        i = progress.row_number
+        for i, row in enumerate(csv_reader, start=progress.row_number + 1):
             new_row = {}
             skip_record = False
-            
-            for col, val in row.items():
+
+            for col, val in zip_longest(header, row):
+                if col is None or col not in table_obj.c:
+                    continue
                 if val is not None:
                     val = val.strip()
 
-                col_type = table_obj.c[col].type
-                if isinstance(col_type, Boolean):
-                    if val.lower() == "true":
-                        new_row[col] = True
-                    elif val.lower() == "false":
-                        new_row[col] = False
-                    else:
-                        new_row[col] = None
-                    continue
-                
-                if col.endswith("_id"):
-                    # Get referenced table name (e.g., "author_id" → "author")
-                    # ref_table = col[:-3]  # Remove "_id" suffix
-                    ref_table = COLUMN_TO_TABLE.get(col)
-                    
-                    if ref_table in ID_MAPPINGS:
-                        try:
-                            # Convert numeric ID to mapped UUID
-                            mapped_id = ID_MAPPINGS[ref_table][int(val)]
-                            new_row[col] = mapped_id
-                            
-                            # Verify the referenced ID exists in the database
-                            ref_table_obj = Table(ref_table, Base.metadata, autoload_with=session.bind)
-                            exists = session.execute(
-                                ref_table_obj.select().where(ref_table_obj.c.id == mapped_id)
-                            ).first()
-                            
-                            if not exists:
-                                logger.warning(f"Referenced ID {mapped_id} not found in table {ref_table}")
-                                skip_record = True
-                                break
-                                
-                        except (ValueError, KeyError):
-                            logger.warning(f"Invalid ID mapping for {ref_table}.{val}")
-                            skip_record = True
-                            break
-                    else:
-                        raise ValueError(f"No ID mapping found for table: {ref_table}")
+                if col in boolean_columns:
+                    lowered = (val or "").lower()
+                    new_row[col] = True if lowered == "true" else False if lowered == "false" else None
+                elif col in fk_tables:
+                    try:
+                        # Convert numeric ID to mapped UUID
+                        new_row[col] = ID_MAPPINGS[fk_tables[col].name][int(val)]
+                    except (TypeError, ValueError, KeyError):
+                        invalid_mappings += 1
+                        skip_record = True
+                        break
                 else:
                     new_row[col] = val
 
-            # Skip if we couldn't map all foreign keys or if references are invalid
-            if skip_record or len(new_row) != len(row):
+            # Skip if we couldn't map all foreign keys
+            if skip_record:
                 continue
 
-            # Skip duplicates if needed
+            # Skip duplicates within the file; ON CONFLICT covers rows already in the table
             if skip_duplicates:
-                filter_conditions = {col: new_row[col] for col in table_obj.primary_key.columns.keys()}
-                exists = session.execute(
-                    table_obj.select().where(
-                        *[getattr(table_obj.c, col) == val for col, val in filter_conditions.items()]
-                    )
-                ).first()
-                if exists:
+                key = tuple(new_row.get(col) for col in pk_columns)
+                if key in seen_keys:
                     continue
+                seen_keys.add(key)
 
             inserts.append(new_row)
-            records_imported += 1
 
             if len(inserts) >= batch_size:
-                try:
-                    session.execute(table_obj.insert(), inserts)
-                    session.commit()
-                    inserts = []
-                except Exception as e:
-                    session.rollback()
-                    logger.error(f"Error inserting batch: {e}")
-                    # Optionally: inspect which record caused the error and skip it
-                    # For simplicity, we'll just skip the entire batch here
-                    inserts = []
-                    continue
+                commit_batch(inserts, i)
+                inserts = []
 
-    if inserts:
-        try:
-            session.execute(table_obj.insert(), inserts)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error inserting final batch: {e}")
-            records_imported -= len(inserts)
+        if inserts:
+            commit_batch(inserts, i)
+
+    if checkpoint is not None and not failed_batches:
+        checkpoint.finish(table_name)
+    if failed_batches:
+        resume_hint = "; --resume retries from the first failed batch" if checkpoint is not None else ""
+        logger.warning(f"{table_name}: {failed_batches} batches failed to insert{resume_hint}")
+
+    if invalid_mappings:
+        logger.warning(f"{table_name}: skipped {invalid_mappings} rows with no ID mapping")
+    if missing_references:
+        logger.warning(f"{table_name}: skipped {missing_references} rows referencing missing ids")
 
-    return records_imported
\ No newline at end of file
+    return progress.records + records_imported
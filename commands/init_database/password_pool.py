@@ -0,0 +1,78 @@
+import secrets
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+import bcrypt
+
+from settings import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
+
+
+def _hash_chunk(passwords: Sequence[Optional[str]], rounds: int) -> List[str]:
+    """Hash a chunk of passwords in a worker process; empty ones get a random password."""
+    return [
+        bcrypt.hashpw((password or secrets.token_hex(8)).encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+        for password in passwords
+    ]
+
+
+class PendingHashes:
+    """Hashes of one batch, computed in the background until result() is called."""
+
+    def __init__(self, pool: "PasswordHashPool", futures: List[Future], count: int):
+        self._pool = pool
+        self._futures = futures
+        self._count = count
+
+    def result(self) -> List[str]:
+        hashes = [hashed for future in self._futures for hashed in future.result()]
+        self._pool._record(self._count)
+        return hashes
+
+
+class PasswordHashPool:
+    """
+    bcrypt on a process pool for bulk imports. A batch is split across all
+    workers and hashed while the caller inserts the previous batch.
+    """
+
+    def __init__(self, processes: Optional[int] = None, rounds: int = BCRYPT_ROUNDS):
+        self.processes = processes or PASSWORD_HASH_WORKERS
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.hashed = 0
+        # Wall time from the first submitted batch to the last collected one
+        self.seconds = 0.0
+        self._started: Optional[float] = None
+
+    def __enter__(self) -> "PasswordHashPool":
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._executor.shutdown()
+        self._executor = None
+
+    def submit(self, passwords: Sequence[Optional[str]]) -> PendingHashes:
+        """Start hashing a batch; results come back in the same order."""
+        if self._started is None:
+            self._started = time.perf_counter()
+        chunk = -(-len(passwords) // self.processes) or 1
+        futures = [
+            self._executor.submit(_hash_chunk, passwords[i:i + chunk], self.rounds)
+            for i in range(0, len(passwords), chunk)
+        ]
+        return PendingHashes(self, futures, len(passwords))
+
+    def _record(self, count: int) -> None:
+        self.hashed += count
+        self.seconds = time.perf_counter() - self._started
+
+    def metrics(self) -> dict:
+        return {
+            "processes": self.processes,
+            "rounds": self.rounds,
+            "hashed": self.hashed,
+            "seconds": round(self.seconds, 2),
+            "hashes_per_second": round(self.hashed / self.seconds, 1) if self.seconds else 0.0,
+        }
@@ -0,0 +1,20 @@
+import asyncio
+
+from src.repository.book_rating_summary_repository import BookRatingSummaryRepository
+from src.utils.db_utils import engine, session_factory
+
+
+async def _rebuild() -> int:
+    try:
+        async with session_factory() as db:
+            return await BookRatingSummaryRepository().rebuild(db)
+    finally:
+        await engine.dispose()
+
+
+def rebuild_rating_summary() -> int:
+    """
+    Recompute book_rating_summary from the approved ratings, e.g. after a bulk
+    import that wrote ratings directly. Returns the number of summary rows.
+    """
+    return asyncio.run(_rebuild())
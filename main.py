@@ -1,13 +1,59 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from src.api.main_router import router as main_router
+from src.tasks.catalog_index import catalog_index
+from src.tasks.leaderboard_refresher import leaderboard_refresher
+from src.tasks.overdue_sweeper import overdue_sweeper
+from src.utils.db_utils import LAST_WRITE_COOKIE
+from src.utils.security_utils import PasswordHasherBusyError
+from settings import AUTOCOMPLETE_ENABLED, LEADERBOARD_REFRESH_ENABLED, OVERDUE_SWEEP_ENABLED, READ_YOUR_WRITES_WINDOW
 import uvicorn
 import asyncio
 import sys
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if OVERDUE_SWEEP_ENABLED:
+        overdue_sweeper.start()
+    if LEADERBOARD_REFRESH_ENABLED:
+        leaderboard_refresher.start()
+    if AUTOCOMPLETE_ENABLED:
+        await catalog_index.start()
+    yield
+    await overdue_sweeper.stop()
+    await leaderboard_refresher.stop()
+    await catalog_index.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(main_router)
 
+
+@app.middleware("http")
+async def mark_last_write(request: Request, call_next):
+    """Remember successful writes so the client's next reads go to the primary"""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(
+            LAST_WRITE_COOKIE, str(time.time()), max_age=READ_YOUR_WRITES_WINDOW, httponly=True
+        )
+    return response
+
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusyError):
+    """Shed load when the bcrypt worker pool is saturated"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 if __name__ == '__main__':
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -19,7 +19,87 @@ def get_config(key: str, default: Optional[str] = None) -> Optional[str]:
 POSTGRES_PASSWORD = get_config(key="POSTGRES_PASSWORD", default="password")
 POSTGRES_USER = get_config(key="POSTGRES_USER", default="user")
 POSTGRES_DB = get_config(key="POSTGRES_DB", default="database")
+POSTGRES_HOST = get_config(key="POSTGRES_HOST", default="localhost")
+POSTGRES_PORT = int(get_config(key="POSTGRES_PORT", default="5432"))
 SECRET_KEY = get_config(key="SECRET_KEY", default="secr")
 ALGORITHM = get_config(key="ALGORITHM", default="al")
 ACCESS_TOKEN_EXPIRE_MINUTES = get_config(key="ACCESS_TOKEN_EXPIRE_MINUTES", default="accessexpire")
 ###
+
+### DATABASE POOL SETTINGS
+
+DB_POOL_SIZE = int(get_config(key="DB_POOL_SIZE", default="5"))
+DB_MAX_OVERFLOW = int(get_config(key="DB_MAX_OVERFLOW", default="10"))
+DB_POOL_TIMEOUT = float(get_config(key="DB_POOL_TIMEOUT", default="30"))
+DB_POOL_RECYCLE = int(get_config(key="DB_POOL_RECYCLE", default="1800"))
+DB_POOL_PRE_PING = get_config(key="DB_POOL_PRE_PING", default="true").lower() == "true"
+# Server-side statement timeout in milliseconds (0 disables it)
+DB_STATEMENT_TIMEOUT_MS = int(get_config(key="DB_STATEMENT_TIMEOUT_MS", default="0"))
+# Executions of the same query before psycopg prepares it server-side (empty keeps psycopg's default of 5)
+DB_PREPARE_THRESHOLD = get_config(key="DB_PREPARE_THRESHOLD", default="")
+# Prepare the repositories' hot lookups server-side from their first execution
+DB_PREPARED_STATEMENTS = get_config(key="DB_PREPARED_STATEMENTS", default="false").lower() == "true"
+###
+
+### READ REPLICA SETTINGS
+
+# Leave POSTGRES_REPLICA_HOST empty to send reads to the primary
+POSTGRES_REPLICA_HOST = get_config(key="POSTGRES_REPLICA_HOST", default="")
+POSTGRES_REPLICA_PORT = int(get_config(key="POSTGRES_REPLICA_PORT", default="5433"))
+# Seconds after a write during which the same client reads from the primary
+READ_YOUR_WRITES_WINDOW = int(get_config(key="READ_YOUR_WRITES_WINDOW", default="5"))
+###
+
+### BACKGROUND TASK SETTINGS
+
+OVERDUE_SWEEP_ENABLED = get_config(key="OVERDUE_SWEEP_ENABLED", default="true").lower() == "true"
+OVERDUE_SWEEP_INTERVAL_SECONDS = float(get_config(key="OVERDUE_SWEEP_INTERVAL_SECONDS", default="60"))
+OVERDUE_SWEEP_BATCH_SIZE = int(get_config(key="OVERDUE_SWEEP_BATCH_SIZE", default="1000"))
+LEADERBOARD_REFRESH_ENABLED = get_config(key="LEADERBOARD_REFRESH_ENABLED", default="true").lower() == "true"
+LEADERBOARD_REFRESH_INTERVAL_SECONDS = float(get_config(key="LEADERBOARD_REFRESH_INTERVAL_SECONDS", default="300"))
+# Books kept per precomputed leaderboard
+LEADERBOARD_SIZE = int(get_config(key="LEADERBOARD_SIZE", default="100"))
+# Day windows precomputed for the most-rated and most-borrowed boards
+LEADERBOARD_WINDOWS = [int(days) for days in get_config(key="LEADERBOARD_WINDOWS", default="7,30").split(",")]
+# Weight of the global mean in the Bayesian average, in number of ratings
+LEADERBOARD_PRIOR_WEIGHT = float(get_config(key="LEADERBOARD_PRIOR_WEIGHT", default="10"))
+###
+
+### PASSWORD HASHING SETTINGS
+
+BCRYPT_ROUNDS = int(get_config(key="BCRYPT_ROUNDS", default="12"))
+PASSWORD_HASH_WORKERS = int(get_config(key="PASSWORD_HASH_WORKERS", default=str(os.cpu_count() or 1)))
+# Hash requests allowed to wait for a worker before new ones are rejected
+PASSWORD_HASH_MAX_QUEUE = int(get_config(key="PASSWORD_HASH_MAX_QUEUE", default="64"))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(get_config(key="PASSWORD_HASH_QUEUE_TIMEOUT", default="5"))
+###
+
+### IMPORT SETTINGS
+
+# ID mappings larger than this move from RAM to a memory-mapped temporary file
+IMPORT_MAPPING_SPILL_MB = int(get_config(key="IMPORT_MAPPING_SPILL_MB", default="512"))
+# Directory for the spill files (empty: the system temporary directory)
+IMPORT_MAPPING_SPILL_DIR = get_config(key="IMPORT_MAPPING_SPILL_DIR", default="")
+###
+
+### AUTH CACHE SETTINGS
+
+AUTH_CACHE_MAX_SIZE = int(get_config(key="AUTH_CACHE_MAX_SIZE", default="10000"))
+# Upper bound on how long a verified token is trusted before re-checking the user
+AUTH_CACHE_TTL_SECONDS = float(get_config(key="AUTH_CACHE_TTL_SECONDS", default="300"))
+LOGIN_NEGATIVE_CACHE_MAX_SIZE = int(get_config(key="LOGIN_NEGATIVE_CACHE_MAX_SIZE", default="100000"))
+# How long a username/email that matched no account is answered without a query
+LOGIN_NEGATIVE_CACHE_TTL_SECONDS = float(get_config(key="LOGIN_NEGATIVE_CACHE_TTL_SECONDS", default="60"))
+# The cache is per process, so a registration on another worker is only seen when a cached
+# identity is re-checked: at most one database lookup per identity per this many seconds
+LOGIN_NEGATIVE_CACHE_RECHECK_SECONDS = float(get_config(key="LOGIN_NEGATIVE_CACHE_RECHECK_SECONDS", default="5"))
+###
+
+### SEARCH SETTINGS
+
+# Postgres text search configuration used to build and query books.search_vector
+SEARCH_TEXT_CONFIG = get_config(key="SEARCH_TEXT_CONFIG", default="english")
+AUTOCOMPLETE_ENABLED = get_config(key="AUTOCOMPLETE_ENABLED", default="true").lower() == "true"
+# Full rebuilds pick up writes made by other workers or directly in the database
+AUTOCOMPLETE_REBUILD_INTERVAL_SECONDS = float(get_config(key="AUTOCOMPLETE_REBUILD_INTERVAL_SECONDS", default="600"))
+###
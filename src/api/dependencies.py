@@ -0,0 +1,54 @@
+# src/api/dependencies.py
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dto.auth_dto import PrincipalDTO
+from src.repository.user_repository import UserRepository
+from src.utils.db_utils import create_database_session
+from src.utils.security_utils import token_cache, verify_token
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+_credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired token",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(create_database_session),
+) -> PrincipalDTO:
+    """
+    Resolve the bearer token to the caller's principal.
+    Verified tokens are served from the token cache; only a miss decodes the
+    JWT and loads the user's id, roles and active flag. That load reads the
+    primary: right after invalidate_user a lagging replica could re-cache a
+    deactivated user or stale roles for the whole TTL. The session is lazy,
+    so cache hits never check out a connection.
+    """
+    if credentials is None:
+        raise _credentials_exception
+    token = credentials.credentials
+
+    principal = token_cache.get(token)
+    if principal is None:
+        claims = verify_token(token)
+        if not claims or "sub" not in claims:
+            raise _credentials_exception
+        try:
+            user_id = UUID(claims["sub"])
+        except ValueError:
+            raise _credentials_exception
+        principal = await UserRepository().get_principal(db, id=user_id)
+        if principal is None:
+            raise _credentials_exception
+        token_cache.put(token, claims, user_id, principal)
+
+    if not principal.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
+    return principal
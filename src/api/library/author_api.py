@@ -6,7 +6,7 @@ from typing import List
 from src.api.library.base_api import BaseAPI
 from src.dto.author_dto import AuthorCreateDTO, AuthorUpdateDTO, AuthorDTO
 from src.service.author_service import AuthorService
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_read_database_session
 
 
 def get_author_service() -> AuthorService:
@@ -31,7 +31,7 @@ router = author_api.router
 async def search_authors(
     first_name: str = Query(..., description="First name to search"),
     last_name: str | None = Query(None, description="Optional last name to search"),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: AuthorService = Depends(get_author_service),
 ):
     authors = await service.get_by_name(db, first_name, last_name)
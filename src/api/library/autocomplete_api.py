@@ -0,0 +1,27 @@
+# src/api/autocomplete_api.py
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from src.dto.autocomplete_dto import SuggestionDTO
+from src.tasks.catalog_index import catalog_index
+
+router = APIRouter(prefix="/autocomplete", tags=["Autocomplete"])
+
+_suggestions_adapter = TypeAdapter(List[SuggestionDTO])
+
+
+@router.get("/", response_model=List[SuggestionDTO])
+async def autocomplete(
+    q: str = Query(..., min_length=1, max_length=200, description="Prefix of a title, author name or ISBN"),
+    limit: int = Query(10, ge=1, le=50),
+    kind: Optional[Literal["book", "author"]] = Query(None, description="Only suggest books or authors"),
+):
+    """Typeahead suggestions served from the in-memory catalog index"""
+    suggestions = [
+        SuggestionDTO.model_construct(kind=item_kind, id=item_id, label=label)
+        for item_kind, item_id, label in catalog_index.suggest(q, limit=limit, kind=kind)
+    ]
+    return Response(content=_suggestions_adapter.dump_json(suggestions), media_type="application/json")
@@ -1,10 +1,18 @@
 # src/api/base_api.py
-from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
-from typing import List, TypeVar, Generic, Callable
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from typing import AsyncIterator, List, Optional, Type, TypeVar, Generic, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from src.utils.db_utils import create_database_session
+from src.dto.page_dto import CursorPageDTO
+from src.utils.db_utils import (
+    _wants_primary, create_database_session, create_read_database_session, read_session_factory, session_factory
+)
+from src.utils.export_utils import (
+    EXPORT_MEDIA_TYPES, EXPORT_SERIALIZERS, ExportFormat, json_array_chunks
+)
 
 DTO = TypeVar("DTO")
 CreateDTO = TypeVar("CreateDTO")
@@ -13,42 +21,128 @@ ServiceT = TypeVar("ServiceT")
 
 
 class BaseAPI(Generic[DTO, CreateDTO, UpdateDTO, ServiceT]):
-    def __init__(self, prefix: str, service_provider: Callable[[], ServiceT], tags: List[str] = None):
+    def __init__(
+        self,
+        prefix: str,
+        service_provider: Callable[[], ServiceT],
+        tags: List[str] = None,
+        json_model: Optional[Type[BaseModel]] = None,
+    ):
+        """
+        Passing `json_model` (the response DTO class) opts the read routes into
+        pre-serialized responses: their DTOs are dumped to JSON bytes by a
+        TypeAdapter and returned as a raw Response, so FastAPI does not validate
+        and serialize them a second time. The declared response models, and so
+        the OpenAPI schema, stay the same.
+        """
         self.router = APIRouter(prefix=prefix, tags=tags or [])
         self.get_service = service_provider
+        self.json_model = json_model
+        if json_model is not None:
+            self._item_adapter = TypeAdapter(json_model)
+            self._list_adapter = TypeAdapter(List[json_model])
+            self._page_model = CursorPageDTO[json_model]
+            self._page_adapter = TypeAdapter(self._page_model)
+
+    def _json_response(self, adapter: TypeAdapter, content) -> Response:
+        """Serialize already-validated DTOs straight to a JSON response"""
+        return Response(content=adapter.dump_json(content), media_type="application/json")
+
+    async def _open_stream(self, request: Request, service: ServiceT) -> AsyncIterator:
+        """
+        Start streaming every item of the service through its own session.
+        The session outlives the request handler and is closed once the
+        response body has been fully sent. Like create_read_database_session,
+        it reads from the replica unless the client needs its own writes.
+        Raises 404 if there are no items.
+        """
+        factory = session_factory if _wants_primary(request) else read_session_factory
+        session = factory()
+        rows = service.stream_all(session)
+        try:
+            first = await anext(rows)
+        except StopAsyncIteration:
+            await session.close()
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No items found")
+        except Exception:
+            await rows.aclose()
+            await session.close()
+            raise
+
+        async def items():
+            try:
+                yield first
+                async for item in rows:
+                    yield item
+            finally:
+                await rows.aclose()
+                await session.close()
+
+        return items()
 
     def register_crud_routes(self):
         @self.router.get("/", response_model=List[DTO])
         async def list_items(
             skip: int = Query(0, ge=0),
             limit: int = Query(100, ge=1, le=1000),
-            db: AsyncSession = Depends(create_database_session),
+            db: AsyncSession = Depends(create_read_database_session),
             service: ServiceT = Depends(self.get_service),
         ):
             items = await service.list(db, skip, limit)
             if not items:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No items found")
+            if self.json_model is not None:
+                return self._json_response(self._list_adapter, items)
             return items
 
-        @self.router.get("/all", response_model=List[DTO])
-        async def list_all(
-            db: AsyncSession = Depends(create_database_session),
+        @self.router.get("/page", response_model=CursorPageDTO[DTO])
+        async def list_page(
+            cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+            limit: int = Query(100, ge=1, le=1000),
+            db: AsyncSession = Depends(create_read_database_session),
             service: ServiceT = Depends(self.get_service),
         ):
-            items = await service.list_all(db)
+            try:
+                items, next_cursor = await service.list_keyset(db, cursor, limit)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
             if not items:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No items found")
-            return items
+            if self.json_model is not None:
+                page = self._page_model.model_construct(items=items, next_cursor=next_cursor)
+                return self._json_response(self._page_adapter, page)
+            return CursorPageDTO(items=items, next_cursor=next_cursor)
 
-        @self.router.get("/{obj_id}", response_model=DTO)
+        @self.router.get("/all", response_model=List[DTO])
+        async def list_all(
+            request: Request,
+            service: ServiceT = Depends(self.get_service),
+        ):
+            items = await self._open_stream(request, service)
+            return StreamingResponse(json_array_chunks(items), media_type="application/json")
+
+        @self.router.get("/export")
+        async def export_items(
+            request: Request,
+            format: ExportFormat = Query(ExportFormat.NDJSON, description="Export format"),
+            service: ServiceT = Depends(self.get_service),
+        ):
+            items = await self._open_stream(request, service)
+            return StreamingResponse(
+                EXPORT_SERIALIZERS[format](items), media_type=EXPORT_MEDIA_TYPES[format]
+            )
+
+        @self.router.get("/{obj_id:uuid}", response_model=DTO)
         async def get_item(
             obj_id: UUID,
-            db: AsyncSession = Depends(create_database_session),
+            db: AsyncSession = Depends(create_read_database_session),
             service: ServiceT = Depends(self.get_service),
         ):
             obj = await service.get(db, obj_id)
             if not obj:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+            if self.json_model is not None:
+                return self._json_response(self._item_adapter, obj)
             return obj
 
         @self.router.post("/", response_model=DTO, status_code=status.HTTP_201_CREATED)
@@ -62,19 +156,23 @@ class BaseAPI(Generic[DTO, CreateDTO, UpdateDTO, ServiceT]):
             except Exception as e:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
-        @self.router.put("/{obj_id}", response_model=DTO)
+        @self.router.put("/{obj_id:uuid}", response_model=DTO)
         async def update_item(
             obj_id: UUID,
             obj_in: UpdateDTO = Body(...),
             db: AsyncSession = Depends(create_database_session),
             service: ServiceT = Depends(self.get_service),
         ):
-            obj = await service.update(db, obj_id, obj_in)
+            try:
+                obj = await service.update(db, obj_id, obj_in)
+            except ValueError as e:
+                # e.g. a relationship list the repository cannot write
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
             if not obj:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found or update failed")
             return obj
 
-        @self.router.delete("/{obj_id}", status_code=status.HTTP_204_NO_CONTENT)
+        @self.router.delete("/{obj_id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
         async def delete_item(
             obj_id: UUID,
             db: AsyncSession = Depends(create_database_session),
@@ -4,9 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from src.api.library.base_api import BaseAPI
-from src.dto.book_dto import BookCreateDTO, BookUpdateDTO, BookDTO
+from src.dto.book_dto import BookCreateDTO, BookUpdateDTO, BookDTO, BookSearchResultDTO
 from src.service.book_service import BookService
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_read_database_session
 
 
 def get_book_service() -> BookService:
@@ -14,7 +14,7 @@ def get_book_service() -> BookService:
 
 
 book_api = BaseAPI[BookDTO, BookCreateDTO, BookUpdateDTO, BookService](
-    prefix="/books", service_provider=get_book_service, tags=["Books"]
+    prefix="/books", service_provider=get_book_service, tags=["Books"], json_model=BookDTO
 )
 
 # register base CRUD
@@ -27,7 +27,7 @@ router = book_api.router
 async def search_books(
     field: str = Query(..., description="Field to search by (e.g., title, author, isbn)"),
     value: str = Query(..., description="Value to search for"),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BookService = Depends(get_book_service),
 ):
     books = await service.search_books(db, field, value)
@@ -35,12 +35,23 @@ async def search_books(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No books found with {field}={value}")
     return books
 
+@router.get("/search/text", response_model=List[BookSearchResultDTO])
+async def search_books_text(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for in titles, authors, publishers, categories and descriptions"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(create_read_database_session),
+    service: BookService = Depends(get_book_service),
+):
+    """Ranked full-text search with typo-tolerant title matching"""
+    return await service.search_text(db, q, skip, limit)
+
 @router.get("/author/{author_name}", response_model=List[BookDTO])
 async def get_books_by_author(
     author_name: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BookService = Depends(get_book_service),
 ):
     """Get books by specific author"""
@@ -54,7 +65,7 @@ async def get_books_by_genre(
     genre: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BookService = Depends(get_book_service),
 ):
     """Get books by genre"""
@@ -68,7 +79,7 @@ async def get_books_by_year(
     year: int = Path(..., ge=1000, le=9999, description="Publication year (4 digits)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BookService = Depends(get_book_service),
 ):
     """Get books published in a specific year"""
@@ -79,7 +90,7 @@ async def get_books_by_year(
 
 @router.get("/stats/count", response_model=dict)
 async def get_book_count(
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BookService = Depends(get_book_service),
 ):
     """Get total count of books"""
@@ -10,7 +10,7 @@ from src.dto.book_digital_dto import (
     BooksDigitalUpdateDTO,
     FileFormat,
 )
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_read_database_session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -33,7 +33,7 @@ router = books_digital_api.router
 @books_digital_api.router.get("/by-book/{book_id}", response_model=List[BooksDigitalDTO])
 async def get_digital_books_by_book_id(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksDigitalService = Depends(get_books_digital_service),
 ):
     return await service.get_by_book_id(db, book_id)
@@ -42,7 +42,7 @@ async def get_digital_books_by_book_id(
 @books_digital_api.router.get("/by-format/{file_format}", response_model=List[BooksDigitalDTO])
 async def get_digital_books_by_format(
     file_format: FileFormat,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksDigitalService = Depends(get_books_digital_service),
 ):
     return await service.get_by_file_format(db, file_format)
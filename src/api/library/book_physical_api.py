@@ -9,7 +9,7 @@ from src.dto.book_physical_dto import (
     BooksPhysicalCreateDTO,
     BooksPhysicalUpdateDTO,
 )
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_database_session, create_read_database_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.relationship_models import BookStatus
 
@@ -33,7 +33,7 @@ router = books_physical_api.router
 @router.get("/by-barcode/{barcode}", response_model=BooksPhysicalDTO)
 async def get_physical_book_by_barcode(
     barcode: str,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksPhysicalService = Depends(get_books_physical_service),
 ):
     book = await service.get_by_barcode(db, barcode)
@@ -48,7 +48,7 @@ async def get_physical_book_by_barcode(
 @router.get("/by-book/{book_id}", response_model=List[BooksPhysicalDTO])
 async def get_physical_books_by_book_id(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksPhysicalService = Depends(get_books_physical_service),
 ):
     return await service.get_by_book_id(db, book_id)
@@ -73,7 +73,7 @@ async def update_physical_book_status(
 @router.get("/status/{status}", response_model=List[BooksPhysicalDTO])
 async def get_physical_books_by_status(
     status: BookStatus,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksPhysicalService = Depends(get_books_physical_service),
 ):
     return await service.get_by_status(db, status)
@@ -97,7 +97,7 @@ async def create_multiple_physical_books(
 @router.get("/available/by-book/{book_id}", response_model=List[BooksPhysicalDTO])
 async def get_available_physical_books_by_book_id(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: BooksPhysicalService = Depends(get_books_physical_service),
 ):
     return await service.get_available_by_book_id(db, book_id)
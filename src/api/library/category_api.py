@@ -7,7 +7,7 @@ from uuid import UUID
 from src.api.library.base_api import BaseAPI
 from src.dto.category_dto import CategoryDTO, CategoryCreateDTO, CategoryUpdateDTO
 from src.service.category_service import CategoryService
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_database_session, create_read_database_session
 
 
 def get_category_service() -> CategoryService:
@@ -28,7 +28,7 @@ router = category_api.router
 @category_api.router.get("/by-name/{name}", response_model=CategoryDTO)
 async def get_category_by_name(
     name: str,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: CategoryService = Depends(get_category_service),
 ):
     category = await service.get_by_name(db, name)
@@ -0,0 +1,47 @@
+# src/api/leaderboard_api.py
+from typing import List
+
+from fastapi import APIRouter, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from settings import LEADERBOARD_SIZE
+from src.dto.leaderboard_dto import LeaderboardEntryDTO
+from src.tasks.leaderboard_refresher import (
+    MOST_BORROWED, MOST_RATED, TOP_RATED, leaderboard_refresher
+)
+
+router = APIRouter(prefix="/leaderboards", tags=["Leaderboard"])
+
+_entries_adapter = TypeAdapter(List[LeaderboardEntryDTO])
+
+
+def _board_response(entries: List[LeaderboardEntryDTO], limit: int) -> Response:
+    """Serialize the cached board entries straight to JSON"""
+    return Response(content=_entries_adapter.dump_json(entries[:limit]), media_type="application/json")
+
+
+@router.get("/top-rated", response_model=List[LeaderboardEntryDTO])
+async def top_rated_books(
+    limit: int = Query(10, ge=1, le=LEADERBOARD_SIZE),
+):
+    """Books ranked by the Bayesian average of their approved ratings"""
+    return _board_response(await leaderboard_refresher.get(TOP_RATED), limit)
+
+
+@router.get("/most-rated", response_model=List[LeaderboardEntryDTO])
+async def most_rated_books(
+    days: int = Query(7, ge=1, le=365, description="Only count ratings from the last N days"),
+    limit: int = Query(10, ge=1, le=LEADERBOARD_SIZE),
+):
+    """Books with the most approved ratings in the last N days"""
+    return _board_response(await leaderboard_refresher.get(MOST_RATED, days), limit)
+
+
+@router.get("/most-borrowed", response_model=List[LeaderboardEntryDTO])
+async def most_borrowed_books(
+    days: int = Query(30, ge=1, le=365, description="Only count loans from the last N days"),
+    limit: int = Query(10, ge=1, le=LEADERBOARD_SIZE),
+):
+    """Books with the most physical and digital loans in the last N days"""
+    return _board_response(await leaderboard_refresher.get(MOST_BORROWED, days), limit)
@@ -10,7 +10,7 @@ from src.dto.loan_dto import (
     LoanStatus, PhysicalLoanDTO, PhysicalLoanCreateDTO, PhysicalLoanUpdateDTO,
     DigitalLoanDTO, DigitalLoanCreateDTO, DigitalLoanUpdateDTO
 )
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_database_session, create_read_database_session
 
 
 # ---------------- Physical Loan API ---------------- #
@@ -27,7 +27,7 @@ physical_loan_api.register_crud_routes()
 @physical_loan_api.router.get("/user/{user_id}", response_model=List[PhysicalLoanDTO])
 async def get_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     return await service.get_by_user(db, user_id)
@@ -36,7 +36,7 @@ async def get_by_user(
 @physical_loan_api.router.get("/book/{book_id}", response_model=List[PhysicalLoanDTO])
 async def get_by_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     return await service.get_by_book(db, book_id)
@@ -48,7 +48,7 @@ async def get_by_book(
 async def get_active_by_user_and_book(
     user_id: UUID,
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     loan = await service.get_active_by_user_and_book(db, user_id, book_id)
@@ -82,7 +82,7 @@ async def mark_overdue(
 @physical_loan_api.router.get("/status/{status}", response_model=List[PhysicalLoanDTO])
 async def get_by_status(
     status: LoanStatus,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     """Get all physical loans with a specific status"""
@@ -90,7 +90,7 @@ async def get_by_status(
 
 @physical_loan_api.router.get("/overdue", response_model=List[PhysicalLoanDTO])
 async def get_overdue_loans(
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     """Get all currently overdue physical loans"""
@@ -99,7 +99,7 @@ async def get_overdue_loans(
 @physical_loan_api.router.get("/active/user/{user_id}", response_model=List[PhysicalLoanDTO])
 async def get_active_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     """Get all active physical loans for a user"""
@@ -121,7 +121,7 @@ async def renew_loan(
 @physical_loan_api.router.get("/stats/user/{user_id}")
 async def get_user_loan_stats(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     """Get loan statistics for a specific user"""
@@ -137,7 +137,7 @@ async def get_user_loan_stats(
 async def get_loans_by_date_range(
     start_date: datetime,
     end_date: datetime,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
     """Get loans within a specific date range"""
@@ -149,9 +149,11 @@ async def bulk_return_loans(
     db: AsyncSession = Depends(create_database_session),
     service: PhysicalLoanService = Depends(PhysicalLoanService),
 ):
-    """Mark multiple loans as returned in bulk"""
-    results = await service.bulk_return_loans(db, loan_ids)
-    return {"processed": len(results), "results": results}
+    """Mark multiple loans as returned in bulk and free their physical copies"""
+    results, not_found, not_returnable = await service.bulk_return_loans(db, loan_ids)
+    return {
+        "processed": len(results), "results": results, "not_found": not_found, "not_returnable": not_returnable,
+    }
 
 
 # ---------------- Digital Loan API ---------------- #
@@ -168,7 +170,7 @@ digital_loan_api.register_crud_routes()
 @digital_loan_api.router.get("/user/{user_id}", response_model=List[DigitalLoanDTO])
 async def get_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     return await service.get_by_user(db, user_id)
@@ -177,7 +179,7 @@ async def get_by_user(
 @digital_loan_api.router.get("/book/{book_id}", response_model=List[DigitalLoanDTO])
 async def get_by_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     return await service.get_by_book(db, book_id)
@@ -189,7 +191,7 @@ async def get_by_book(
 async def get_active_by_user_and_book(
     user_id: UUID,
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     loan = await service.get_active_by_user_and_book(db, user_id, book_id)
@@ -212,7 +214,7 @@ async def mark_overdue(
 @digital_loan_api.router.get("/status/{status}", response_model=List[DigitalLoanDTO])
 async def get_by_status(
     status: LoanStatus,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     """Get all digital loans with a specific status"""
@@ -220,7 +222,7 @@ async def get_by_status(
 
 @digital_loan_api.router.get("/overdue", response_model=List[DigitalLoanDTO])
 async def get_overdue_loans(
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     """Get all currently overdue digital loans"""
@@ -229,7 +231,7 @@ async def get_overdue_loans(
 @digital_loan_api.router.get("/active/user/{user_id}", response_model=List[DigitalLoanDTO])
 async def get_active_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     """Get all active digital loans for a user"""
@@ -251,7 +253,7 @@ async def renew_loan(
 @digital_loan_api.router.get("/stats/user/{user_id}")
 async def get_user_loan_stats(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     """Get loan statistics for a specific user"""
@@ -267,7 +269,7 @@ async def get_user_loan_stats(
 async def get_loans_by_date_range(
     start_date: datetime,
     end_date: datetime,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: DigitalLoanService = Depends(DigitalLoanService),
 ):
     """Get loans within a specific date range"""
@@ -10,7 +10,7 @@ from src.dto.publisher_dto import (
     PublisherUpdateDTO,
     PublisherWithBooksDTO,
 )
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_read_database_session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -33,7 +33,7 @@ router = publisher_api.router
 @publisher_api.router.get("/by-name/", response_model=List[PublisherDTO])
 async def get_publishers_by_name(
     name: str = Query(..., description="Search publishers by (partial) name"),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PublisherService = Depends(get_publisher_service),
 ):
     return await service.get_by_name(db, name)
@@ -41,7 +41,7 @@ async def get_publishers_by_name(
 @publisher_api.router.get("/{publisher_id}/with-books", response_model=PublisherWithBooksDTO)
 async def get_publisher_with_books(
     publisher_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PublisherService = Depends(get_publisher_service),
 ):
     publisher = await service.get_with_books(db, publisher_id)
@@ -52,7 +52,7 @@ async def get_publisher_with_books(
 
 @publisher_api.router.get("/all/with-books", response_model=List[PublisherWithBooksDTO])
 async def get_all_publishers_with_books(
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: PublisherService = Depends(get_publisher_service),
 ):
     publishers = await service.get_all_with_books(db)
@@ -6,7 +6,7 @@ from uuid import UUID
 from src.api.library.base_api import BaseAPI
 from src.service.rating_service import RatingService
 from src.dto.rating_dto import RatingCreateDTO, RatingUpdateDTO, RatingDTO
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_database_session, create_read_database_session
 
 def get_rating_service() -> RatingService:
     return RatingService()
@@ -16,6 +16,7 @@ rating_api = BaseAPI[RatingCreateDTO, RatingUpdateDTO, RatingDTO, RatingService]
     prefix="/ratings",
     service_provider=get_rating_service,
     tags=["Rating"],
+    json_model=RatingDTO,
 )
 rating_api.register_crud_routes()
 
@@ -26,7 +27,7 @@ router = rating_api.router
 @router.get("/user/{user_id}", response_model=List[RatingDTO])
 async def get_ratings_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     return await service.get_by_user(db, user_id)
@@ -35,7 +36,7 @@ async def get_ratings_by_user(
 @router.get("/book/{book_id}", response_model=List[RatingDTO])
 async def get_ratings_by_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     return await service.get_by_book(db, book_id)
@@ -44,7 +45,7 @@ async def get_ratings_by_book(
 @router.get("/book/{book_id}/approved", response_model=List[RatingDTO])
 async def get_approved_ratings(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     return await service.get_approved(db, book_id)
@@ -56,7 +57,7 @@ async def approve_rating(
     service: RatingService = Depends(RatingService),
 ):
     """Approve a specific rating"""
-    rating = await service.get(db, onj_id=rating_id)
+    rating = await service.get(db, obj_id=rating_id)
     if not rating:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,7 +74,7 @@ async def reject_rating(
     service: RatingService = Depends(RatingService),
 ):
     """Reject (unapprove) a specific rating"""
-    rating = await service.get(db, onj_id=rating_id)
+    rating = await service.get(db, obj_id=rating_id)
     if not rating:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,7 +86,7 @@ async def reject_rating(
 
 @router.get("/pending/approval", response_model=List[RatingDTO])
 async def get_pending_approval_ratings(
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     """Get all ratings pending approval"""
@@ -95,7 +96,7 @@ async def get_pending_approval_ratings(
 @router.get("/user/{user_id}/approved", response_model=List[RatingDTO])
 async def get_approved_ratings_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     """Get approved ratings for a specific user"""
@@ -105,7 +106,7 @@ async def get_approved_ratings_by_user(
 @router.get("/user/{user_id}/pending", response_model=List[RatingDTO])
 async def get_pending_ratings_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     """Get pending approval ratings for a specific user"""
@@ -115,57 +116,26 @@ async def get_pending_ratings_by_user(
 @router.get("/book/{book_id}/average", response_model=dict)
 async def get_average_rating_for_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     """Get average rating and count for a specific book"""
-    ratings = await service.get_approved(db, book_id)
-    
-    if not ratings:
-        return {"book_id": book_id, "average_rating": 0, "total_ratings": 0}
-    
-    total_rating = sum(rating.rating for rating in ratings)
-    average_rating = total_rating / len(ratings)
-    
+    stats = await service.get_stats(db, book_id)
     return {
         "book_id": book_id,
-        "average_rating": round(average_rating, 2),
-        "total_ratings": len(ratings)
+        "average_rating": stats["average_rating"],
+        "total_ratings": stats["total_ratings"],
     }
 
 
 @router.get("/book/{book_id}/stats", response_model=dict)
 async def get_rating_stats_for_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RatingService = Depends(RatingService),
 ):
     """Get detailed rating statistics for a specific book"""
-    ratings = await service.get_approved(db, book_id)
-    
-    if not ratings:
-        return {
-            "book_id": book_id,
-            "average_rating": 0,
-            "total_ratings": 0,
-            "rating_distribution": {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        }
-    
-    total_rating = sum(rating.rating for rating in ratings)
-    average_rating = total_rating / len(ratings)
-    
-    # Count ratings by star value
-    distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for rating in ratings:
-        if 1 <= rating.rating <= 5:
-            distribution[rating.rating] += 1
-    
-    return {
-        "book_id": book_id,
-        "average_rating": round(average_rating, 2),
-        "total_ratings": len(ratings),
-        "rating_distribution": distribution
-    }
+    return await service.get_stats(db, book_id)
 
 
 @router.delete("/user/{user_id}/book/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -6,7 +6,7 @@ from uuid import UUID
 from src.api.library.base_api import BaseAPI
 from src.service.reservation_service import ReservationService
 from src.dto.reservation_dto import ReservationCreateDTO, ReservationStatus, ReservationUpdateDTO, ReservationDTO
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_database_session, create_read_database_session
 
 def get_reservation_service() -> ReservationService:
     return ReservationService()
@@ -27,7 +27,7 @@ router = reservation_api.router
 @router.get("/user/{user_id}", response_model=List[ReservationDTO])
 async def get_reservations_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(ReservationService),
 ):
     return await service.get_by_user(db, user_id)
@@ -36,7 +36,7 @@ async def get_reservations_by_user(
 @router.get("/book/{book_id}", response_model=List[ReservationDTO])
 async def get_reservations_by_book(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(ReservationService),
 ):
     return await service.get_by_book(db, book_id)
@@ -45,7 +45,7 @@ async def get_reservations_by_book(
 @router.get("/book/{book_id}/active", response_model=List[ReservationDTO])
 async def get_active_reservations(
     book_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(ReservationService),
 ):
     return await service.get_active(db, book_id)
@@ -55,7 +55,7 @@ async def get_active_reservations(
 async def get_queue_position(
     book_id: UUID,
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(ReservationService),
 ):
     return await service.get_queue_position(db, user_id, book_id)
@@ -63,7 +63,7 @@ async def get_queue_position(
 @router.get("/user/{user_id}/active", response_model=List[ReservationDTO])
 async def get_active_reservations_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(get_reservation_service),
 ):
     """Get all active reservations for a specific user"""
@@ -74,7 +74,7 @@ async def get_active_reservations_by_user(
 async def get_reservations_by_user_and_status(
     user_id: UUID,
     status: ReservationStatus,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(get_reservation_service),
 ):
     """Get reservations for a user filtered by status"""
@@ -85,7 +85,7 @@ async def get_reservations_by_user_and_status(
 async def get_reservations_by_book_and_status(
     book_id: UUID,
     status: ReservationStatus,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(get_reservation_service),
 ):
     """Get reservations for a book filtered by status"""
@@ -95,7 +95,7 @@ async def get_reservations_by_book_and_status(
 @router.get("/expiring-soon", response_model=List[ReservationDTO])
 async def get_expiring_soon_reservations(
     days: int = 7,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: ReservationService = Depends(get_reservation_service),
 ):
     """Get reservations that are expiring soon"""
@@ -127,7 +127,10 @@ async def create_bulk_reservations(
     db: AsyncSession = Depends(create_database_session),
     service: ReservationService = Depends(get_reservation_service),
 ):
-    """Create multiple reservations at once"""
+    """
+    Create multiple reservations at once in a single transaction.
+    Each reservation is appended to its book's queue; submitted positions are ignored.
+    """
     return await service.create_bulk(db, reservations)
 
 
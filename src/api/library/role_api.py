@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.library.base_api import BaseAPI
 from src.service.role_service import RoleService
 from src.dto.role_dto import RoleDTO, RoleCreateDTO, RoleUpdateDTO
-from src.utils.db_utils import create_database_session
+from src.utils.db_utils import create_read_database_session
 
 
 def get_role_service() -> RoleService:
@@ -27,7 +27,7 @@ router = role_api.router
 @role_api.router.get("/by-user/{user_id}", response_model=List[RoleDTO])
 async def get_roles_by_user(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: RoleService = Depends(get_role_service),
 ):
     roles = await service.get_by_user(db, user_id)
@@ -7,9 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.library.base_api import BaseAPI
 from src.service.user_service import UserService
 from src.dto.user_dto import UserDTO, UserCreateDTO, UserUpdateDTO
-from src.utils.db_utils import create_database_session
-from src.utils.security_utils import create_access_token, verify_password, verify_token  # Import token creation utility
-from src.dto.auth_dto import LoginRequest, TokenResponse  # Import auth DTOs
+from src.utils.db_utils import create_database_session, create_read_database_session
+from src.utils.security_utils import create_access_token, verify_password_async, verify_token  # Import token creation utility
+from src.dto.auth_dto import LoginRequest, PrincipalDTO, TokenResponse  # Import auth DTOs
+from src.api.dependencies import get_current_principal
 
 
 def get_user_service() -> UserService:
@@ -90,12 +91,19 @@ async def login(
         user=user
     )
 
+@router.get("/me", response_model=PrincipalDTO)
+async def get_me(principal: PrincipalDTO = Depends(get_current_principal)):
+    """
+    Return the authenticated caller's principal.
+    """
+    return principal
+
 @router.get("/search", response_model=List[UserDTO])
 async def search_users(
     search: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: UserService = Depends(get_user_service),
 ):
     users = await service.search_users(db, search_term=search, skip=skip, limit=limit)
@@ -107,7 +115,7 @@ async def search_users(
 @router.get("/by-username/{username}", response_model=UserDTO)
 async def get_user_by_username(
     username: str,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: UserService = Depends(get_user_service),
 ):
     user = await service.get_by_username(db, username=username)
@@ -119,7 +127,7 @@ async def get_user_by_username(
 @router.get("/by-email/{email}", response_model=UserDTO)
 async def get_user_by_email(
     email: str,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: UserService = Depends(get_user_service),
 ):
     user = await service.get_by_email(db, email=email)
@@ -131,7 +139,7 @@ async def get_user_by_email(
 @router.get("/by-phone/{phone}", response_model=UserDTO)
 async def get_user_by_phone(
     phone: str,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: UserService = Depends(get_user_service),
 ):
     user = await service.get_by_phone(db, phone=phone)
@@ -154,7 +162,7 @@ async def update_password(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
     # Verify current password
-    if not verify_password(password_data["current_password"], user.password_hash):
+    if not await verify_password_async(password_data["current_password"], user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect"
@@ -226,7 +234,7 @@ async def deactivate_user(
 @router.get("/{user_id}/profile", response_model=UserDTO)
 async def get_user_profile(
     user_id: UUID,
-    db: AsyncSession = Depends(create_database_session),
+    db: AsyncSession = Depends(create_read_database_session),
     service: UserService = Depends(get_user_service),
 ):
     """
@@ -0,0 +1,48 @@
+from fastapi import APIRouter
+
+from src.tasks.catalog_index import catalog_index
+from src.tasks.leaderboard_refresher import leaderboard_refresher
+from src.tasks.overdue_sweeper import overdue_sweeper
+from src.utils.db_utils import engine, replica_engine, get_pool_stats
+from src.utils.security_utils import password_hasher, token_cache, unknown_identity_cache
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/db-pool", response_model=dict)
+async def db_pool_metrics():
+    """Connection pool usage and checkout-wait statistics"""
+    stats = {"primary": get_pool_stats(engine)}
+    if replica_engine is not engine:
+        stats["replica"] = get_pool_stats(replica_engine)
+    return stats
+
+
+@router.get("/overdue-sweeper", response_model=dict)
+async def overdue_sweeper_metrics():
+    """Timings and counts of the background overdue loan sweeps"""
+    return overdue_sweeper.metrics()
+
+
+@router.get("/password-hasher", response_model=dict)
+async def password_hasher_metrics():
+    """Queue depth and throughput of the bcrypt worker pool"""
+    return password_hasher.metrics()
+
+
+@router.get("/auth-cache", response_model=dict)
+async def auth_cache_metrics():
+    """Size and hit rate of the verified-token and unknown-login caches"""
+    return {"tokens": token_cache.metrics(), "unknown_identities": unknown_identity_cache.metrics()}
+
+
+@router.get("/leaderboards", response_model=dict)
+async def leaderboard_metrics():
+    """Refresh timings and snapshot hit rate of the leaderboards"""
+    return leaderboard_refresher.metrics()
+
+
+@router.get("/autocomplete", response_model=dict)
+async def autocomplete_metrics():
+    """Size, rebuild timings and incremental updates of the autocomplete index"""
+    return catalog_index.metrics()
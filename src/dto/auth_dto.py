@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 from src.dto.user_dto import UserDTO
 
 
@@ -14,4 +15,9 @@ class TokenResponse(BaseModel):
 
 class PasswordChangeRequest(BaseModel):
     current_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=6, description="New password")
\ No newline at end of file
+    new_password: str = Field(..., min_length=6, description="New password")
+
+class PrincipalDTO(BaseModel):
+    user_id: UUID
+    roles: List[str] = []
+    is_active: bool
@@ -0,0 +1,11 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SuggestionDTO(BaseModel):
+    kind: Literal["book", "author"]
+    id: UUID
+    # Book title or author full name, as stored
+    label: str
@@ -42,3 +42,6 @@ class BookDTO(TimestampMixin):
     cover_image_url: Optional[str] = None
     publisher_id: UUID
     authors: List[AuthorBookLinkDTO]
+
+class BookSearchResultDTO(BookDTO):
+    rank: float
@@ -0,0 +1,12 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class LeaderboardEntryDTO(BaseModel):
+    rank: int
+    book_id: UUID
+    title: str
+    # The board's ranking metric: Bayesian average, ratings or loans in the window
+    score: float
+    count: int
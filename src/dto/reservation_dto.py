@@ -24,7 +24,8 @@ class ReservationCreateDTO(BaseModel):
     reservation_date: datetime
     expiration_date: datetime
     status: ReservationStatus = ReservationStatus.PENDING
-    position: int
+    # Computed from the book's queue when omitted, and always by bulk creates
+    position: Optional[int] = None
     user_id: Optional[UUID] = None
     book_id: Optional[UUID] = None
 
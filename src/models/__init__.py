@@ -12,6 +12,8 @@ from src.models.loan_physical_models import PhysicalLoansModel
 from src.models.rating_models import RatingModel
 from src.models.reservation_models import ReservationModel
 from src.models.relationship_models import book_category_table
+from src.models.book_rating_summary_models import BookRatingSummaryModel
+import src.models.book_search_models  # noqa: F401  search_vector indexes and triggers
 
 # Registry mapping table names -> model classes
 MODEL_REGISTRY = {
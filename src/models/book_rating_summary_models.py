@@ -0,0 +1,28 @@
+from sqlalchemy import Column, UUID, DateTime, ForeignKey, Integer
+from sqlalchemy.sql import func
+
+from src.utils.db_utils import Base
+
+# Star values with their own histogram column (star_1 .. star_5)
+RATING_STARS = range(1, 6)
+
+
+class BookRatingSummaryModel(Base):
+    """
+    Running totals of a book's approved ratings, maintained incrementally by
+    RatingRepository so rating statistics are a single-row read.
+    """
+    __tablename__ = "book_rating_summary"
+
+    book_id = Column(UUID, ForeignKey('books.id', ondelete="CASCADE"), primary_key=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    star_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    star_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    star_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    star_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    star_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<BookRatingSummary(book_id={self.book_id}, rating_count={self.rating_count}, rating_sum={self.rating_sum})>"
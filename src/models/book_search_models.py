@@ -0,0 +1,150 @@
+"""
+Full-text search support for books.
+
+books.search_vector is maintained by triggers, so it stays current however
+rows are written (API, CLI import or plain SQL):
+  * a BEFORE trigger on books computes it from the row itself,
+  * statement-level triggers on author_book and category_book refresh the
+    books whose links changed,
+  * statement-level triggers on author, publisher and category refresh the
+    books that mention a renamed author, publisher or category.
+A GIN index serves tsquery matches and a pg_trgm index on the title serves
+fuzzy (typo-tolerant) matches.
+"""
+from sqlalchemy import DDL, Index, event
+
+from settings import SEARCH_TEXT_CONFIG
+from src.models.books_models import BooksModel
+from src.utils.db_utils import Base
+
+Index("ix_books_search_vector", BooksModel.search_vector, postgresql_using="gin")
+Index(
+    "ix_books_title_trgm",
+    BooksModel.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
+
+# The trigram operator class must exist before the books indexes are created
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+_SEARCH_DDL = [
+    # Weighted document: title (A), authors (B), publisher and categories (C), description (D)
+    f"""
+    CREATE OR REPLACE FUNCTION books_search_document(uuid, text, text, uuid)
+    RETURNS tsvector LANGUAGE sql STABLE AS $$
+        SELECT
+            setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce($2, '')), 'A')
+            || setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce((
+                SELECT string_agg(a.first_name || ' ' || a.last_name, ' ')
+                FROM author_book ab JOIN author a ON a.id = ab.author_id
+                WHERE ab.book_id = $1), '')), 'B')
+            || setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce((
+                SELECT p.name FROM publisher p WHERE p.id = $4), '')), 'C')
+            || setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce((
+                SELECT string_agg(c.name, ' ')
+                FROM category_book cb JOIN category c ON c.id = cb.category_id
+                WHERE cb.book_id = $1), '')), 'C')
+            || setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce($3, '')), 'D')
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION books_search_refresh(uuid[])
+    RETURNS void LANGUAGE sql AS $$
+        UPDATE books SET search_vector = books_search_document(id, title, description, publisher_id)
+        WHERE id = ANY($1)
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION books_search_vector_trigger()
+    RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := books_search_document(NEW.id, NEW.title, NEW.description, NEW.publisher_id);
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER books_search_vector
+    BEFORE INSERT OR UPDATE OF title, description, publisher_id ON books
+    FOR EACH ROW EXECUTE FUNCTION books_search_vector_trigger()
+    """,
+    # Link tables: refresh every book whose author/category links changed in the statement
+    """
+    CREATE OR REPLACE FUNCTION books_search_links_changed()
+    RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM books_search_refresh(ARRAY(SELECT DISTINCT book_id FROM new_rows));
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM books_search_refresh(ARRAY(SELECT DISTINCT book_id FROM old_rows));
+        ELSE
+            PERFORM books_search_refresh(ARRAY(
+                SELECT book_id FROM new_rows UNION SELECT book_id FROM old_rows));
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    # Renames: refresh the books mentioning an author, publisher or category whose name changed
+    """
+    CREATE OR REPLACE FUNCTION books_search_names_changed()
+    RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_TABLE_NAME = 'author' THEN
+            PERFORM books_search_refresh(ARRAY(
+                SELECT DISTINCT ab.book_id
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                JOIN author_book ab ON ab.author_id = n.id
+                WHERE (n.first_name, n.last_name) IS DISTINCT FROM (o.first_name, o.last_name)));
+        ELSIF TG_TABLE_NAME = 'publisher' THEN
+            PERFORM books_search_refresh(ARRAY(
+                SELECT b.id
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                JOIN books b ON b.publisher_id = n.id
+                WHERE n.name IS DISTINCT FROM o.name));
+        ELSE
+            PERFORM books_search_refresh(ARRAY(
+                SELECT DISTINCT cb.book_id
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                JOIN category_book cb ON cb.category_id = n.id
+                WHERE n.name IS DISTINCT FROM o.name));
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+]
+
+# Transition tables allow only one event per trigger, hence one trigger per operation
+for _table in ("author_book", "category_book"):
+    _SEARCH_DDL += [
+        f"""
+        CREATE TRIGGER {_table}_search_insert AFTER INSERT ON {_table}
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION books_search_links_changed()
+        """,
+        f"""
+        CREATE TRIGGER {_table}_search_update AFTER UPDATE ON {_table}
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION books_search_links_changed()
+        """,
+        f"""
+        CREATE TRIGGER {_table}_search_delete AFTER DELETE ON {_table}
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION books_search_links_changed()
+        """,
+    ]
+
+for _table in ("author", "publisher", "category"):
+    _SEARCH_DDL.append(
+        f"""
+        CREATE TRIGGER {_table}_search_rename AFTER UPDATE ON {_table}
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION books_search_names_changed()
+        """
+    )
+
+# Functions and triggers reference several tables, so create them once all tables exist
+for _statement in _SEARCH_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement))
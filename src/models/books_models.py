@@ -1,6 +1,7 @@
 import uuid
 from sqlalchemy import Column, UUID, DateTime, ForeignKey, Integer, String, text
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship, Mapped
 from src.utils.db_utils import Base
 from src.models.mixin import TimestampMixin
 from src.models.relationship_models import book_category_table
@@ -26,6 +27,10 @@ class BooksModel(Base, TimestampMixin):
     # Foreign key
     publisher_id = Column(UUID, ForeignKey('publisher.id'))
 
+    # Full-text document over title, authors, publisher, categories and description,
+    # kept current by the triggers in book_search_models.py
+    search_vector = deferred(Column(TSVECTOR))
+
     # Relationship
     reservation = relationship("ReservationModel", back_populates="books")
     rating = relationship("RatingModel", back_populates="books")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, UUID, DateTime, ForeignKey, String
+from sqlalchemy import Column, UUID, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 from src.models.loan_models import LoansModel
 from src.utils.db_utils import Base
@@ -16,4 +16,8 @@ class DigitalLoansModel(Base, LoansModel):
     books = relationship("BooksDigitalModel", back_populates="digital_loan")
     
     def __repr__(self):
-        return f"<Book"
\ No newline at end of file
+        return f"<Book"
+
+
+# Lets the overdue sweeper find CHECKOUT loans past due without a full scan
+Index("ix_digital_loan_status_due_date", DigitalLoansModel.status, DigitalLoansModel.due_date)
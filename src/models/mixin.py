@@ -1,4 +1,5 @@
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index
+from sqlalchemy.orm import declared_attr
 from sqlalchemy.sql import func
 class TimestampMixin:
     """Mixin that adds timestamp columns to a model."""
@@ -9,4 +10,9 @@ class TimestampMixin:
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False
-    )
\ No newline at end of file
+    )
+
+    @declared_attr
+    def __table_args__(cls):
+        # Composite index backing keyset pagination over (created_at, id)
+        return (Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),)
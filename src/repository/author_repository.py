@@ -1,6 +1,7 @@
 # src/repositories/author_repository.py
 from typing import Any, List, Optional
 from uuid import UUID
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -32,11 +33,14 @@ class AuthorRepository(BaseRepository[AuthorModel, AuthorCreateDTO, AuthorUpdate
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[AuthorDTO]:
         """Get an author by ID with eager-loaded books."""
-        result = await db.execute(
-            select(self.model)
+        stmt = self._statement(
+            "get",
+            lambda: select(self.model)
             .options(selectinload(self.model.books))
-            .filter(self.model.id == id)
+            .filter(self.model.id == bindparam("id")),
+            prepare=True,
         )
+        result = await db.execute(stmt, {"id": id})
         return self._model_to_dto(result.scalars().first())
 
     async def get_multi(
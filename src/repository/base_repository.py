@@ -1,20 +1,37 @@
 # src/repositories/base.py
-from typing import Type, TypeVar, Generic, Optional, List, Any, Dict
+from typing import AsyncIterator, Callable, Type, TypeVar, Generic, Optional, List, Any, Dict, Tuple
 from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, insert, inspect, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from uuid import UUID
+from sqlalchemy.orm import MANYTOMANY, ONETOMANY, selectinload
+from sqlalchemy.sql import Executable
+from uuid import UUID, uuid4
+
+from src.utils.dto_utils import construct_dtos, dto_projection
+from src.utils.pagination_utils import decode_cursor, encode_cursor
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
+# Prebuilt statements shared by every instance, keyed by (repository class, model, name)
+_STATEMENTS: Dict[Tuple[type, Any, str], Executable] = {}
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, SchemaType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
         self.eager_loads = getattr(model, '__eager_loads__', [])
+        # Relationships loaded after writes; BaseService narrows this to what its DTO exposes
+        self.load_on_write: List[str] = []
+        mapper = inspect(model)
+        self.column_keys = set(mapper.column_attrs.keys())
+        # Deleting a parent row lets the ORM null out / unlink its children first,
+        # so only leaf models can be deleted with a single DELETE statement
+        self.single_statement_delete = not any(
+            rel.direction in (ONETOMANY, MANYTOMANY) for rel in mapper.relationships
+        )
 
     def _apply_eager_loads(self, query):
         """Apply eager loading options to query"""
@@ -22,12 +39,42 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Sche
             query = query.options(selectinload(getattr(self.model, relationship)))
         return query
 
-    async def get(self, db: AsyncSession, id: UUID) -> Optional[SchemaType]:
-        query = select(self.model).filter(self.model.id == id)
-        query = self._apply_eager_loads(query)
-        result = await db.execute(query)
+    def _statement(self, name: str, build: Callable[[], Executable], *, prepare: bool = False) -> Executable:
+        """
+        Return the statement registered under `name`, building it on first use.
+        Statements take their values as bindparams at execute time, so the same
+        construct (and its compiled SQL) is reused by every call. `prepare=True`
+        marks hot lookups for psycopg server-side preparation, see DB_PREPARED_STATEMENTS.
+        """
+        key = (type(self), self.model, name)
+        stmt = _STATEMENTS.get(key)
+        if stmt is None:
+            stmt = build()
+            if prepare:
+                stmt = stmt.execution_options(psycopg_prepare=True)
+            _STATEMENTS[key] = stmt
+        return stmt
+
+    def _get_by_id_statement(self, eager: bool = True) -> Executable:
+        """Prebuilt primary key lookup, taking the id as the `id` bindparam"""
+        def build():
+            query = select(self.model).where(self.model.id == bindparam("id"))
+            return self._apply_eager_loads(query) if eager else query
+
+        return self._statement("get" if eager else "get_plain", build, prepare=True)
+
+    async def _get_by_id(self, db: AsyncSession, id: UUID, *, eager: bool = True) -> Optional[ModelType]:
+        """Fetch one row by primary key through the prebuilt lookup statement"""
+        result = await db.execute(self._get_by_id_statement(eager), {"id": id})
         return result.scalars().first()
 
+    def _keyset_columns(self):
+        """Indexed (created_at, id) sort key used for keyset pagination"""
+        return self.model.created_at, self.model.id
+
+    async def get(self, db: AsyncSession, id: UUID) -> Optional[SchemaType]:
+        return await self._get_by_id(db, id)
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -43,6 +90,61 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Sche
                 query = query.where(getattr(self.model, field) == value)
         result = await db.execute(query)
         return result.scalars().all()
+
+    async def get_multi_dto(
+        self,
+        db: AsyncSession,
+        dto: Type[SchemaType],
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[SchemaType]:
+        """
+        Get a page as DTOs built straight from Core rows of the DTO's columns,
+        bypassing ORM instances and per-row validation. Only for DTOs whose
+        fields are all plain columns, see dto_projection.
+        """
+        columns, converters = dto_projection(self.model, dto)
+        query = select(*columns).offset(skip).limit(limit)
+        if filters:
+            for field, value in filters.items():
+                query = query.where(getattr(self.model, field) == value)
+        result = await db.execute(query)
+        return construct_dtos(dto, result, converters)
+
+    async def get_multi_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Get a page of rows ordered by (created_at, id), starting after `cursor`.
+        Returns the raw rows and the cursor of the next page (None on the last page).
+        """
+        created_col, id_col = self._keyset_columns()
+        query = select(self.model)
+        query = self._apply_eager_loads(query)
+        if filters:
+            for field, value in filters.items():
+                query = query.where(getattr(self.model, field) == value)
+        if cursor:
+            last_created_at, last_id = decode_cursor(cursor)
+            query = query.where(tuple_(created_col, id_col) > tuple_(last_created_at, last_id))
+        # Fetch one extra row to know whether another page exists
+        query = query.order_by(created_col, id_col).limit(limit + 1)
+
+        result = await db.execute(query)
+        objs = result.scalars().all()
+        if len(objs) <= limit:
+            return objs, None
+
+        objs = objs[:limit]
+        last = objs[-1]
+        return objs, encode_cursor(last.created_at, last.id)
     
     async def get_all(
         self,
@@ -58,24 +160,112 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Sche
         result = await db.execute(query)
         return result.scalars().all()
 
-    async def create(self, db: AsyncSession, obj_in: Any) -> ModelType:
-        # FIX: Handle both dict and Pydantic model inputs
-        if hasattr(obj_in, 'model_dump'):
-            # It's a Pydantic model (v2)
-            obj_data = obj_in.model_dump(exclude_unset=True)
-        elif hasattr(obj_in, 'dict'):
-            # It's a Pydantic model (v1)
-            obj_data = obj_in.dict(exclude_unset=True)
-        else:
+    async def stream_all(
+        self,
+        db: AsyncSession,
+        *,
+        batch_size: int = 500,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over every row through a server-side cursor, fetching `batch_size`
+        rows at a time so memory stays bounded regardless of table size.
+        """
+        query = select(self.model)
+        query = self._apply_eager_loads(query)
+        if filters:
+            for field, value in filters.items():
+                query = query.where(getattr(self.model, field) == value)
+        query = query.execution_options(yield_per=batch_size)
+
+        result = await db.stream(query)
+        try:
+            async for obj in result.scalars():
+                yield obj
+        finally:
+            await result.close()
+
+    def _dump(self, obj_in: Any, *, create: bool = False) -> Dict[str, Any]:
+        """
+        Turn a DTO or dict into a plain dict. Updates take only the fields the
+        client sent; creates also keep non-null DTO defaults (default_factory
+        ids, default statuses) so they are not left to the database.
+        """
+        if not hasattr(obj_in, 'model_dump'):
             # It's already a dictionary
-            obj_data = obj_in
-            
-        db_obj = self.model(**obj_data)
-        db.add(db_obj)
+            return dict(obj_in)
+        obj_data = obj_in.model_dump(exclude_none=True) if create else {}
+        obj_data.update(obj_in.model_dump(exclude_unset=True))
+        return obj_data
+
+    def _column_values(self, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Keep the column values of a payload. Relationship payloads cannot be
+        written by a plain INSERT/UPDATE, so they are rejected before any SQL
+        runs rather than silently dropped.
+        """
+        payloads = sorted(
+            field for field, value in obj_data.items()
+            if field not in self.column_keys and value not in (None, [], {})
+        )
+        if payloads:
+            raise ValueError(f"{self.model.__name__} cannot write {', '.join(payloads)} in this request")
+        return {field: value for field, value in obj_data.items() if field in self.column_keys}
+
+    def _to_values(self, obj_in: Any, *, create: bool = False) -> Dict[str, Any]:
+        values = self._column_values(self._dump(obj_in, create=create))
+        if create and "id" in self.column_keys:
+            values.setdefault("id", uuid4())
+        return values
+
+    def relationships_needed_by(self, dto: Optional[Type[BaseModel]]) -> List[str]:
+        """The eager relationships a response DTO actually exposes"""
+        return [name for name in self.eager_loads if dto is not None and name in dto.model_fields]
+
+    async def _load_relationships(self, db: AsyncSession, db_objs: List[ModelType]) -> None:
+        """
+        Load the relationships RETURNING cannot populate, in one selectinload
+        query, and only those the service's DTO needs (see load_on_write).
+        """
+        if self.load_on_write and db_objs:
+            await db.execute(
+                select(self.model)
+                .where(self.model.id.in_([db_obj.id for db_obj in db_objs]))
+                .options(*[selectinload(getattr(self.model, name)) for name in self.load_on_write])
+                .execution_options(populate_existing=True)
+            )
+
+    async def _insert_many(self, db: AsyncSession, objs_in: List[Any]) -> List[ModelType]:
+        """
+        Multi-row INSERT ... RETURNING without committing, results in payload
+        order. Ids are generated client-side, so rows are matched back by id
+        instead of asking SQLAlchemy to sort (which falls back to one INSERT
+        per row when the key comes from the server).
+        """
+        rows = [self._to_values(obj_in, create=True) for obj_in in objs_in]
+        result = await db.execute(insert(self.model).returning(self.model), rows)
+        by_id = {db_obj.id: db_obj for db_obj in result.scalars().all()}
+        return [by_id[row["id"]] for row in rows]
+
+    async def create(self, db: AsyncSession, obj_in: Any) -> ModelType:
+        """Insert a row with INSERT ... RETURNING so server defaults come back without a refresh"""
+        result = await db.execute(
+            insert(self.model).values(**self._to_values(obj_in, create=True)).returning(self.model)
+        )
+        db_obj = result.scalars().one()
         await db.commit()
-        await db.refresh(db_obj)
+        await self._load_relationships(db, [db_obj])
         return db_obj
 
+    async def create_bulk(self, db: AsyncSession, objs_in: List[Any]) -> List[ModelType]:
+        """Insert many rows in one multi-row INSERT ... RETURNING, in payload order"""
+        if not objs_in:
+            return []
+        db_objs = await self._insert_many(db, objs_in)
+        await db.commit()
+        await self._load_relationships(db, db_objs)
+        return db_objs
+
     async def update(
         self, 
         db: AsyncSession,
@@ -83,21 +273,35 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Sche
         id: UUID, 
         obj_in: UpdateSchemaType | Dict[str, Any]
     ) -> Optional[SchemaType]:
-        result = await db.execute(select(self.model).filter(self.model.id == id))
+        """Update a row with a single UPDATE ... RETURNING statement"""
+        values = self._to_values(obj_in)
+        if not values:
+            return await self.get(db, id=id)
+
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+        )
         db_obj = result.scalars().first()
         if not db_obj:
             return None
-            
-        obj_data = obj_in.dict(exclude_unset=True) if isinstance(obj_in, BaseModel) else obj_in
-        for field, value in obj_data.items():
-            setattr(db_obj, field, value)
-            
-        db.add(db_obj)
+
         await db.commit()
-        await db.refresh(db_obj)
+        await self._load_relationships(db, [db_obj])
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: UUID) -> bool:
+        if self.single_statement_delete:
+            result = await db.execute(
+                delete(self.model).where(self.model.id == id).returning(self.model.id)
+            )
+            if result.first() is None:
+                return False
+            await db.commit()
+            return True
+
         result = await db.execute(select(self.model).filter(self.model.id == id))
         db_obj = result.scalars().first()
         if not db_obj:
@@ -105,4 +309,4 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Sche
             
         await db.delete(db_obj)
         await db.commit()
-        return True
\ No newline at end of file
+        return True
@@ -15,6 +15,7 @@ from src.dto.book_digital_dto import (
     BookStatus
 )
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import model_to_dto
 
 
 class BooksDigitalRepository(
@@ -25,12 +26,11 @@ class BooksDigitalRepository(
 
     def _model_to_dto(self, db_obj: BooksDigitalModel) -> Optional[BooksDigitalDTO]:
         """Convert SQLAlchemy model to DTO."""
-        return BooksDigitalDTO.from_orm(db_obj) if db_obj else None
+        return model_to_dto(BooksDigitalDTO, db_obj)
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[BooksDigitalDTO]:
         """Get a single digital book by ID."""
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return self._model_to_dto(result.scalars().first())
+        return self._model_to_dto(await self._get_by_id(db, id, eager=False))
 
     async def get_multi(
         self,
@@ -1,6 +1,7 @@
 # src/repositories/books_physical_repository.py
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Set
 from uuid import UUID
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -12,6 +13,7 @@ from src.dto.book_physical_dto import (
 )
 from src.models.relationship_models import BookStatus
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import model_to_dto
 
 
 class BooksPhysicalRepository(
@@ -22,12 +24,11 @@ class BooksPhysicalRepository(
 
     def _model_to_dto(self, db_obj: BooksPhysicalModel) -> Optional[BooksPhysicalDTO]:
         """Convert SQLAlchemy model to DTO."""
-        return BooksPhysicalDTO.from_orm(db_obj) if db_obj else None
+        return model_to_dto(BooksPhysicalDTO, db_obj)
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[BooksPhysicalDTO]:
         """Get a single physical book by ID."""
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return self._model_to_dto(result.scalars().first())
+        return self._model_to_dto(await self._get_by_id(db, id, eager=False))
 
     async def get_multi(
         self,
@@ -49,9 +50,21 @@ class BooksPhysicalRepository(
 
     async def get_by_barcode(self, db: AsyncSession, barcode: str) -> Optional[BooksPhysicalDTO]:
         """Find a physical book by barcode."""
-        result = await db.execute(select(self.model).filter(self.model.barcode == barcode))
+        stmt = self._statement(
+            "get_by_barcode",
+            lambda: select(self.model).filter(self.model.barcode == bindparam("barcode")),
+            prepare=True,
+        )
+        result = await db.execute(stmt, {"barcode": barcode})
         return self._model_to_dto(result.scalars().first())
 
+    async def get_existing_barcodes(self, db: AsyncSession, barcodes: List[str]) -> Set[str]:
+        """Return which of the given barcodes are already taken."""
+        if not barcodes:
+            return set()
+        result = await db.execute(select(self.model.barcode).filter(self.model.barcode.in_(barcodes)))
+        return set(result.scalars().all())
+
     async def get_by_book_id(self, db: AsyncSession, book_id: UUID) -> List[BooksPhysicalDTO]:
         """Get all physical copies of a given book."""
         result = await db.execute(select(self.model).filter(self.model.book_id == book_id))
@@ -60,7 +73,7 @@ class BooksPhysicalRepository(
     async def get_by_status(self, db: AsyncSession, status: BookStatus) -> List[BooksPhysicalDTO]:
         query = select(self.model).where(self.model.status == status)
         result = await db.execute(query)
-        return [self.response_model.from_orm(row) for row in result.scalars().all()]
+        return [self._model_to_dto(row) for row in result.scalars().all()]
 
     async def get_available_by_book_id(self, db: AsyncSession, book_id: UUID) -> List[BooksPhysicalDTO]:
         query = select(self.model).where(
@@ -68,4 +81,4 @@ class BooksPhysicalRepository(
             self.model.status == BookStatus.AVAILABLE
         )
         result = await db.execute(query)
-        return [self.response_model.from_orm(row) for row in result.scalars().all()]
\ No newline at end of file
+        return [self._model_to_dto(row) for row in result.scalars().all()]
\ No newline at end of file
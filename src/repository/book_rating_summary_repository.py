@@ -0,0 +1,81 @@
+# src/repositories/book_rating_summary_repository.py
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import delete, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.models.book_rating_summary_models import BookRatingSummaryModel, RATING_STARS
+from src.models.rating_models import RatingModel
+
+STAR_COLUMNS = [f"star_{star}" for star in RATING_STARS]
+COUNTER_COLUMNS = ["rating_count", "rating_sum", *STAR_COLUMNS]
+
+
+class BookRatingSummaryRepository:
+    """
+    Reads and maintains the per-book rating totals. Incremental writes join
+    the caller's transaction, so the rating change and its summary delta
+    commit together.
+    """
+
+    def __init__(self):
+        self.model = BookRatingSummaryModel
+
+    async def get(self, db: AsyncSession, book_id: UUID) -> Optional[BookRatingSummaryModel]:
+        result = await db.execute(select(self.model).where(self.model.book_id == book_id))
+        return result.scalars().first()
+
+    async def apply(self, db: AsyncSession, changes: Iterable[Tuple[Optional[UUID], int, int]]) -> None:
+        """
+        Fold (book_id, rating, sign) changes into the summaries with one upsert:
+        sign is +1 when an approved rating appears and -1 when one disappears.
+        Does not commit.
+        """
+        deltas: Dict[UUID, Dict[str, int]] = {}
+        for book_id, rating, sign in changes:
+            if book_id is None:
+                continue
+            delta = deltas.setdefault(book_id, dict.fromkeys(COUNTER_COLUMNS, 0))
+            delta["rating_count"] += sign
+            delta["rating_sum"] += sign * rating
+            if rating in RATING_STARS:
+                delta[f"star_{rating}"] += sign
+        deltas = {book_id: delta for book_id, delta in deltas.items() if any(delta.values())}
+        if not deltas:
+            return
+
+        # Upsert in book_id order so concurrent writers lock rows in the same order
+        stmt = pg_insert(self.model).values(
+            [{"book_id": book_id, **deltas[book_id]} for book_id in sorted(deltas)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.book_id],
+            set_={
+                **{column: getattr(self.model, column) + getattr(stmt.excluded, column) for column in COUNTER_COLUMNS},
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Recompute every summary from the approved ratings in one transaction"""
+        approved = (
+            select(
+                RatingModel.book_id,
+                func.count().label("rating_count"),
+                func.sum(RatingModel.rating).label("rating_sum"),
+                *[func.count().filter(RatingModel.rating == star).label(f"star_{star}") for star in RATING_STARS],
+            )
+            .where(RatingModel.is_approved.is_(True), RatingModel.book_id.is_not(None))
+            .group_by(RatingModel.book_id)
+        )
+        await db.execute(delete(self.model))
+        # The driver reports rowcount -1 for INSERT ... SELECT, so count the returned keys
+        result = await db.execute(
+            insert(self.model).from_select(["book_id", *COUNTER_COLUMNS], approved).returning(self.model.book_id)
+        )
+        rebuilt = len(result.all())
+        await db.commit()
+        return rebuilt
@@ -1,46 +1,103 @@
 # src/repositories/book_repository.py
-from typing import Any, List, Optional
-from uuid import UUID
-from sqlalchemy import func
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import bindparam, cast, delete, func, insert, or_, update
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from src.models.author_books_models import AuthorBookModel
 from src.models.author_models import AuthorModel
 from src.models.books_models import BooksModel
-from src.dto.book_dto import BookCreateDTO, BookUpdateDTO, BookDTO, AuthorBookLinkDTO
+from settings import SEARCH_TEXT_CONFIG
+from src.dto.book_dto import BookCreateDTO, BookUpdateDTO, BookDTO, AuthorBookLinkDTO, BookSearchResultDTO
 from src.repository.base_repository import BaseRepository
 
 
 class BookRepository(BaseRepository[BooksModel, BookCreateDTO, BookUpdateDTO, BookDTO]):
     def __init__(self):
         super().__init__(BooksModel)
+        # BookDTO authors come from _author_links per page, not the ORM relationship
+        self.eager_loads = []
 
-    def _model_to_dto(self, db_obj: BooksModel) -> Optional[BookDTO]:
-        """Convert SQLAlchemy model instance to Pydantic DTO, including authors."""
-        if not db_obj:
-            return None
-        dto_data = db_obj.__dict__.copy()
+    async def get(self, db: AsyncSession, id: UUID) -> Optional[BookDTO]:
+        """Get a single book by ID, with its author links."""
+        stmt = self._statement(
+            "get",
+            lambda: select(*self._book_columns()).filter(self.model.id == bindparam("id")),
+            prepare=True,
+        )
+        rows = (await db.execute(stmt, {"id": id})).all()
+        return next(iter(await self._with_authors(db, rows)), None)
 
-        # Map authors relationship to AuthorBookLinkDTO list
-        dto_data["authors"] = [
-            AuthorBookLinkDTO(
-                author_id=link.author_id,
-                primary_author=link.primary_author
-            )
-            for link in getattr(db_obj, "authors", [])
+    def _book_columns(self) -> list:
+        return [getattr(self.model, name).label(name) for name in BookDTO.model_fields if name != "authors"]
+
+    @staticmethod
+    def _link_dicts(authors) -> List[dict]:
+        return [link.model_dump() if hasattr(link, "model_dump") else dict(link) for link in authors or []]
+
+    async def _replace_author_links(self, db: AsyncSession, book_authors: dict) -> None:
+        """Write each book's author links (book_id -> [link dicts]), replacing existing ones"""
+        await db.execute(delete(AuthorBookModel).where(AuthorBookModel.book_id.in_(list(book_authors))))
+        links = [
+            {"book_id": book_id, "author_id": link["author_id"], "primary_author": link["primary_author"]}
+            for book_id, authors in book_authors.items() for link in authors
         ]
-        return BookDTO(**dto_data)
+        if links:
+            await db.execute(insert(AuthorBookModel), links)
 
-    async def get(self, db: AsyncSession, id: UUID) -> Optional[BookDTO]:
-        """Get a single book by ID, eager-loading authors."""
-        result = await db.execute(
-            select(self.model)
-            .options(selectinload(self.model.authors))
-            .filter(self.model.id == id)
+    def _book_dto(self, row, authors: List[dict]) -> BookDTO:
+        return BookDTO.model_construct(
+            set(BookDTO.model_fields), **row._mapping,
+            authors=[AuthorBookLinkDTO.model_construct(**link) for link in authors],
         )
-        return self._model_to_dto(result.scalars().first())
+
+    async def create(self, db: AsyncSession, obj_in: Any) -> BookDTO:
+        """Insert a book and its author links in one transaction"""
+        return (await self.create_bulk(db, [obj_in]))[0]
+
+    async def create_bulk(self, db: AsyncSession, objs_in: List[Any]) -> List[BookDTO]:
+        """Insert books with one multi-row INSERT ... RETURNING and their author links with another"""
+        if not objs_in:
+            return []
+        payloads = [self._dump(obj_in, create=True) for obj_in in objs_in]
+        book_authors = [self._link_dicts(payload.pop("authors", None)) for payload in payloads]
+        rows = [self._column_values(payload) for payload in payloads]
+        for row in rows:
+            row.setdefault("id", uuid4())
+
+        result = await db.execute(insert(self.model.__table__).returning(*self._book_columns()), rows)
+        by_id = {book.id: book for book in result.all()}
+        await self._replace_author_links(db, {row["id"]: authors for row, authors in zip(rows, book_authors)})
+        await db.commit()
+        return [self._book_dto(by_id[row["id"]], authors) for row, authors in zip(rows, book_authors)]
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        id: UUID,
+        obj_in: BookUpdateDTO | dict[str, Any]
+    ) -> Optional[BookDTO]:
+        """Update a book's columns and, when sent, replace its author links, in one transaction"""
+        payload = self._dump(obj_in)
+        authors = payload.pop("authors", None)
+        values = self._column_values(payload)
+        if values:
+            query = update(self.model).where(self.model.id == id).values(**values).returning(*self._book_columns())
+        else:
+            query = select(*self._book_columns()).where(self.model.id == id)
+        book = (await db.execute(query)).first()
+        if book is None:
+            return None
+        if authors is not None:
+            authors = self._link_dicts(authors)
+            await self._replace_author_links(db, {id: authors})
+        else:
+            authors = [link.model_dump() for link in (await self._author_links(db, [id])).get(id, [])]
+        await db.commit()
+        return self._book_dto(book, authors)
 
     async def get_multi(
         self,
@@ -50,24 +107,140 @@ class BookRepository(BaseRepository[BooksModel, BookCreateDTO, BookUpdateDTO, Bo
         limit: int = 100,
         filters: Optional[dict[str, Any]] = None
     ) -> List[BookDTO]:
-        """Get multiple books, eager-loading authors."""
-        query = select(self.model).options(selectinload(self.model.authors))
+        """Get multiple books with their author links."""
+        return await self.get_multi_dto(db, skip=skip, limit=limit, filters=filters)
+
+    async def _author_links(self, db: AsyncSession, book_ids: List[UUID]) -> dict:
+        """Author links of the given books in one query, as book_id -> [AuthorBookLinkDTO]"""
+        links: dict = {}
+        if book_ids:
+            link_rows = await db.execute(
+                select(AuthorBookModel.book_id, AuthorBookModel.author_id, AuthorBookModel.primary_author)
+                .where(AuthorBookModel.book_id.in_(book_ids))
+            )
+            for link in link_rows:
+                links.setdefault(link.book_id, []).append(
+                    AuthorBookLinkDTO.model_construct(author_id=link.author_id, primary_author=link.primary_author)
+                )
+        return links
+
+    async def _with_authors(self, db: AsyncSession, books: List[Any]) -> List[BookDTO]:
+        """BookDTOs for a batch of books (ORM objects or Core rows), their author links fetched in one query"""
+        links = await self._author_links(db, [book.id for book in books])
+        columns = [name for name in BookDTO.model_fields if name != "authors"]
+        fields_set = set(BookDTO.model_fields)
+        return [
+            BookDTO.model_construct(
+                fields_set, **{name: getattr(book, name) for name in columns}, authors=links.get(book.id, [])
+            )
+            for book in books
+        ]
+
+    async def get_multi_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[BookDTO], Optional[str]]:
+        """Keyset page of BookDTOs, with the page's author links loaded as in get_multi_dto"""
+        books, next_cursor = await super().get_multi_keyset(db, cursor=cursor, limit=limit, filters=filters)
+        return await self._with_authors(db, books), next_cursor
+
+    async def get_all(self, db: AsyncSession, *, filters: Optional[Dict[str, Any]] = None) -> List[BookDTO]:
+        return await self._with_authors(db, await super().get_all(db, filters=filters))
+
+    async def stream_all(
+        self,
+        db: AsyncSession,
+        *,
+        batch_size: int = 500,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[BookDTO]:
+        """
+        Stream every book as a BookDTO through a server-side cursor. Each
+        yield_per batch of Core rows gets its author links in one query.
+        """
+        query = select(*self._book_columns())
+        if filters:
+            for field, value in filters.items():
+                query = query.where(getattr(self.model, field) == value)
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        try:
+            async for rows in result.partitions():
+                for book in await self._with_authors(db, rows):
+                    yield book
+        finally:
+            await result.close()
+
+    async def get_multi_dto(
+        self,
+        db: AsyncSession,
+        dto=BookDTO,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[dict[str, Any]] = None
+    ) -> List[BookDTO]:
+        """
+        Get a page of BookDTOs from Core rows: the book columns in one query and
+        their author links in a second, built with model_construct.
+        """
+        columns = [getattr(self.model, name).label(name) for name in dto.model_fields if name != "authors"]
+        query = select(*columns)
         if filters:
             for field, value in filters.items():
                 query = query.where(getattr(self.model, field) == value)
         query = query.offset(skip).limit(limit)
+        rows = (await db.execute(query)).all()
+        links = await self._author_links(db, [row.id for row in rows])
 
-        result = await db.execute(query)
-        return [self._model_to_dto(row) for row in result.scalars().all()]
+        fields_set = set(dto.model_fields)
+        return [
+            dto.model_construct(fields_set, **row._mapping, authors=links.get(row.id, []))
+            for row in rows
+        ]
 
-    async def get_by_isbn(self, db: AsyncSession, isbn: str) -> Optional[BookDTO]:
-        """Find a book by its ISBN, eager-loading authors."""
-        result = await db.execute(
-            select(self.model)
-            .options(selectinload(self.model.authors))
-            .filter(self.model.isbn == isbn)
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        text: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[BookSearchResultDTO]:
+        """
+        Ranked full-text search over title, authors, publisher, categories and
+        description (the search_vector GIN index), plus trigram matching on the
+        title so misspelt queries still find books. Ordered by relevance.
+        """
+        tsquery = func.websearch_to_tsquery(cast(SEARCH_TEXT_CONFIG, REGCONFIG), text)
+        relevance = func.ts_rank_cd(self.model.search_vector, tsquery) + func.similarity(self.model.title, text)
+        columns = [
+            getattr(self.model, name).label(name)
+            for name in BookSearchResultDTO.model_fields if name not in ("authors", "rank")
+        ]
+        query = (
+            select(*columns, relevance.label("rank"))
+            .where(or_(self.model.search_vector.op("@@")(tsquery), self.model.title.op("%")(text)))
+            .order_by(relevance.desc(), self.model.id)
+            .offset(skip)
+            .limit(limit)
         )
-        return self._model_to_dto(result.scalars().first())
+        rows = (await db.execute(query)).all()
+        links = await self._author_links(db, [row.id for row in rows])
+
+        fields_set = set(BookSearchResultDTO.model_fields)
+        return [
+            BookSearchResultDTO.model_construct(fields_set, **row._mapping, authors=links.get(row.id, []))
+            for row in rows
+        ]
+
+    async def get_by_isbn(self, db: AsyncSession, isbn: str) -> Optional[BookDTO]:
+        """Find a book by its ISBN, with its author links."""
+        rows = (await db.execute(select(*self._book_columns()).filter(self.model.isbn == isbn))).all()
+        return next(iter(await self._with_authors(db, rows[:1])), None)
 
     async def get_by_field(
         self,
@@ -84,7 +257,7 @@ class BookRepository(BaseRepository[BooksModel, BookCreateDTO, BookUpdateDTO, Bo
             return []
 
         field = getattr(self.model, field_name)
-        query = select(self.model).options(selectinload(self.model.authors))
+        query = select(*self._book_columns())
 
         match operator:
             case "eq":
@@ -102,8 +275,7 @@ class BookRepository(BaseRepository[BooksModel, BookCreateDTO, BookUpdateDTO, Bo
             case _:
                 query = query.where(field == value)  # Default to equality
 
-        result = await db.execute(query)
-        return [self._model_to_dto(row) for row in result.scalars().all()]
+        return await self._with_authors(db, (await db.execute(query)).all())
 
     async def get_by_author(
         self, 
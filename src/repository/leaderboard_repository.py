@@ -0,0 +1,82 @@
+# src/repositories/leaderboard_repository.py
+from datetime import datetime
+from typing import List
+from sqlalchemy import Float, func, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.dto.leaderboard_dto import LeaderboardEntryDTO
+from src.models.book_rating_summary_models import BookRatingSummaryModel
+from src.models.books_digital_models import BooksDigitalModel
+from src.models.books_models import BooksModel
+from src.models.books_physical_models import BooksPhysicalModel
+from src.models.loan_digital_models import DigitalLoansModel
+from src.models.loan_physical_models import PhysicalLoansModel
+from src.models.rating_models import RatingModel
+
+
+class LeaderboardRepository:
+    """Ranking aggregates behind the leaderboards; meant to be run periodically, not per request"""
+
+    @staticmethod
+    def _to_entries(rows) -> List[LeaderboardEntryDTO]:
+        return [
+            LeaderboardEntryDTO.model_construct(
+                rank=rank, book_id=row.book_id, title=row.title, score=float(row.score), count=row.count
+            )
+            for rank, row in enumerate(rows, start=1)
+        ]
+
+    async def top_rated(self, db: AsyncSession, *, limit: int, prior_weight: float) -> List[LeaderboardEntryDTO]:
+        """
+        Books by Bayesian average: every book's approved ratings are blended
+        with `prior_weight` ratings at the global mean, so a handful of 5-star
+        ratings does not outrank a long record of 4.5s. Reads the summary table.
+        """
+        summary = BookRatingSummaryModel
+        global_mean = select(
+            func.sum(summary.rating_sum).cast(Float) / func.nullif(func.sum(summary.rating_count), 0)
+        ).scalar_subquery()
+        prior = literal(prior_weight, Float)
+        score = (prior * func.coalesce(global_mean, 0) + summary.rating_sum) / (prior + summary.rating_count)
+        query = (
+            select(summary.book_id, BooksModel.title, score.label("score"), summary.rating_count.label("count"))
+            .join(BooksModel, BooksModel.id == summary.book_id)
+            .where(summary.rating_count > 0)
+            .order_by(score.desc(), summary.book_id)
+            .limit(limit)
+        )
+        return self._to_entries((await db.execute(query)).all())
+
+    async def most_rated(self, db: AsyncSession, *, since: datetime, limit: int) -> List[LeaderboardEntryDTO]:
+        """Books with the most approved ratings created since `since`"""
+        count = func.count(RatingModel.id)
+        query = (
+            select(RatingModel.book_id, BooksModel.title, count.label("score"), count.label("count"))
+            .join(BooksModel, BooksModel.id == RatingModel.book_id)
+            .where(RatingModel.created_at >= since, RatingModel.is_approved.is_(True))
+            .group_by(RatingModel.book_id, BooksModel.title)
+            .order_by(count.desc(), RatingModel.book_id)
+            .limit(limit)
+        )
+        return self._to_entries((await db.execute(query)).all())
+
+    async def most_borrowed(self, db: AsyncSession, *, since: datetime, limit: int) -> List[LeaderboardEntryDTO]:
+        """Books with the most physical and digital loans started since `since`"""
+        loans = union_all(
+            select(BooksPhysicalModel.book_id)
+            .join(PhysicalLoansModel, PhysicalLoansModel.book_id == BooksPhysicalModel.id)
+            .where(PhysicalLoansModel.loan_date >= since),
+            select(BooksDigitalModel.book_id)
+            .join(DigitalLoansModel, DigitalLoansModel.book_id == BooksDigitalModel.id)
+            .where(DigitalLoansModel.loan_date >= since),
+        ).subquery()
+        count = func.count()
+        query = (
+            select(loans.c.book_id, BooksModel.title, count.label("score"), count.label("count"))
+            .join(BooksModel, BooksModel.id == loans.c.book_id)
+            .group_by(loans.c.book_id, BooksModel.title)
+            .order_by(count.desc(), loans.c.book_id)
+            .limit(limit)
+        )
+        return self._to_entries((await db.execute(query)).all())
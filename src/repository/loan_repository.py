@@ -1,12 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import case, select, and_, or_, update, func
+from sqlalchemy import any_, bindparam, case, select, and_, or_, update, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import construct_dtos, dto_projection, model_to_dto
 from src.models.loan_physical_models import PhysicalLoansModel
 from src.models.loan_digital_models import DigitalLoansModel
+from src.models.books_physical_models import BooksPhysicalModel
+from src.models.relationship_models import BookStatus
 from src.dto.loan_dto import (
     PhysicalLoanDTO, DigitalLoanDTO,
     PhysicalLoanCreateDTO, DigitalLoanCreateDTO,
@@ -27,13 +31,15 @@ class PhysicalLoanRepository(
         super().__init__(PhysicalLoansModel)
 
     def _model_to_dto(self, db_obj: PhysicalLoansModel) -> PhysicalLoanDTO:
-        if not db_obj:
-            return None
-        return PhysicalLoanDTO.from_orm(db_obj)
+        return model_to_dto(PhysicalLoanDTO, db_obj)
 
     async def get_by_user(self, db: AsyncSession, user_id: UUID) -> List[PhysicalLoanDTO]:
-        stmt = select(self.model).where(self.model.user_id == user_id)
-        result = await db.execute(stmt)
+        stmt = self._statement(
+            "get_by_user",
+            lambda: select(self.model).where(self.model.user_id == bindparam("user_id")),
+            prepare=True,
+        )
+        result = await db.execute(stmt, {"user_id": user_id})
         return [self._model_to_dto(obj) for obj in result.scalars().all()]
 
     async def get_by_book(self, db: AsyncSession, book_id: UUID) -> List[PhysicalLoanDTO]:
@@ -44,14 +50,18 @@ class PhysicalLoanRepository(
     async def get_active_by_user_and_book(
         self, db: AsyncSession, user_id: UUID, book_id: UUID
     ) -> Optional[PhysicalLoanDTO]:
-        stmt = select(self.model).where(
-            and_(
-                self.model.user_id == user_id,
-                self.model.book_id == book_id,
-                self.model.status != LoanStatus.RETURNED
-            )
+        stmt = self._statement(
+            "get_active_by_user_and_book",
+            lambda: select(self.model).where(
+                and_(
+                    self.model.user_id == bindparam("user_id"),
+                    self.model.book_id == bindparam("book_id"),
+                    self.model.status != LoanStatus.RETURNED
+                )
+            ),
+            prepare=True,
         )
-        result = await db.execute(stmt)
+        result = await db.execute(stmt, {"user_id": user_id, "book_id": book_id})
         db_obj = result.scalars().first()
         return self._model_to_dto(db_obj)
 
@@ -153,13 +163,77 @@ class PhysicalLoanRepository(
         result = await db.execute(stmt)
         return [self._model_to_dto(obj) for obj in result.scalars().all()]
 
-    async def bulk_return_loans(self, db: AsyncSession, loan_ids: List[UUID]) -> List[PhysicalLoanDTO]:
-        results = []
-        for loan_id in loan_ids:
-            loan = await self.mark_returned(db, loan_id)
-            if loan:
-                results.append(loan)
-        return results
+    async def bulk_return_loans(
+        self, db: AsyncSession, loan_ids: List[UUID]
+    ) -> Tuple[List[PhysicalLoanDTO], List[UUID], List[UUID]]:
+        """
+        Mark loans that are still out (CHECKOUT or OVERDUE) returned and their
+        copies AVAILABLE in a single statement. Returns the returned loans, the
+        requested ids that were not found, and those that exist but are not
+        out, e.g. already returned, which are left untouched.
+        """
+        loan_ids = list(dict.fromkeys(loan_ids))
+        if not loan_ids:
+            return [], [], []
+        loans = self.model.__table__
+        copies = BooksPhysicalModel.__table__
+
+        returned = (
+            update(loans)
+            .where(
+                loans.c.id == any_(bindparam("loan_ids", loan_ids, type_=ARRAY(loans.c.id.type))),
+                # A loan already returned must not reset its date or free a copy now out on a newer loan
+                loans.c.status.in_([LoanStatus.CHECKOUT, LoanStatus.OVERDUE]),
+            )
+            .values(status=LoanStatus.RETURNED, return_date=datetime.now())
+            .returning(*loans.c)
+            .cte("returned")
+        )
+        freed = (
+            update(copies)
+            .where(copies.c.id == returned.c.book_id)
+            .values(status=BookStatus.AVAILABLE)
+            .returning(copies.c.id)
+            .cte("freed")
+        )
+        # Core rows of the CTE, not ORM instances: build the DTOs from the DTO's columns
+        _, converters = dto_projection(self.model, PhysicalLoanDTO)
+        result = await db.execute(
+            select(*(returned.c[name] for name in PhysicalLoanDTO.model_fields)).add_cte(freed)
+        )
+        results = construct_dtos(PhysicalLoanDTO, result, converters)
+        await db.commit()
+
+        returned_ids = {loan.id for loan in results}
+        skipped = [loan_id for loan_id in loan_ids if loan_id not in returned_ids]
+        existing = set()
+        if skipped:
+            existing = set((await db.execute(
+                select(loans.c.id).where(loans.c.id == any_(bindparam("skipped", skipped, type_=ARRAY(loans.c.id.type))))
+            )).scalars())
+        return (
+            results,
+            [loan_id for loan_id in skipped if loan_id not in existing],
+            [loan_id for loan_id in skipped if loan_id in existing],
+        )
+
+    async def mark_overdue_batch(self, db: AsyncSession, now: datetime, batch_size: int) -> int:
+        """
+        Flip up to `batch_size` CHECKOUT loans past their due date to OVERDUE.
+        Does not commit, so the caller controls the transaction.
+        """
+        due = (
+            select(self.model.id)
+            .where(self.model.status == LoanStatus.CHECKOUT, self.model.due_date < now)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(self.model.__table__)
+            .where(self.model.__table__.c.id.in_(due.scalar_subquery()))
+            .values(status=LoanStatus.OVERDUE)
+        )
+        return result.rowcount
 
     async def bulk_update_status(self, db: AsyncSession, loan_ids: List[UUID], new_status: LoanStatus) -> List[PhysicalLoanDTO]:
         stmt = update(self.model).where(
@@ -184,13 +258,15 @@ class DigitalLoanRepository(
         super().__init__(DigitalLoansModel)
 
     def _model_to_dto(self, db_obj: DigitalLoansModel) -> DigitalLoanDTO | None:
-        if not db_obj:
-            return None
-        return DigitalLoanDTO.from_orm(db_obj)
+        return model_to_dto(DigitalLoanDTO, db_obj)
 
     async def get_by_user(self, db: AsyncSession, user_id: UUID) -> List[DigitalLoanDTO]:
-        stmt = select(self.model).where(self.model.user_id == user_id)
-        result = await db.execute(stmt)
+        stmt = self._statement(
+            "get_by_user",
+            lambda: select(self.model).where(self.model.user_id == bindparam("user_id")),
+            prepare=True,
+        )
+        result = await db.execute(stmt, {"user_id": user_id})
         return [self._model_to_dto(obj) for obj in result.scalars().all()]
 
     async def get_by_book(self, db: AsyncSession, book_id: UUID) -> List[DigitalLoanDTO]:
@@ -201,14 +277,18 @@ class DigitalLoanRepository(
     async def get_active_by_user_and_book(
         self, db: AsyncSession, user_id: UUID, book_id: UUID
     ) -> Optional[DigitalLoanDTO]:
-        stmt = select(self.model).where(
-            and_(
-                self.model.user_id == user_id,
-                self.model.book_id == book_id,
-                self.model.status.in_([LoanStatus.CHECKOUT, LoanStatus.OVERDUE])
-            )
+        stmt = self._statement(
+            "get_active_by_user_and_book",
+            lambda: select(self.model).where(
+                and_(
+                    self.model.user_id == bindparam("user_id"),
+                    self.model.book_id == bindparam("book_id"),
+                    self.model.status.in_([LoanStatus.CHECKOUT, LoanStatus.OVERDUE])
+                )
+            ),
+            prepare=True,
         )
-        result = await db.execute(stmt)
+        result = await db.execute(stmt, {"user_id": user_id, "book_id": book_id})
         db_obj = result.scalars().first()
         return self._model_to_dto(db_obj)
 
@@ -288,6 +368,24 @@ class DigitalLoanRepository(
         result = await db.execute(stmt)
         return [self._model_to_dto(obj) for obj in result.scalars().all()]
 
+    async def mark_overdue_batch(self, db: AsyncSession, now: datetime, batch_size: int) -> int:
+        """
+        Flip up to `batch_size` CHECKOUT loans past their due date to EXPIRED.
+        Does not commit, so the caller controls the transaction.
+        """
+        due = (
+            select(self.model.id)
+            .where(self.model.status == LoanStatus.CHECKOUT, self.model.due_date < now)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(self.model.__table__)
+            .where(self.model.__table__.c.id.in_(due.scalar_subquery()))
+            .values(status=LoanStatus.EXPIRED)
+        )
+        return result.rowcount
+
     async def bulk_update_status(self, db: AsyncSession, loan_ids: List[UUID], new_status: LoanStatus) -> List[DigitalLoanDTO]:
         stmt = update(self.model).where(
             self.model.id.in_(loan_ids)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import joinedload
 from src.models.publisher_models import PublishersModel
 from src.dto.publisher_dto import PublisherCreateDTO, PublisherUpdateDTO, PublisherDTO
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import model_to_dto
 
 
 class PublisherRepository(
@@ -18,12 +19,11 @@ class PublisherRepository(
 
     def _model_to_dto(self, db_obj: PublishersModel) -> Optional[PublisherDTO]:
         """Convert SQLAlchemy model to PublisherDTO."""
-        return PublisherDTO.from_orm(db_obj) if db_obj else None
+        return model_to_dto(PublisherDTO, db_obj)
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[PublisherDTO]:
         """Get a single publisher by ID."""
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return self._model_to_dto(result.scalars().first())
+        return self._model_to_dto(await self._get_by_id(db, id, eager=False))
 
     async def get_multi(
         self,
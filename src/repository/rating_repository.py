@@ -1,13 +1,15 @@
 # src/repositories/rating_repository.py
 from typing import Any, List, Optional
 from uuid import UUID
-from sqlalchemy import func
+from sqlalchemy import bindparam, delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.models.rating_models import RatingModel
 from src.dto.rating_dto import RatingCreateDTO, RatingUpdateDTO, RatingDTO
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import model_to_dto
+from src.repository.book_rating_summary_repository import BookRatingSummaryRepository
 
 
 class RatingRepository(
@@ -15,15 +17,15 @@ class RatingRepository(
 ):
     def __init__(self):
         super().__init__(RatingModel)
+        self.summary = BookRatingSummaryRepository()
 
     def _model_to_dto(self, db_obj: RatingModel) -> Optional[RatingDTO]:
         """Convert SQLAlchemy model to RatingDTO."""
-        return RatingDTO.from_orm(db_obj) if db_obj else None
+        return model_to_dto(RatingDTO, db_obj)
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[RatingDTO]:
         """Get a rating by ID."""
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return self._model_to_dto(result.scalars().first())
+        return self._model_to_dto(await self._get_by_id(db, id, eager=False))
 
     async def get_multi(
         self,
@@ -45,7 +47,12 @@ class RatingRepository(
 
     async def get_by_user(self, db: AsyncSession, user_id: UUID) -> List[RatingDTO]:
         """Get all ratings by a specific user."""
-        result = await db.execute(select(self.model).filter(self.model.user_id == user_id))
+        stmt = self._statement(
+            "get_by_user",
+            lambda: select(self.model).filter(self.model.user_id == bindparam("user_id")),
+            prepare=True,
+        )
+        result = await db.execute(stmt, {"user_id": user_id})
         return [self._model_to_dto(row) for row in result.scalars().all()]
 
     async def get_by_book(self, db: AsyncSession, book_id: UUID) -> List[RatingDTO]:
@@ -55,20 +62,87 @@ class RatingRepository(
 
     async def get_approved(self, db: AsyncSession, book_id: UUID) -> List[RatingDTO]:
         """Get only approved ratings for a given book."""
-        result = await db.execute(
-            select(self.model).filter(
-                self.model.book_id == book_id, self.model.is_approved == True
-            )
+        stmt = self._statement(
+            "get_approved",
+            lambda: select(self.model).filter(
+                self.model.book_id == bindparam("book_id"), self.model.is_approved == True
+            ),
+            prepare=True,
         )
+        result = await db.execute(stmt, {"book_id": book_id})
         return [self._model_to_dto(row) for row in result.scalars().all()]
     
     async def get_average_rating(
         self, db: AsyncSession, book_id: UUID
     ) -> Optional[float]:
+        summary = await self.summary.get(db, book_id)
+        if summary is None or not summary.rating_count:
+            return None
+        return summary.rating_sum / summary.rating_count
+
+    # ---- writes keep book_rating_summary in step, in the same transaction ----
+    async def create(self, db: AsyncSession, obj_in: Any) -> RatingModel:
+        result = await db.execute(
+            insert(self.model).values(**self._to_values(obj_in, create=True)).returning(self.model)
+        )
+        db_obj = result.scalars().one()
+        if db_obj.is_approved:
+            await self.summary.apply(db, [(db_obj.book_id, db_obj.rating, 1)])
+        await db.commit()
+        return db_obj
+
+    async def create_bulk(self, db: AsyncSession, objs_in: List[Any]) -> List[RatingModel]:
+        if not objs_in:
+            return []
+        db_objs = await self._insert_many(db, objs_in)
+        await self.summary.apply(db, [(obj.book_id, obj.rating, 1) for obj in db_objs if obj.is_approved])
+        await db.commit()
+        return db_objs
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        id: UUID,
+        obj_in: RatingUpdateDTO | dict[str, Any]
+    ) -> Optional[RatingModel]:
+        """Update a rating (including approve/reject) and move its summary contribution"""
+        values = self._to_values(obj_in)
+        if not values:
+            return await self._get_by_id(db, id)
+
+        # Lock the old state so the delta matches what the UPDATE replaces
+        old = (await db.execute(
+            select(self.model.book_id, self.model.rating, self.model.is_approved)
+            .where(self.model.id == id)
+            .with_for_update()
+        )).first()
+        if old is None:
+            return None
+
+        result = await db.execute(
+            update(self.model).where(self.model.id == id).values(**values).returning(self.model)
+        )
+        db_obj = result.scalars().one()
+        changes = []
+        if old.is_approved:
+            changes.append((old.book_id, old.rating, -1))
+        if db_obj.is_approved:
+            changes.append((db_obj.book_id, db_obj.rating, 1))
+        await self.summary.apply(db, changes)
+        await db.commit()
+        return db_obj
+
+    async def delete(self, db: AsyncSession, *, id: UUID) -> bool:
         result = await db.execute(
-            select(func.avg(self.model.rating)).where(
-                self.model.book_id == book_id,
-                self.model.is_approved == True
-            )
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model.book_id, self.model.rating, self.model.is_approved)
         )
-        return result.scalar()
+        row = result.first()
+        if row is None:
+            return False
+        if row.is_approved:
+            await self.summary.apply(db, [(row.book_id, row.rating, -1)])
+        await db.commit()
+        return True
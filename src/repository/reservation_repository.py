@@ -1,7 +1,8 @@
 # src/repositories/reservation_repository.py
 from datetime import datetime, timedelta
 from typing import Any, List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
+from sqlalchemy import ARRAY, Text, bindparam, cast, func, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -13,6 +14,7 @@ from src.dto.reservation_dto import (
     ReservationStatus,
 )
 from src.repository.base_repository import BaseRepository
+from src.utils.dto_utils import model_to_dto
 
 
 class ReservationRepository(
@@ -23,12 +25,11 @@ class ReservationRepository(
 
     def _model_to_dto(self, db_obj: ReservationModel) -> Optional[ReservationDTO]:
         """Convert SQLAlchemy model to ReservationDTO."""
-        return ReservationDTO.from_orm(db_obj) if db_obj else None
+        return model_to_dto(ReservationDTO, db_obj)
 
     async def get(self, db: AsyncSession, id: UUID) -> Optional[ReservationDTO]:
         """Get a reservation by ID."""
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return self._model_to_dto(result.scalars().first())
+        return self._model_to_dto(await self._get_by_id(db, id, eager=False))
 
     async def get_multi(
         self,
@@ -50,7 +51,12 @@ class ReservationRepository(
 
     async def get_by_user(self, db: AsyncSession, user_id: UUID) -> List[ReservationDTO]:
         """Get all reservations made by a specific user."""
-        result = await db.execute(select(self.model).filter(self.model.user_id == user_id))
+        stmt = self._statement(
+            "get_by_user",
+            lambda: select(self.model).filter(self.model.user_id == bindparam("user_id")),
+            prepare=True,
+        )
+        result = await db.execute(stmt, {"user_id": user_id})
         return [self._model_to_dto(row) for row in result.scalars().all()]
 
     async def get_by_book(self, db: AsyncSession, book_id: UUID) -> List[ReservationDTO]:
@@ -123,4 +129,96 @@ class ReservationRepository(
             reservation.status = status
             await db.commit()
             await db.refresh(reservation)
-        return self._model_to_dto(reservation)
\ No newline at end of file
+        return self._model_to_dto(reservation)
+
+    async def create(self, db: AsyncSession, obj_in: Any):
+        """Insert a reservation; without a position it joins the end of its book's queue"""
+        if isinstance(obj_in, ReservationCreateDTO) and obj_in.position is None:
+            return (await self.create_bulk_queued(db, [obj_in]))[0]
+        return await super().create(db, obj_in)
+
+    async def create_bulk_queued(
+        self, db: AsyncSession, reservations: List[ReservationCreateDTO]
+    ) -> List[ReservationDTO]:
+        """
+        Insert all reservations in one transaction, appending them to each book's
+        queue: positions continue from the book's last pending position, numbered
+        with a window function in the same INSERT ... SELECT statement.
+        Client-supplied positions are ignored. Results come back in input order.
+        """
+        if not reservations:
+            return []
+        table = self.model.__table__
+
+        # Serialize concurrent bulk loads per book so queue tails cannot interleave
+        book_ids = sorted({str(r.book_id) for r in reservations if r.book_id})
+        await db.execute(
+            text(
+                "SELECT pg_advisory_xact_lock(hashtextextended(book_id, 0)) "
+                "FROM unnest(CAST(:book_ids AS text[])) AS book_id"
+            ),
+            {"book_ids": book_ids},
+        )
+
+        # The whole payload travels as one typed array per column (a fixed
+        # handful of binds however many holds there are), unnested once in a CTE
+        # Ids are generated here so the RETURNING rows, whose order Postgres
+        # does not guarantee, can be matched back to the input
+        ids = [uuid4() for _ in reservations]
+        columns = ("id", "user_id", "book_id", "reservation_date", "expiration_date")
+        arrays = [
+            cast(
+                bindparam(f"{name}s", ids if name == "id" else [getattr(r, name) for r in reservations]),
+                ARRAY(table.c[name].type),
+            )
+            for name in columns
+        ]
+        statuses = cast(bindparam("statuses", [r.status.name for r in reservations]), ARRAY(Text))
+        payload = (
+            select(
+                func.unnest(*arrays, statuses)
+                .table_valued(*columns, "status", with_ordinality="ord")
+                .render_derived(name="payload")
+            )
+            .cte("payload")
+        )
+
+        queue_tail = (
+            select(table.c.book_id, func.max(table.c.position).label("tail"))
+            .where(
+                table.c.book_id.in_(select(payload.c.book_id)),
+                table.c.status == ReservationStatus.PENDING,
+            )
+            .group_by(table.c.book_id)
+            .subquery("queue_tail")
+        )
+
+        position = func.coalesce(queue_tail.c.tail, 0) + func.row_number().over(
+            partition_by=payload.c.book_id, order_by=payload.c.ord
+        )
+        rows = (
+            select(
+                payload.c.id,
+                payload.c.user_id,
+                payload.c.book_id,
+                payload.c.reservation_date,
+                payload.c.expiration_date,
+                cast(payload.c.status, table.c.status.type),
+                position,
+            )
+            .select_from(payload.outerjoin(queue_tail, queue_tail.c.book_id == payload.c.book_id))
+        )
+
+        stmt = (
+            insert(table)
+            .from_select(
+                ["id", "user_id", "book_id", "reservation_date", "expiration_date", "status", "position"],
+                rows,
+                include_defaults=False,
+            )
+            .returning(*table.c)
+        )
+        result = await db.execute(stmt)
+        by_id = {row.id: self._model_to_dto(row) for row in result.all()}
+        await db.commit()
+        return [by_id[reservation_id] for reservation_id in ids]
@@ -4,6 +4,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from src.models.relationship_models import user_role_table
 from src.models.role_models import RoleModel
 from src.dto.role_dto import RoleCreateDTO, RoleUpdateDTO, RoleDTO
 from src.repository.base_repository import BaseRepository
@@ -38,3 +39,10 @@ class RoleRepository(BaseRepository[RoleModel, RoleCreateDTO, RoleUpdateDTO, Rol
         result = await db.execute(stmt)
         roles = result.scalars().all()
         return [self._model_to_dto(r) for r in roles]
+
+    async def get_user_ids(self, db: AsyncSession, role_id: UUID) -> List[UUID]:
+        """Ids of the users linked to a role"""
+        result = await db.execute(
+            select(user_role_table.c.user_id).where(user_role_table.c.role_id == role_id)
+        )
+        return list(result.scalars().all())
@@ -1,8 +1,12 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
+from sqlalchemy import bindparam, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from src.models.users_models import UsersModel
+from src.models.role_models import RoleModel
+from src.models.relationship_models import user_role_table
+from src.dto.auth_dto import PrincipalDTO
 from src.dto.user_dto import UserCreateDTO, UserUpdateDTO, UserDTO
 from src.repository.base_repository import BaseRepository
 
@@ -36,10 +40,7 @@ class UserRepository(BaseRepository[UsersModel, UserCreateDTO, UserUpdateDTO, Us
         )
     
     async def get(self, db: AsyncSession, id: UUID) -> Optional[UserDTO]:
-        query = select(self.model).filter(self.model.id == id)
-        query = self._apply_eager_loads(query)
-        result = await db.execute(query)
-        db_obj = result.scalars().first()
+        db_obj = await self._get_by_id(db, id)
         return self._model_to_dto(db_obj)
 
     async def get_multi(
@@ -59,6 +60,44 @@ class UserRepository(BaseRepository[UsersModel, UserCreateDTO, UserUpdateDTO, Us
         db_objs = result.scalars().all()
         return [self._model_to_dto(obj) for obj in db_objs]
 
+    async def get_principal(self, db: AsyncSession, *, id: UUID) -> Optional[PrincipalDTO]:
+        """Fetch only what authorization needs: id, is_active and role names"""
+        query = self._statement(
+            "get_principal",
+            lambda: select(
+                self.model.id,
+                self.model.is_active,
+                func.array_remove(func.array_agg(RoleModel.name), None).label("roles"),
+            )
+            .outerjoin(user_role_table, user_role_table.c.user_id == self.model.id)
+            .outerjoin(RoleModel, RoleModel.id == user_role_table.c.role_id)
+            .where(self.model.id == bindparam("id"))
+            .group_by(self.model.id),
+            prepare=True,
+        )
+        row = (await db.execute(query, {"id": id})).first()
+        if row is None:
+            return None
+        return PrincipalDTO(user_id=row.id, roles=row.roles or [], is_active=bool(row.is_active))
+
+    async def get_credentials(self, db: AsyncSession, *, identity: str):
+        """
+        Fetch only what login needs (id, password_hash, is_active) for a
+        username or email in one round trip, using their unique indexes.
+        """
+        identity_param = bindparam("identity")
+        query = self._statement(
+            "get_credentials",
+            lambda: select(self.model.id, self.model.password_hash, self.model.is_active)
+            .where(or_(self.model.username == identity_param, self.model.email == identity_param))
+            # A username may equal another account's email; prefer the username match
+            .order_by((self.model.username == identity_param).desc())
+            .limit(1),
+            prepare=True,
+        )
+        result = await db.execute(query, {"identity": identity})
+        return result.first()
+
     async def get_by_name(self, db: AsyncSession, *, name: str) -> Optional[UserDTO]:
         query = select(self.model).where(self.model.username == name)
         query = self._apply_eager_loads(query)
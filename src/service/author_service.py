@@ -6,6 +6,7 @@ from uuid import UUID
 from src.service.base_service import BaseService
 from src.dto.author_dto import AuthorCreateDTO, AuthorUpdateDTO, AuthorDTO
 from src.repository.author_repository import AuthorRepository
+from src.tasks.catalog_index import AUTHOR, catalog_index
 
 
 class AuthorService(BaseService[AuthorCreateDTO, AuthorUpdateDTO, AuthorDTO, AuthorRepository]):
@@ -16,3 +17,21 @@ class AuthorService(BaseService[AuthorCreateDTO, AuthorUpdateDTO, AuthorDTO, Aut
         self, db: AsyncSession, first_name: str, last_name: Optional[str] = None
     ) -> List[AuthorDTO]:
         return await self.repo.get_by_name(db, first_name, last_name)
+
+    # Keep the autocomplete index in step with writes made through this worker
+    async def create(self, db: AsyncSession, obj_in: AuthorCreateDTO) -> AuthorDTO:
+        author = await super().create(db, obj_in)
+        catalog_index.author_saved(author.id, author.first_name, author.last_name)
+        return author
+
+    async def update(self, db: AsyncSession, obj_id: UUID, obj_in: AuthorUpdateDTO) -> Optional[AuthorDTO]:
+        author = await super().update(db, obj_id, obj_in)
+        if author:
+            catalog_index.author_saved(author.id, author.first_name, author.last_name)
+        return author
+
+    async def delete(self, db: AsyncSession, obj_id: UUID) -> bool:
+        deleted = await super().delete(db, obj_id)
+        if deleted:
+            catalog_index.removed(AUTHOR, obj_id)
+        return deleted
@@ -1,8 +1,10 @@
 # src/services/base_service.py
-from typing import Generic, TypeVar, List, Optional, Type
+from typing import AsyncIterator, Generic, TypeVar, List, Optional, Tuple, Type
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from src.utils.dto_utils import dto_projection, model_to_dto
+
 C = TypeVar("C")  # CreateDTO
 U = TypeVar("U")  # UpdateDTO
 R = TypeVar("R")  # ResponseDTO
@@ -15,27 +17,41 @@ class BaseService(Generic[C, U, R, RepoT]):
     def __init__(self, repo: RepoT, response_model: Optional[Type[R]] = None):
         self.repo = repo
         self.response_model = response_model
+        if hasattr(repo, "relationships_needed_by"):
+            # Writes only load the relationships this service's DTO exposes
+            repo.load_on_write = repo.relationships_needed_by(response_model)
 
     def _to_dto(self, obj) -> R:
-        if self.response_model and obj is not None:
-            # Add from_attributes=True to handle SQLAlchemy objects
-            return self.response_model.model_validate(obj, from_attributes=True)
+        if self.response_model:
+            return model_to_dto(self.response_model, obj)
         return obj
 
     def _to_dto_list(self, objs: List) -> List[R]:
         if self.response_model:
-            # Add from_attributes=True to handle SQLAlchemy objects
-            return [self.response_model.model_validate(obj, from_attributes=True) for obj in objs]
+            return [model_to_dto(self.response_model, obj) for obj in objs]
         return objs
 
     async def list(self, db: AsyncSession, skip: int, limit: int) -> List[R]:
+        if self.response_model and dto_projection(self.repo.model, self.response_model):
+            # Flat DTOs are built from Core rows without revalidating trusted DB data
+            return await self.repo.get_multi_dto(db, self.response_model, skip=skip, limit=limit)
         objs = await self.repo.get_multi(db, skip=skip, limit=limit)
         return self._to_dto_list(objs)
 
+    async def list_keyset(
+        self, db: AsyncSession, cursor: Optional[str], limit: int
+    ) -> Tuple[List[R], Optional[str]]:
+        objs, next_cursor = await self.repo.get_multi_keyset(db, cursor=cursor, limit=limit)
+        return self._to_dto_list(objs), next_cursor
+
     async def list_all(self, db: AsyncSession) -> List[R]:
         objs = await self.repo.get_all(db)
         return self._to_dto_list(objs)
 
+    async def stream_all(self, db: AsyncSession, batch_size: int = 500) -> AsyncIterator[R]:
+        async for obj in self.repo.stream_all(db, batch_size=batch_size):
+            yield self._to_dto(obj)
+
     async def get(self, db: AsyncSession, obj_id: UUID) -> Optional[R]:
         obj = await self.repo.get(db, id=obj_id)
         return self._to_dto(obj)
@@ -44,6 +60,10 @@ class BaseService(Generic[C, U, R, RepoT]):
         obj = await self.repo.create(db, obj_in=obj_in)
         return self._to_dto(obj)
 
+    async def create_bulk(self, db: AsyncSession, objs_in: List[C]) -> List[R]:
+        objs = await self.repo.create_bulk(db, objs_in)
+        return self._to_dto_list(objs)
+
     async def update(self, db: AsyncSession, obj_id: UUID, obj_in: U) -> Optional[R]:
         obj = await self.repo.update(db, id=obj_id, obj_in=obj_in)
         return self._to_dto(obj)
@@ -54,18 +54,19 @@ class BooksPhysicalService(
         self, db: AsyncSession, create_dtos: List[BooksPhysicalCreateDTO]
     ) -> List[BooksPhysicalDTO]:
         """Create multiple physical books with validation"""
-        results = []
-        
-        for create_dto in create_dtos:
-            # Check barcode uniqueness for each book
-            existing = await self.get_by_barcode(db, create_dto.barcode)
-            if existing:
-                raise ValueError(f"Barcode {create_dto.barcode} already exists")
-            
-            result = await self.create(db, create_dto)
-            results.append(result)
-        
-        return results
+        barcodes = [create_dto.barcode for create_dto in create_dtos]
+        seen = set()
+        for barcode in barcodes:
+            if barcode in seen:
+                raise ValueError(f"Barcode {barcode} is duplicated in the request")
+            seen.add(barcode)
+
+        # Check barcode uniqueness for all books in one query
+        existing = await self.repo.get_existing_barcodes(db, barcodes)
+        if existing:
+            raise ValueError(f"Barcodes already exist: {', '.join(sorted(existing))}")
+
+        return await super().create_bulk(db, create_dtos)
 
     async def count_by_book_id(self, db: AsyncSession, book_id: UUID) -> int:
         """Count physical copies of a specific book"""
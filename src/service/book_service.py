@@ -1,9 +1,10 @@
 # src/services/book_service.py
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.service.base_service import BaseService
-from src.dto.book_dto import AuthorBookLinkDTO, BookCreateDTO, BookUpdateDTO, BookDTO
+from src.dto.book_dto import AuthorBookLinkDTO, BookCreateDTO, BookUpdateDTO, BookDTO, BookSearchResultDTO
 from src.repository.book_repository import BookRepository
+from src.tasks.catalog_index import BOOK, catalog_index
 
 class BookService(BaseService[BookCreateDTO, BookUpdateDTO, BookDTO, BookRepository]):
     def __init__(self):
@@ -13,22 +14,51 @@ class BookService(BaseService[BookCreateDTO, BookUpdateDTO, BookDTO, BookReposit
         books = await self.repo.get_by_field(db, field_name=field, value=value)
         return [self._book_to_dto(book) for book in books]
 
-    # Override list to automatically convert ORM objects
+    async def search_text(
+        self, db: AsyncSession, text: str, skip: int = 0, limit: int = 20
+    ) -> List[BookSearchResultDTO]:
+        """Full-text search across the catalog, most relevant first"""
+        return await self.repo.search(db, text=text, skip=skip, limit=limit)
+
+    # Keep the autocomplete index in step with writes made through this worker
+    async def create(self, db: AsyncSession, obj_in: BookCreateDTO) -> BookDTO:
+        book = await super().create(db, obj_in)
+        catalog_index.book_saved(book.id, book.title, book.isbn)
+        return book
+
+    async def update(self, db: AsyncSession, obj_id, obj_in: BookUpdateDTO) -> Optional[BookDTO]:
+        book = await super().update(db, obj_id, obj_in)
+        if book:
+            catalog_index.book_saved(book.id, book.title, book.isbn)
+        return book
+
+    async def delete(self, db: AsyncSession, obj_id) -> bool:
+        deleted = await super().delete(db, obj_id)
+        if deleted:
+            catalog_index.removed(BOOK, obj_id)
+        return deleted
+
+    # Override list to build DTOs from Core rows and author links
     async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> List[BookDTO]:
-        books = await self.repo.get_multi(db, skip=skip, limit=limit)
-        return [self._book_to_dto(book) for book in books]
+        return await self.repo.get_multi_dto(db, BookDTO, skip=skip, limit=limit)
+
+    # The repository builds keyset pages and full listings as BookDTOs with their author links
+    async def list_keyset(
+        self, db: AsyncSession, cursor: Optional[str], limit: int = 100
+    ) -> Tuple[List[BookDTO], Optional[str]]:
+        return await self.repo.get_multi_keyset(db, cursor=cursor, limit=limit)
 
-    # Override list_all to automatically convert ORM objects
     async def list_all(self, db: AsyncSession) -> List[BookDTO]:
-        books = await self.repo.get_all(db)
-        return [self._book_to_dto(book) for book in books]
+        return await self.repo.get_all(db)
 
-    # Override get to automatically convert ORM object
+    # Streamed books are BookDTOs already, with each batch's author links
+    async def stream_all(self, db: AsyncSession, batch_size: int = 500) -> AsyncIterator[BookDTO]:
+        async for book in self.repo.stream_all(db, batch_size=batch_size):
+            yield book
+
+    # The repository returns the BookDTO with its author links
     async def get(self, db: AsyncSession, obj_id) -> Optional[BookDTO]:
-        book = await self.repo.get(db, id=obj_id)
-        if book:
-            return self._book_to_dto(book)
-        return None
+        return await self.repo.get(db, id=obj_id)
 
     # Internal helper to convert a Book ORM object to BookDTO
     def _book_to_dto(self, book) -> BookDTO:
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 import secrets
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.service.base_service import BaseService
 from src.repository.loan_repository import PhysicalLoanRepository, DigitalLoanRepository
@@ -52,7 +52,9 @@ class PhysicalLoanService(
     async def get_loans_by_date_range(self, db: AsyncSession, start_date: datetime, end_date: datetime) -> List[PhysicalLoanDTO]:
         return await self.repo.get_loans_by_date_range(db, start_date, end_date)
 
-    async def bulk_return_loans(self, db: AsyncSession, loan_ids: List[UUID]):
+    async def bulk_return_loans(
+        self, db: AsyncSession, loan_ids: List[UUID]
+    ) -> Tuple[List[PhysicalLoanDTO], List[UUID], List[UUID]]:
         return await self.repo.bulk_return_loans(db, loan_ids)
 
     async def bulk_update_status(self, db: AsyncSession, loan_ids: List[UUID], new_status: LoanStatus):
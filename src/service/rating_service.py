@@ -1,3 +1,4 @@
+from src.models.book_rating_summary_models import RATING_STARS
 from src.service.base_service import BaseService
 from src.repository.rating_repository import RatingRepository
 from src.dto.rating_dto import RatingCreateDTO, RatingUpdateDTO, RatingDTO
@@ -19,6 +20,19 @@ class RatingService(
     async def get_approved(self, db, book_id):
         return await self.repo.get_approved(db, book_id)
 
+    async def get_stats(self, db, book_id):
+        """Average, count and star distribution of a book's approved ratings, from its summary row"""
+        summary = await self.repo.summary.get(db, book_id)
+        count = summary.rating_count if summary else 0
+        return {
+            "book_id": book_id,
+            "average_rating": round(summary.rating_sum / count, 2) if count else 0,
+            "total_ratings": count,
+            "rating_distribution": {
+                star: getattr(summary, f"star_{star}") if summary else 0 for star in RATING_STARS
+            },
+        }
+
     async def get_pending_approval(self, db):
         """Get all ratings pending approval"""
         return await self.list_all(db, filters={"is_approved": False})
@@ -68,9 +68,5 @@ class ReservationService(
     async def create_bulk(
         self, db: AsyncSession, reservations_data: List[ReservationCreateDTO]
     ) -> List[ReservationDTO]:
-        """Create multiple reservations at once"""
-        results = []
-        for reservation_data in reservations_data:
-            result = await self.create(db, reservation_data)
-            results.append(result)
-        return results
+        """Create multiple reservations at once, assigning queue positions per book"""
+        return await self.repo.create_bulk_queued(db, reservations_data)
@@ -1,11 +1,12 @@
 # src/services/role_service.py
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.role_repository import RoleRepository
 from src.dto.role_dto import RoleCreateDTO, RoleUpdateDTO, RoleDTO
 from src.service.base_service import BaseService
+from src.utils.security_utils import token_cache
 
 
 class RoleService(BaseService[RoleCreateDTO, RoleUpdateDTO, RoleDTO, RoleRepository]):
@@ -15,3 +16,24 @@ class RoleService(BaseService[RoleCreateDTO, RoleUpdateDTO, RoleDTO, RoleReposit
     async def get_by_user(self, db: AsyncSession, user_id: UUID) -> List[RoleDTO]:
         """Get all roles assigned to a specific user."""
         return await self.repo.get_by_user(db, user_id)
+
+    # Cached principals carry their role names, so drop the members' tokens
+    # whenever a role's name or membership changes
+    async def update(self, db: AsyncSession, obj_id: UUID, obj_in: RoleUpdateDTO) -> Optional[RoleDTO]:
+        user_ids = set(await self.repo.get_user_ids(db, obj_id))
+        role = await super().update(db, obj_id, obj_in)
+        user_ids.update(getattr(obj_in, "user_ids", None) or [])
+        self._invalidate_principals(user_ids)
+        return role
+
+    async def delete(self, db: AsyncSession, obj_id: UUID) -> bool:
+        user_ids = await self.repo.get_user_ids(db, obj_id)
+        deleted = await super().delete(db, obj_id)
+        if deleted:
+            self._invalidate_principals(user_ids)
+        return deleted
+
+    @staticmethod
+    def _invalidate_principals(user_ids) -> None:
+        for user_id in user_ids:
+            token_cache.invalidate_user(user_id)
@@ -7,7 +7,9 @@ from uuid import UUID
 from src.service.base_service import BaseService
 from src.repository.user_repository import UserRepository
 from src.dto.user_dto import UserCreateDTO, UserUpdateDTO, UserDTO
-from src.utils.security_utils import get_password_hash, verify_password
+from src.utils.security_utils import (
+    get_password_hash_async, token_cache, unknown_identity_cache, verify_password_async,
+)
 
 
 class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserRepository]):
@@ -18,7 +20,7 @@ class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserReposit
         create_data = obj_in.model_dump(exclude_unset=True)
         
         if 'password' in create_data:
-            create_data['password_hash'] = get_password_hash(create_data.pop('password'))
+            create_data['password_hash'] = await get_password_hash_async(create_data.pop('password'))
         
         create_data.setdefault('is_active', True)
         create_data.setdefault('last_login', datetime.now())
@@ -26,8 +28,22 @@ class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserReposit
         print(f"Final create_data: {create_data}")
 
         obj = await self.repo.create(db, obj_in=create_data)
+        unknown_identity_cache.discard(obj.username, obj.email)
         return self._to_dto(obj)
 
+    async def update(self, db: AsyncSession, obj_id: UUID, obj_in: UserUpdateDTO) -> Optional[UserDTO]:
+        user = await super().update(db, obj_id, obj_in)
+        if user is not None:
+            unknown_identity_cache.discard(user.username, user.email)
+        # Cached principals carry is_active, so drop them on any account change
+        token_cache.invalidate_user(obj_id)
+        return user
+
+    async def delete(self, db: AsyncSession, obj_id: UUID) -> bool:
+        deleted = await super().delete(db, obj_id)
+        token_cache.invalidate_user(obj_id)
+        return deleted
+
     async def login(self, db: AsyncSession, username: str, password: str) -> Optional[UserDTO]:
         """
         Authenticate a user with username/email and password.
@@ -40,14 +56,19 @@ class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserReposit
         Returns:
             UserDTO if authentication successful, None otherwise
         """
-        user = await self.repo.get_by_name(db, name=username)
-        
-        if user is None:
-            user = await self.repo.get_by_email(db, email=username)
-        
-        if user is None or not verify_password(password, user.password_hash) or not user.is_active:
+        if unknown_identity_cache.contains(username):
             return None
-        
+
+        credentials = await self.repo.get_credentials(db, identity=username)
+        if credentials is None:
+            unknown_identity_cache.add(username)
+            return None
+
+        if not credentials.is_active or not await verify_password_async(password, credentials.password_hash):
+            return None
+
+        # Only a successful login pays for the full user row
+        user = await self.repo.get(db, id=credentials.id)
         return self._to_dto(user)
 
     async def login_with_email(self, db: AsyncSession, email: str, password: str) -> Optional[UserDTO]:
@@ -64,7 +85,7 @@ class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserReposit
         """
         user = await self.repo.get_by_email(db, email=email)
         
-        if user is None or not verify_password(password, user.password_hash) or not user.is_active:
+        if user is None or not await verify_password_async(password, user.password_hash) or not user.is_active:
             return None
         
         return self._to_dto(user)
@@ -83,7 +104,7 @@ class UserService(BaseService[UserCreateDTO, UserUpdateDTO, UserDTO, UserReposit
         """
         user = await self.repo.get_by_name(db, name=username)
         
-        if user is None or not verify_password(password, user.password_hash) or not user.is_active:
+        if user is None or not await verify_password_async(password, user.password_hash) or not user.is_active:
             return None
         
         return self._to_dto(user)
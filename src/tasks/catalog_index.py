@@ -0,0 +1,167 @@
+# src/tasks/catalog_index.py
+import asyncio
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from settings import AUTOCOMPLETE_REBUILD_INTERVAL_SECONDS
+from src.models.author_models import AuthorModel
+from src.models.books_models import BooksModel
+from src.utils.db_utils import read_session_factory
+from src.utils.prefix_index import PrefixIndex, word_suffixes
+
+logger = logging.getLogger(__name__)
+
+BOOK = "book"
+AUTHOR = "author"
+
+_ISBN_QUERY = re.compile(r"^[0-9][0-9\- ]*[0-9xX]?$")
+
+
+def _isbn_term(isbn: Optional[str]) -> Optional[str]:
+    return re.sub(r"[\s-]", "", isbn).casefold() if isbn else None
+
+
+def _book_item(book_id, title: str, isbn: Optional[str]) -> Tuple[str, str, str, List[str]]:
+    terms = word_suffixes(title)
+    if isbn:
+        terms.append(_isbn_term(isbn))
+    return BOOK, str(book_id), title, terms
+
+
+def _author_item(author_id, first_name: str, last_name: Optional[str]) -> Tuple[str, str, str, List[str]]:
+    name = " ".join(part for part in (first_name, last_name) if part)
+    return AUTHOR, str(author_id), name, word_suffixes(name)
+
+
+def _load_index(book_rows: List[Any], author_rows: List[Any]) -> PrefixIndex:
+    items = [_book_item(row.id, row.title, row.isbn) for row in book_rows]
+    items.extend(_author_item(row.id, row.first_name, row.last_name) for row in author_rows)
+    index = PrefixIndex()
+    index.load(items)
+    return index
+
+
+class CatalogIndex:
+    """
+    In-memory autocomplete index over book titles, ISBNs and author names.
+    Built from the database at startup, updated in place by BookService and
+    AuthorService writes, and rebuilt periodically to pick up writes made by
+    other workers.
+    """
+
+    def __init__(self, interval: float = AUTOCOMPLETE_REBUILD_INTERVAL_SECONDS):
+        self.interval = interval
+        self.index = PrefixIndex()
+        self._task: Optional[asyncio.Task] = None
+        self.builds = 0
+        self.failures = 0
+        self.updates = 0
+        self.last_build_ms = 0.0
+        self.last_build_at: Optional[datetime] = None
+        # Updates made while build() is loading, replayed on the fresh index before the swap
+        self._during_build: Optional[List[Tuple[str, Tuple[Any, ...]]]] = None
+
+    async def build(self) -> None:
+        """Load every book and author and swap in a freshly sorted index."""
+        self._during_build = []
+        try:
+            await self._build()
+        finally:
+            self._during_build = None
+
+    async def _build(self) -> None:
+        start = time.perf_counter()
+        now = datetime.now()
+        book_rows: List[Any] = []
+        author_rows: List[Any] = []
+        async with read_session_factory() as db:
+            books = await db.stream(
+                select(BooksModel.id, BooksModel.title, BooksModel.isbn).execution_options(yield_per=5000)
+            )
+            async for rows in books.partitions():
+                book_rows.extend(rows)
+            authors = await db.stream(
+                select(AuthorModel.id, AuthorModel.first_name, AuthorModel.last_name).execution_options(yield_per=5000)
+            )
+            async for rows in authors.partitions():
+                author_rows.extend(rows)
+        # Building the terms and sorting every entry takes seconds on a large
+        # catalog, so it runs in a thread instead of blocking the event loop
+        fresh = await asyncio.to_thread(_load_index, book_rows, author_rows)
+        # The snapshot may predate writes this worker applied while it loaded
+        for op, args in self._during_build:
+            getattr(fresh, op)(*args)
+        self.index = fresh
+        self.builds += 1
+        self.last_build_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.last_build_at = now
+
+    def suggest(self, text: str, limit: int = 10, kind: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        if _ISBN_QUERY.match(text.strip()):
+            text = _isbn_term(text.strip())
+        return self.index.search(text, limit=limit, kind=kind)
+
+    # ---- incremental updates from the services ----
+    def _apply(self, op: str, *args) -> None:
+        getattr(self.index, op)(*args)
+        if self._during_build is not None:
+            self._during_build.append((op, args))
+        self.updates += 1
+
+    def book_saved(self, book_id: UUID, title: str, isbn: Optional[str]) -> None:
+        self._apply("add", *_book_item(book_id, title, isbn))
+
+    def author_saved(self, author_id: UUID, first_name: str, last_name: Optional[str]) -> None:
+        self._apply("add", *_author_item(author_id, first_name, last_name))
+
+    def removed(self, kind: str, item_id: UUID) -> None:
+        self._apply("remove", kind, str(item_id))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.build()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failures += 1
+                logger.exception("Catalog index rebuild failed")
+
+    async def start(self) -> None:
+        """Build the index, then keep rebuilding it in the background."""
+        try:
+            await self.build()
+        except Exception:
+            self.failures += 1
+            logger.exception("Initial catalog index build failed")
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def metrics(self) -> dict:
+        return {
+            "items": len(self.index),
+            "builds": self.builds,
+            "failures": self.failures,
+            "updates": self.updates,
+            "last_build_at": self.last_build_at.isoformat() if self.last_build_at else None,
+            "last_build_ms": self.last_build_ms,
+        }
+
+
+catalog_index = CatalogIndex()
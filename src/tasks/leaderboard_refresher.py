@@ -0,0 +1,132 @@
+# src/tasks/leaderboard_refresher.py
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from settings import (
+    LEADERBOARD_PRIOR_WEIGHT, LEADERBOARD_REFRESH_INTERVAL_SECONDS, LEADERBOARD_SIZE, LEADERBOARD_WINDOWS
+)
+from src.dto.leaderboard_dto import LeaderboardEntryDTO
+from src.repository.leaderboard_repository import LeaderboardRepository
+from src.utils.db_utils import read_session_factory
+
+logger = logging.getLogger(__name__)
+
+TOP_RATED = "top_rated"
+MOST_RATED = "most_rated"
+MOST_BORROWED = "most_borrowed"
+
+BoardKey = Tuple[str, Optional[int]]
+
+
+class LeaderboardRefresher:
+    """
+    Periodically recomputes the leaderboards into an in-memory snapshot, so
+    requests are served without touching the database. Day windows outside
+    the configured ones are computed on first use and kept until the next
+    refresh replaces the snapshot.
+    """
+
+    def __init__(
+        self,
+        interval: float = LEADERBOARD_REFRESH_INTERVAL_SECONDS,
+        size: int = LEADERBOARD_SIZE,
+        windows: List[int] = LEADERBOARD_WINDOWS,
+        prior_weight: float = LEADERBOARD_PRIOR_WEIGHT,
+    ):
+        self.interval = interval
+        self.size = size
+        self.windows = windows
+        self.prior_weight = prior_weight
+        self.repo = LeaderboardRepository()
+        self._boards: Dict[BoardKey, List[LeaderboardEntryDTO]] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.hits = 0
+        self.misses = 0
+        self.last_duration_ms = 0.0
+        self.last_refresh_at: Optional[datetime] = None
+
+    async def _compute(self, db, board: str, days: Optional[int], now: datetime) -> List[LeaderboardEntryDTO]:
+        if board == TOP_RATED:
+            return await self.repo.top_rated(db, limit=self.size, prior_weight=self.prior_weight)
+        since = now - timedelta(days=days)
+        if board == MOST_RATED:
+            return await self.repo.most_rated(db, since=since, limit=self.size)
+        return await self.repo.most_borrowed(db, since=since, limit=self.size)
+
+    async def refresh(self) -> None:
+        """Recompute every configured board and swap in the new snapshot."""
+        start = time.perf_counter()
+        now = datetime.now()
+        keys = [(TOP_RATED, None)] + [
+            (board, days) for board in (MOST_RATED, MOST_BORROWED) for days in self.windows
+        ]
+        async with read_session_factory() as db:
+            boards = {key: await self._compute(db, *key, now) for key in keys}
+        self._boards = boards
+        self.refreshes += 1
+        self.last_duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.last_refresh_at = now
+
+    async def get(self, board: str, days: Optional[int] = None) -> List[LeaderboardEntryDTO]:
+        """Return a board from the snapshot, computing it once if it is missing."""
+        key = (board, days)
+        entries = self._boards.get(key)
+        if entries is not None:
+            self.hits += 1
+            return entries
+
+        async with self._lock:
+            self.misses += 1
+            if not self._boards:
+                # First request before the first background refresh
+                await self.refresh()
+            entries = self._boards.get(key)
+            if entries is None:
+                async with read_session_factory() as db:
+                    entries = await self._compute(db, board, days, datetime.now())
+                self._boards[key] = entries
+        return entries
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failures += 1
+                logger.exception("Leaderboard refresh failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def metrics(self) -> dict:
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "hits": self.hits,
+            "misses": self.misses,
+            "boards": len(self._boards),
+            "last_refresh_at": self.last_refresh_at.isoformat() if self.last_refresh_at else None,
+            "last_duration_ms": self.last_duration_ms,
+        }
+
+
+leaderboard_refresher = LeaderboardRefresher()
@@ -0,0 +1,117 @@
+# src/tasks/overdue_sweeper.py
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from settings import OVERDUE_SWEEP_BATCH_SIZE, OVERDUE_SWEEP_INTERVAL_SECONDS
+from src.repository.loan_repository import DigitalLoanRepository, PhysicalLoanRepository
+from src.utils.db_utils import session_factory
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key shared by every worker; only the holder sweeps a batch
+SWEEP_LOCK_KEY = 7_318_001
+
+
+class OverdueSweeper:
+    """
+    Periodically flips CHECKOUT loans past their due date to OVERDUE (physical)
+    or EXPIRED (digital) in bounded batches, and keeps timing metrics.
+    """
+
+    def __init__(
+        self,
+        interval: float = OVERDUE_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = OVERDUE_SWEEP_BATCH_SIZE,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.repos = {"physical": PhysicalLoanRepository(), "digital": DigitalLoanRepository()}
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+        self.total_marked = {name: 0 for name in self.repos}
+        self.last_marked = {name: 0 for name in self.repos}
+        self.last_duration_ms = 0.0
+        self.max_duration_ms = 0.0
+        self.last_run_at: Optional[datetime] = None
+
+    async def _sweep_table(self, name: str, now: datetime) -> Optional[int]:
+        """Sweep one loan table batch by batch; None if another worker holds the lock."""
+        repo = self.repos[name]
+        marked = 0
+        async with session_factory() as db:
+            while True:
+                locked = await db.scalar(select(func.pg_try_advisory_xact_lock(SWEEP_LOCK_KEY)))
+                if not locked:
+                    await db.rollback()
+                    return None if marked == 0 else marked
+                count = await repo.mark_overdue_batch(db, now, self.batch_size)
+                await db.commit()
+                marked += count
+                if count < self.batch_size:
+                    return marked
+
+    async def sweep(self) -> None:
+        """Run one sweep over both loan tables and record its timings."""
+        start = time.perf_counter()
+        now = datetime.now()
+        skipped = False
+        for name in self.repos:
+            marked = await self._sweep_table(name, now)
+            if marked is None:
+                skipped = True
+                marked = 0
+            self.last_marked[name] = marked
+            self.total_marked[name] += marked
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.runs += 1
+        self.skipped += int(skipped)
+        self.last_duration_ms = round(duration_ms, 3)
+        self.max_duration_ms = max(self.max_duration_ms, self.last_duration_ms)
+        self.last_run_at = now
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failures += 1
+                logger.exception("Overdue sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def metrics(self) -> dict:
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_ms": self.last_duration_ms,
+            "max_duration_ms": self.max_duration_ms,
+            "last_marked": dict(self.last_marked),
+            "total_marked": dict(self.total_marked),
+        }
+
+
+overdue_sweeper = OverdueSweeper()
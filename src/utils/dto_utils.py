@@ -0,0 +1,89 @@
+# src/utils/dto_utils.py
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, get_args
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+D = TypeVar("D", bound=BaseModel)
+
+
+def _enum_type(annotation: Any) -> Optional[Type[Enum]]:
+    """The Enum class of a field annotated as `E` or `Optional[E]`, if any"""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return candidate
+    return None
+
+
+def _enum_converter(enum_type: Type[Enum]) -> Callable[[Any], Any]:
+    """Map a model-side enum member onto the DTO's own enum with the same value"""
+    def convert(value):
+        if value is None or isinstance(value, enum_type):
+            return value
+        return enum_type(value.value if isinstance(value, Enum) else value)
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _enum_converters(dto: Type[BaseModel]) -> Dict[str, Callable]:
+    converters = {}
+    for name, field in dto.model_fields.items():
+        enum_type = _enum_type(field.annotation)
+        if enum_type is not None:
+            converters[name] = _enum_converter(enum_type)
+    return converters
+
+
+def model_to_dto(dto: Type[D], obj: Any) -> Optional[D]:
+    """
+    Validate an ORM instance (or Core row) into `dto`. Model-side enum members
+    are mapped onto the DTO's enums first, since pydantic rejects members of
+    another Enum class even when the values match.
+    """
+    if obj is None:
+        return None
+    converters = _enum_converters(dto)
+    if not converters:
+        return dto.model_validate(obj, from_attributes=True)
+    values = {name: getattr(obj, name) for name in dto.model_fields if hasattr(obj, name)}
+    for name, convert in converters.items():
+        if name in values:
+            values[name] = convert(values[name])
+    return dto.model_validate(values, from_attributes=True)
+
+
+@lru_cache(maxsize=None)
+def dto_projection(model, dto: Type[BaseModel]) -> Optional[Tuple[tuple, Dict[str, Callable]]]:
+    """
+    The model columns backing every field of `dto`, plus converters for enum
+    fields. Returns None when a field is not a plain column (e.g. a nested
+    relationship list), in which case the DTO must be built from ORM objects.
+    """
+    columns = inspect(model).columns
+    selected = []
+    for name in dto.model_fields:
+        if name not in columns:
+            return None
+        selected.append(columns[name].label(name))
+    return tuple(selected), _enum_converters(dto)
+
+
+def construct_dtos(dto: Type[D], rows: Iterable, converters: Optional[Dict[str, Callable]] = None) -> List[D]:
+    """
+    Build DTOs from Core rows with model_construct, skipping validation:
+    rows come straight from typed columns, so the data is already trusted.
+    """
+    fields_set = set(dto.model_fields)
+    construct = dto.model_construct
+    if not converters:
+        return [construct(fields_set, **row._mapping) for row in rows]
+
+    dtos = []
+    for row in rows:
+        values = dict(row._mapping)
+        for name, convert in converters.items():
+            values[name] = convert(values[name])
+        dtos.append(construct(fields_set, **values))
+    return dtos
@@ -0,0 +1,89 @@
+# src/utils/export_utils.py
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator, List, Optional
+
+from pydantic import BaseModel
+
+# Number of serialized rows buffered before a chunk is flushed to the client
+EXPORT_CHUNK_SIZE = 500
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def json_array_chunks(
+    items: AsyncIterator[BaseModel], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Serialize DTOs as a single JSON array, flushed every `chunk_size` items"""
+    buffer: List[str] = []
+    separator = "["
+    async for item in items:
+        buffer.append(separator + item.model_dump_json())
+        separator = ","
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+    buffer.append("]" if separator == "," else "[]")
+    yield "".join(buffer).encode("utf-8")
+
+
+async def ndjson_chunks(
+    items: AsyncIterator[BaseModel], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Serialize DTOs as newline-delimited JSON, flushed every `chunk_size` items"""
+    buffer: List[str] = []
+    async for item in items:
+        buffer.append(item.model_dump_json())
+        if len(buffer) >= chunk_size:
+            yield ("\n".join(buffer) + "\n").encode("utf-8")
+            buffer = []
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode("utf-8")
+
+
+def _csv_value(value):
+    """Flatten nested values (lists, dicts) into JSON so they fit in one CSV cell"""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+async def csv_chunks(
+    items: AsyncIterator[BaseModel], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Serialize DTOs as CSV with a header row taken from the first item"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    fields: Optional[List[str]] = None
+    pending = 0
+    async for item in items:
+        row = item.model_dump(mode="json")
+        if fields is None:
+            fields = list(row.keys())
+            writer.writerow(fields)
+        writer.writerow([_csv_value(row.get(field)) for field in fields])
+        pending += 1
+        if pending >= chunk_size:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+            pending = 0
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+
+EXPORT_SERIALIZERS = {
+    ExportFormat.NDJSON: ndjson_chunks,
+    ExportFormat.CSV: csv_chunks,
+}
@@ -0,0 +1,25 @@
+# src/utils/pagination_utils.py
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(created_at: datetime, obj_id: UUID) -> str:
+    """Encode the (created_at, id) keyset position of a row into an opaque cursor"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(obj_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode an opaque cursor back into its (created_at, id) keyset position"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        # Both parts must be strings: UUID() and fromisoformat() fail oddly on other JSON types
+        if not isinstance(payload, dict) or not all(isinstance(payload.get(key), str) for key in ("c", "i")):
+            raise ValueError("cursor payload must hold string 'c' and 'i' values")
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
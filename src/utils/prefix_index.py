@@ -0,0 +1,88 @@
+# src/utils/prefix_index.py
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# (normalized term, kind, item id)
+Entry = Tuple[str, str, str]
+
+
+def normalize(text: str) -> str:
+    """Case-fold, strip accents and collapse whitespace so 'Émile  Zola' matches 'emile z'"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def word_suffixes(text: str) -> List[str]:
+    """Every tail of the text starting at a word, so a prefix can match mid-title"""
+    words = normalize(text).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class PrefixIndex:
+    """
+    Sorted array of (term, kind, id) entries searched with bisect: a prefix
+    lookup is a binary search plus a scan over the matching run, with no
+    per-character trie nodes. Items are (kind, id) pairs with a display label
+    and any number of terms; re-adding an item replaces its terms.
+    """
+
+    def __init__(self):
+        self._entries: List[Entry] = []
+        self._terms: Dict[Tuple[str, str], List[str]] = {}
+        self._labels: Dict[Tuple[str, str], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def load(self, items: Iterable[Tuple[str, str, str, Iterable[str]]]) -> None:
+        """Replace the whole index with (kind, id, label, terms) items, sorting once."""
+        entries: List[Entry] = []
+        terms_by_item: Dict[Tuple[str, str], List[str]] = {}
+        labels: Dict[Tuple[str, str], str] = {}
+        for kind, item_id, label, terms in items:
+            key = (kind, item_id)
+            item_terms = sorted({term for term in terms if term})
+            entries.extend((term, kind, item_id) for term in item_terms)
+            terms_by_item[key] = item_terms
+            labels[key] = label
+        entries.sort()
+        self._entries, self._terms, self._labels = entries, terms_by_item, labels
+
+    def add(self, kind: str, item_id: str, label: str, terms: Iterable[str]) -> None:
+        self.remove(kind, item_id)
+        key = (kind, item_id)
+        item_terms = sorted({term for term in terms if term})
+        for term in item_terms:
+            insort(self._entries, (term, kind, item_id))
+        self._terms[key] = item_terms
+        self._labels[key] = label
+
+    def remove(self, kind: str, item_id: str) -> None:
+        key = (kind, item_id)
+        for term in self._terms.pop(key, ()):
+            entry = (term, kind, item_id)
+            i = bisect_left(self._entries, entry)
+            if i < len(self._entries) and self._entries[i] == entry:
+                del self._entries[i]
+        self._labels.pop(key, None)
+
+    def search(self, prefix: str, limit: int = 10, kind: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """(kind, id, label) of up to `limit` distinct items with a term starting with `prefix`"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        results: List[Tuple[str, str, str]] = []
+        seen: Set[Tuple[str, str]] = set()
+        i = bisect_left(self._entries, (prefix,))
+        while i < len(self._entries) and len(results) < limit:
+            term, entry_kind, item_id = self._entries[i]
+            if not term.startswith(prefix):
+                break
+            key = (entry_kind, item_id)
+            if key not in seen and (kind is None or entry_kind == kind):
+                seen.add(key)
+                results.append((entry_kind, item_id, self._labels[key]))
+            i += 1
+        return results
@@ -1,18 +1,30 @@
 # src/utils/security_utils.py
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
 import bcrypt
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from settings import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from settings import (
+    SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_QUEUE_TIMEOUT,
+    AUTH_CACHE_MAX_SIZE, AUTH_CACHE_TTL_SECONDS,
+    LOGIN_NEGATIVE_CACHE_MAX_SIZE, LOGIN_NEGATIVE_CACHE_TTL_SECONDS, LOGIN_NEGATIVE_CACHE_RECHECK_SECONDS,
+)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt directly"""
     pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
     return hashed_password.decode('utf-8')
 
@@ -22,6 +34,82 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     hashed_password_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_password_bytes)
 
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing queue is full for too long."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a bounded thread pool.
+    At most `workers + max_queue` calls are admitted at once; further callers
+    wait up to `queue_timeout` seconds and are then rejected.
+    """
+
+    def __init__(self, workers: int, max_queue: int, queue_timeout: float):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = asyncio.Semaphore(workers + max_queue)
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_latency = 0.0
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Password hashing queue is full")
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.total_latency += time.perf_counter() - start
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            # Calls admitted but not yet running plus calls waiting for admission
+            "queue_depth": max(self.in_flight - self.workers, 0) + self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_latency_ms": round(self.total_latency / self.completed * 1000, 3) if self.completed else 0.0,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=PASSWORD_HASH_WORKERS,
+    max_queue=PASSWORD_HASH_MAX_QUEUE,
+    queue_timeout=PASSWORD_HASH_QUEUE_TIMEOUT,
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the bcrypt worker pool without blocking the event loop"""
+    return await password_hasher.hash(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt worker pool without blocking the event loop"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -40,4 +128,137 @@ def verify_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified tokens, keyed by the token's SHA-256.
+    Entries expire after `ttl` seconds or at the token's own `exp`, whichever
+    comes first, and can be dropped per user when their account changes.
+    """
+
+    def __init__(self, max_size: int = AUTH_CACHE_MAX_SIZE, ttl: float = AUTH_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any, Any]]" = OrderedDict()
+        self._by_user: Dict[Any, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        """Return the cached principal for a token, or None on a miss"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, token: str, claims: dict, user_id: Any, principal: Any) -> None:
+        expires_at = time.time() + self.ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+        key = self._key(token)
+        self._drop(key)
+        self._entries[key] = (expires_at, user_id, principal)
+        self._by_user.setdefault(user_id, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            keys = self._by_user.get(entry[1])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_user[entry[1]]
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Forget every cached token of a user, e.g. after deactivation or a password change"""
+        for key in list(self._by_user.get(user_id, ())):
+            self._drop(key)
+
+    def metrics(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+token_cache = TokenCache()
+
+
+class UnknownIdentityCache:
+    """
+    Bounded LRU set of login identities (username or email) that matched no
+    account, so repeated attempts against them skip the database. Entries
+    expire after `ttl` seconds and are dropped when an account claims them.
+
+    The cache is per process and discard() only runs on the worker that saw
+    the registration or rename. Other workers let one attempt per identity
+    through to the database every `recheck` seconds, so a new account is
+    found there within that delay.
+    """
+
+    def __init__(
+        self,
+        max_size: int = LOGIN_NEGATIVE_CACHE_MAX_SIZE,
+        ttl: float = LOGIN_NEGATIVE_CACHE_TTL_SECONDS,
+        recheck: float = LOGIN_NEGATIVE_CACHE_RECHECK_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.recheck = recheck
+        # key -> (expires_at, recheck_at)
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(identity: str) -> str:
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def contains(self, identity: str) -> bool:
+        key = self._key(identity)
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is None or entry[0] <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False
+        expires_at, recheck_at = entry
+        if recheck_at <= now:
+            # Let this attempt query; concurrent ones keep hitting until the next recheck
+            self._entries[key] = (expires_at, now + self.recheck)
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, identity: str) -> None:
+        key = self._key(identity)
+        self._entries.pop(key, None)
+        now = time.time()
+        self._entries[key] = (now + self.ttl, now + self.recheck)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, *identities: Optional[str]) -> None:
+        """Forget identities that an account now owns, e.g. after registration or a rename"""
+        for identity in identities:
+            if identity:
+                self._entries.pop(self._key(identity), None)
+
+    def metrics(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+unknown_identity_cache = UnknownIdentityCache()
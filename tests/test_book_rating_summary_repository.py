@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from src.models.rating_models import RatingModel
+from src.repository.book_rating_summary_repository import BookRatingSummaryRepository
+from tests.conftest import make_book, make_user
+
+
+def test_rebuild_returns_the_number_of_summaries(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_a, book_b, book_c = await make_book(db, "A"), await make_book(db, "B"), await make_book(db, "C")
+        now = datetime.now()
+        await db.execute(insert(RatingModel), [
+            {"rating": rating, "review_date": now, "comment": "", "is_approved": approved,
+             "user_id": user_id, "book_id": book_id}
+            for book_id, rating, approved in [
+                (book_a, 5, True), (book_a, 3, True), (book_b, 4, True), (book_c, 1, False),
+            ]
+        ])
+        await db.commit()
+
+        repo = BookRatingSummaryRepository()
+        assert await repo.rebuild(db) == 2
+        summary = await repo.get(db, book_a)
+        assert (summary.rating_count, summary.rating_sum, summary.star_5, summary.star_3) == (2, 8, 1, 1)
+        assert await repo.get(db, book_c) is None
+
+    run_with_db(scenario)
@@ -0,0 +1,64 @@
+from sqlalchemy import insert
+
+from src.models.author_books_models import AuthorBookModel
+from src.models.author_models import AuthorModel
+from src.repository.book_repository import BookRepository
+from tests.conftest import make_book
+
+
+async def _books_with_authors(db, count):
+    """`count` books, each linked to its own primary author; returns {book_id: author_id}"""
+    authors = {}
+    for i in range(count):
+        book_id = await make_book(db, f"Book {i}")
+        authors[book_id] = (await db.execute(
+            insert(AuthorModel).values(first_name=f"First {i}", last_name=f"Last {i}", bio="")
+            .returning(AuthorModel.id)
+        )).scalar_one()
+        await db.execute(insert(AuthorBookModel).values(book_id=book_id, author_id=authors[book_id], primary_author=True))
+    await db.commit()
+    return authors
+
+
+def test_keyset_pages_carry_author_links(run_with_db):
+    async def scenario(db):
+        authors = await _books_with_authors(db, 3)
+        repo = BookRepository()
+
+        first, cursor = await repo.get_multi_keyset(db, limit=2)
+        second, last = await repo.get_multi_keyset(db, cursor=cursor, limit=2)
+
+        assert last is None
+        books = first + second
+        assert {book.id for book in books} == set(authors)
+        for book in books:
+            assert [(link.author_id, link.primary_author) for link in book.authors] == [(authors[book.id], True)]
+
+    run_with_db(scenario)
+
+
+def test_stream_all_loads_author_links_per_batch(run_with_db):
+    async def scenario(db):
+        authors = await _books_with_authors(db, 5)
+
+        books = [book async for book in BookRepository().stream_all(db, batch_size=2)]
+
+        assert {book.id for book in books} == set(authors)
+        assert all([link.author_id for link in book.authors] == [authors[book.id]] for book in books)
+
+    run_with_db(scenario)
+
+
+def test_get_returns_the_book_with_its_author_links(run_with_db):
+    async def scenario(db):
+        authors = await _books_with_authors(db, 2)
+        book_id = next(iter(authors))
+        repo = BookRepository()
+
+        book = await repo.get(db, book_id)
+        by_isbn = await repo.get_by_isbn(db, book.isbn)
+
+        assert [link.author_id for link in book.authors] == [authors[book_id]]
+        assert by_isbn.id == book_id and by_isbn.authors == book.authors
+
+    run_with_db(scenario)
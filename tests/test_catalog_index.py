@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.tasks import catalog_index as catalog_index_module
+from src.tasks.catalog_index import BOOK, CatalogIndex
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def partitions(self):
+        yield self._rows
+
+
+class _Session:
+    """Serves one batch of books then authors, running `during_load` between them"""
+
+    def __init__(self, books, during_load):
+        self._results = [books, []]
+        self._during_load = during_load
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def stream(self, statement):
+        rows = self._results.pop(0)
+        if not self._results:
+            self._during_load()
+        return _Rows(rows)
+
+
+def test_updates_made_during_a_build_survive_the_swap(monkeypatch):
+    index = CatalogIndex()
+    kept, deleted, added = uuid4(), uuid4(), uuid4()
+    snapshot = [
+        SimpleNamespace(id=kept, title="Dune", isbn=None),
+        SimpleNamespace(id=deleted, title="Dune Messiah", isbn=None),
+    ]
+
+    def during_load():
+        index.book_saved(added, "Dune Children", None)
+        index.removed(BOOK, deleted)
+
+    monkeypatch.setattr(catalog_index_module, "read_session_factory", lambda: _Session(snapshot, during_load))
+    asyncio.run(index.build())
+
+    assert {item_id for _, item_id, _ in index.suggest("dune")} == {str(kept), str(added)}
+    assert index._during_build is None
@@ -0,0 +1,16 @@
+import uuid
+
+from commands.init_database import copy_loader
+from src.utils.db_utils import Base
+
+
+def test_fk_to_a_table_outside_the_run_is_nulled_and_counted(monkeypatch):
+    monkeypatch.delitem(copy_loader.ID_MAPPINGS, "publisher", raising=False)
+    counter = copy_loader._Counter()
+    header = ["id", "title", "publisher_id"]
+
+    columns, build = copy_loader._compile_row_builder(Base.metadata.tables["books"], header, {}, counter)
+    row = dict(zip(columns, build(["1", "Dune", "7"], uuid.uuid4())))
+
+    assert row["title"] == "Dune" and row["publisher_id"] is None
+    assert counter.invalid_fk == 1
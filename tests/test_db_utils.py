@@ -0,0 +1,23 @@
+from sqlalchemy import text
+
+from src.repository.book_repository import BookRepository
+from src.utils import db_utils
+from tests.conftest import make_book
+
+
+def test_hot_lookups_are_prepared_server_side(run_with_db, monkeypatch):
+    monkeypatch.setattr(db_utils, "DB_PREPARED_STATEMENTS", True)
+
+    async def scenario(db):
+        book_id = await make_book(db)
+        await db.commit()
+        repo = BookRepository()
+
+        # Fewer executions than psycopg's own threshold, so only the hook can prepare them
+        assert (await repo.get(db, book_id)).id == book_id
+        assert (await repo.get(db, book_id)).id == book_id
+
+        prepared = (await db.execute(text("SELECT statement FROM pg_prepared_statements"))).scalars().all()
+        assert any("FROM books" in statement for statement in prepared)
+
+    run_with_db(scenario, db_utils.create_engine_with_pool)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.dto.loan_dto import LoanStatus, PhysicalLoanDTO
+from src.models.loan_models import LoanStatus as ModelLoanStatus
+from src.utils.dto_utils import model_to_dto
+
+
+def test_model_to_dto_maps_model_enums_onto_the_dto():
+    now = datetime.now()
+    loan = SimpleNamespace(
+        id=uuid4(), loan_date=now, due_date=now, status=ModelLoanStatus.OVERDUE,
+        user_id=uuid4(), book_id=uuid4(), return_date=None, created_at=now,
+    )
+
+    dto = model_to_dto(PhysicalLoanDTO, loan)
+
+    assert dto.status is LoanStatus.OVERDUE
+    assert dto.id == loan.id and dto.return_date is None
+    assert model_to_dto(PhysicalLoanDTO, None) is None
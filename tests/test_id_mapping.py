@@ -0,0 +1,27 @@
+import uuid
+
+from commands.init_database.id_mapping import UUIDMapping
+
+
+def test_dense_keys_share_the_buffer():
+    mapping = UUIDMapping(capacity=4, spill_bytes=None)
+    ids = {key: uuid.uuid4() for key in range(1, 5000)}
+    for key, value in ids.items():
+        mapping[key] = value
+
+    assert mapping.sparse == 0
+    assert len(mapping) == len(ids)
+    assert dict(mapping.items()) == ids
+
+
+def test_outlier_and_negative_keys_do_not_size_the_buffer():
+    mapping = UUIDMapping(capacity=4, spill_bytes=None)
+    far, negative, dense = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    mapping[1_000_000_000] = far
+    mapping[-7] = negative
+    mapping[1] = dense
+
+    assert mapping.nbytes() < 1024 * 1024
+    assert (mapping[1_000_000_000], mapping[-7], mapping[1]) == (far, negative, dense)
+    assert mapping.sparse == 2 and len(mapping) == 3
+    assert mapping.get(-8) is None and 999 not in mapping
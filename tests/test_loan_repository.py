@@ -0,0 +1,84 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select, update
+
+from src.dto.loan_dto import LoanStatus, PhysicalLoanDTO
+from src.models import BooksPhysicalModel, PhysicalLoansModel
+from src.models.relationship_models import BookStatus
+from src.repository.loan_repository import PhysicalLoanRepository
+from tests.conftest import make_book, make_user
+
+
+async def _checked_out_copy(db, user_id, book_id, barcode):
+    copy_id = (await db.execute(
+        insert(BooksPhysicalModel).values(
+            barcode=barcode, shelf_location="A1", status=BookStatus.CHECKOUT, book_id=book_id,
+        ).returning(BooksPhysicalModel.id)
+    )).scalar_one()
+    now = datetime.now()
+    loan_id = (await db.execute(
+        insert(PhysicalLoansModel).values(
+            loan_date=now, due_date=now + timedelta(days=14), status="CHECKOUT",
+            user_id=user_id, book_id=copy_id,
+        ).returning(PhysicalLoansModel.id)
+    )).scalar_one()
+    return copy_id, loan_id
+
+
+def test_bulk_return_loans_frees_copies_and_reports_missing(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_id = await make_book(db)
+        copy_a, loan_a = await _checked_out_copy(db, user_id, book_id, "BC-1")
+        copy_b, loan_b = await _checked_out_copy(db, user_id, book_id, "BC-2")
+        await db.commit()
+        missing = uuid.uuid4()
+
+        returned, not_found, not_returnable = await PhysicalLoanRepository().bulk_return_loans(
+            db, [loan_a, missing, loan_b]
+        )
+
+        assert not_found == [missing] and not_returnable == []
+        assert {loan.id for loan in returned} == {loan_a, loan_b}
+        assert all(isinstance(loan, PhysicalLoanDTO) for loan in returned)
+        assert all(loan.status == LoanStatus.RETURNED and loan.return_date for loan in returned)
+        statuses = (await db.execute(
+            select(BooksPhysicalModel.status).where(BooksPhysicalModel.id.in_([copy_a, copy_b]))
+        )).scalars().all()
+        assert statuses == [BookStatus.AVAILABLE, BookStatus.AVAILABLE]
+
+    run_with_db(scenario)
+
+
+def test_bulk_return_loans_skips_loans_that_are_not_out(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_id = await make_book(db)
+        copy_id, old_loan = await _checked_out_copy(db, user_id, book_id, "BC-1")
+        repo = PhysicalLoanRepository()
+        await db.commit()
+        (first,), _, _ = await repo.bulk_return_loans(db, [old_loan])
+        # The copy goes out again on a newer loan
+        now = datetime.now()
+        await db.execute(
+            update(BooksPhysicalModel).where(BooksPhysicalModel.id == copy_id).values(status=BookStatus.CHECKOUT)
+        )
+        await db.execute(insert(PhysicalLoansModel).values(
+            loan_date=now, due_date=now + timedelta(days=14), status="CHECKOUT", user_id=user_id, book_id=copy_id,
+        ))
+        await db.commit()
+
+        returned, not_found, not_returnable = await repo.bulk_return_loans(db, [old_loan])
+
+        assert (returned, not_found, not_returnable) == ([], [], [old_loan])
+        loan = (await db.execute(
+            select(PhysicalLoansModel.return_date).where(PhysicalLoansModel.id == old_loan)
+        )).scalar_one()
+        assert loan == first.return_date
+        copy_status = (await db.execute(
+            select(BooksPhysicalModel.status).where(BooksPhysicalModel.id == copy_id)
+        )).scalar_one()
+        assert copy_status == BookStatus.CHECKOUT
+
+    run_with_db(scenario)
@@ -0,0 +1,28 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.utils.pagination_utils import decode_cursor, encode_cursor
+
+
+def _cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trip():
+    created_at, obj_id = datetime(2024, 5, 1, 12, 30), uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, obj_id)) == (created_at, obj_id)
+
+
+@pytest.mark.parametrize("payload", [
+    {"c": "2024-05-01T12:30:00", "i": 12345},
+    {"c": 20240501, "i": str(uuid.uuid4())},
+    ["2024-05-01T12:30:00", str(uuid.uuid4())],
+    {"c": "2024-05-01T12:30:00"},
+])
+def test_malformed_cursor_payloads_raise_value_error(payload):
+    with pytest.raises(ValueError):
+        decode_cursor(_cursor(payload))
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from src.dto.reservation_dto import ReservationCreateDTO, ReservationStatus
+from src.models import ReservationModel
+from src.repository.reservation_repository import ReservationRepository
+from tests.conftest import make_book, make_user
+
+
+def _holds(user_id, book_ids, count):
+    now = datetime.now()
+    return [
+        ReservationCreateDTO(
+            reservation_date=now, expiration_date=now + timedelta(days=14),
+            user_id=user_id, book_id=book_ids[i % len(book_ids)],
+        )
+        for i in range(count)
+    ]
+
+
+def test_create_bulk_queued_continues_each_queue(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_a, book_b = await make_book(db, "A"), await make_book(db, "B")
+        now = datetime.now()
+        await db.execute(insert(ReservationModel).values(
+            reservation_date=now, expiration_date=now, status="PENDING", position=3,
+            user_id=user_id, book_id=book_a,
+        ))
+        await db.commit()
+
+        created = await ReservationRepository().create_bulk_queued(db, _holds(user_id, [book_a, book_b], 6))
+
+        assert [(r.book_id, r.position) for r in created] == [
+            (book_a, 4), (book_b, 1), (book_a, 5), (book_b, 2), (book_a, 6), (book_b, 3),
+        ]
+        assert all(r.status == ReservationStatus.PENDING for r in created)
+
+    run_with_db(scenario)
+
+
+def test_create_bulk_queued_thousands_of_holds(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_ids = [await make_book(db, f"Book {i}") for i in range(3)]
+        await db.commit()
+
+        created = await ReservationRepository().create_bulk_queued(db, _holds(user_id, book_ids, 6000))
+
+        assert len(created) == 6000
+        positions = defaultdict(list)
+        for reservation in created:
+            positions[reservation.book_id].append(reservation.position)
+        assert all(queue == list(range(1, 2001)) for queue in positions.values())
+        stored = await db.execute(select(func.count()).select_from(ReservationModel))
+        assert stored.scalar_one() == 6000
+
+    run_with_db(scenario)
+
+
+def test_create_without_position_joins_the_queue(run_with_db):
+    async def scenario(db):
+        user_id = await make_user(db)
+        book_id = await make_book(db)
+        await db.commit()
+        repo = ReservationRepository()
+
+        first = await repo.create(db, _holds(user_id, [book_id], 1)[0])
+        second = await repo.create(db, _holds(user_id, [book_id], 1)[0])
+
+        assert (first.position, second.position) == (1, 2)
+
+    run_with_db(scenario)
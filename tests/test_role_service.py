@@ -0,0 +1,51 @@
+import asyncio
+import uuid
+
+from src.dto.role_dto import RoleUpdateDTO
+from src.service.role_service import RoleService
+from src.utils.security_utils import token_cache
+
+
+class _Roles:
+    """Repository stand-in: a role with one member, writes reported as done"""
+
+    def __init__(self, member):
+        self.member = member
+
+    async def get_user_ids(self, db, role_id):
+        return [self.member]
+
+    async def update(self, db, *, id, obj_in):
+        return None
+
+    async def delete(self, db, *, id):
+        return True
+
+
+def _cache_principal(user_id) -> str:
+    token = f"token-{user_id}"
+    token_cache.put(token, {}, user_id, object())
+    return token
+
+
+def test_role_changes_drop_cached_principals_of_members_and_new_users():
+    member, added, outsider = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    tokens = {user_id: _cache_principal(user_id) for user_id in (member, added, outsider)}
+    service = RoleService()
+    service.repo = _Roles(member)
+
+    asyncio.run(service.update(None, uuid.uuid4(), RoleUpdateDTO(name="staff", user_ids=[added])))
+
+    assert token_cache.get(tokens[member]) is None
+    assert token_cache.get(tokens[added]) is None
+    assert token_cache.get(tokens[outsider]) is not None
+
+
+def test_role_delete_drops_cached_principals_of_members():
+    member = uuid.uuid4()
+    token = _cache_principal(member)
+    service = RoleService()
+    service.repo = _Roles(member)
+
+    assert asyncio.run(service.delete(None, uuid.uuid4()))
+    assert token_cache.get(token) is None
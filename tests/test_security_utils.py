@@ -0,0 +1,18 @@
+from src.utils import security_utils
+from src.utils.security_utils import UnknownIdentityCache
+
+
+def test_unknown_identity_is_rechecked_after_the_recheck_delay(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(security_utils.time, "time", lambda: now[0])
+    cache = UnknownIdentityCache(max_size=10, ttl=60, recheck=5)
+    cache.add("ghost")
+
+    assert cache.contains("ghost")
+    now[0] += 5
+    # Registered on another worker meanwhile: one attempt reaches the database...
+    assert not cache.contains("ghost")
+    # ...while the others keep hitting until the next recheck
+    assert cache.contains("ghost")
+    now[0] += 60
+    assert not cache.contains("ghost")